@@ -0,0 +1,192 @@
+"""규모별 성능 벤치마크.
+
+countriesMBTI_16types.csv 와 같은 스키마(Country + 16유형)의 합성 데이터를 10², 10⁴, 10⁶행으로 만들고
+CSV 파싱, 바이너리 컴파일/로드, 유형별 순위, 유사 국가 검색, 선호 지표 집계,
+pages/유형별분석.py 전체 재실행(Streamlit AppTest)의 시간과 메모리 최고치를 JSON으로 기록한다.
+
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --sizes 100 10000 --compare bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas  # noqa: E402,F401  첫 csv_parse 측정에 임포트 비용이 섞이지 않게
+
+from mbti import store  # noqa: E402
+from mbti.dichotomy import Margins  # noqa: E402
+from mbti.quality import clean  # noqa: E402
+from mbti.ranking import RankIndex  # noqa: E402
+from mbti.similarity import NeighbourIndex  # noqa: E402
+
+PAGE = ROOT / "pages" / "유형별분석.py"
+DEFAULT_SIZES = (100, 10_000, 1_000_000)
+
+
+def make_csv(path: Path, n_rows: int, seed: int = 0) -> None:
+    """실제 CSV와 같은 헤더·소수 표기(약 4자리, 행 합계가 1 근처)의 합성 데이터."""
+    rng = np.random.default_rng(seed)
+    base = np.array([0.0625] * len(store.TYPES))
+    chunk = 100_000
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("Country",) + store.TYPES)
+        for start in range(0, n_rows, chunk):
+            size = min(chunk, n_rows - start)
+            values = np.round(rng.dirichlet(base * 400, size=size), 4)
+            for i, row in enumerate(values.tolist(), start):
+                writer.writerow([f"Region{i:07d}"] + row)
+
+
+@contextmanager
+def measure(results: list[dict], size: int, stage: str, track_memory: bool):
+    gc.collect()
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    entry = {"rows": size, "stage": stage}
+    yield entry
+    entry["seconds"] = time.perf_counter() - start
+    if track_memory:
+        entry["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    entry.setdefault("repeat", 1)
+    entry["seconds"] /= entry["repeat"]
+    results.append(entry)
+    print(f"{size:>9,} {stage:<34} {entry['seconds'] * 1e3:10.3f} ms"
+          + (f" {entry['peak_bytes'] / 2**20:9.1f} MiB" if track_memory else ""))
+
+
+def repeat(entry: dict, n: int, func) -> None:
+    entry["repeat"] = n
+    for _ in range(n):
+        func()
+
+
+def run_page(csv_path: Path) -> None:
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["MBTI_CSV"] = str(csv_path)
+    try:
+        at = AppTest.from_file(str(PAGE), default_timeout=600).run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        at.selectbox[0].select(store.TYPES[-1]).run()
+    finally:
+        del os.environ["MBTI_CSV"]
+
+
+def bench_size(workdir: Path, size: int, args, results: list[dict]) -> None:
+    csv_path = workdir / f"synthetic_{size}.csv"
+    make_csv(csv_path, size, args.seed)
+    mem = not args.no_memory
+
+    with measure(results, size, "csv_parse", mem):
+        store.parse_csv(csv_path)
+    with measure(results, size, "binary_compile", mem):
+        store.compile_csv(csv_path)
+    store._loaded.pop(csv_path.resolve(), None)
+    with measure(results, size, "binary_load", mem):
+        dataset = store.load(csv_path)
+    with measure(results, size, "binary_load_warm", mem) as e:
+        repeat(e, 100, lambda: store.load(csv_path))
+
+    with measure(results, size, "quality_check", mem):
+        clean(dataset)
+    with measure(results, size, "ranking_build", mem):
+        ranks = RankIndex.build(dataset)
+    types = list(dataset.types)
+    with measure(results, size, "ranking_query", mem) as e:
+        repeat(e, 1000, lambda: [ranks.table(t, 10) for t in types[:1]])
+
+    with measure(results, size, "dichotomy_build", mem):
+        Margins.build(dataset)
+
+    for metric in args.metrics:
+        with measure(results, size, f"similarity_build:{metric}", mem):
+            index = NeighbourIndex.build(dataset, metric)
+        country = dataset.countries[size // 2]
+        with measure(results, size, f"similarity_query:{metric}", mem) as e:
+            repeat(e, 10, lambda: index.nearest(country, 10))
+
+    if size <= args.page_max_rows:
+        run_page(csv_path)  # 첫 실행의 임포트 비용은 제외
+        with measure(results, size, "page_rerun", mem):
+            run_page(csv_path)
+    csv_path.unlink()
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def compare(results: list[dict], baseline_path: Path) -> None:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["rows"], r["stage"]): r for r in json.load(f)["results"]}
+    print(f"\n{baseline_path} 대비")
+    for r in results:
+        old = baseline.get((r["rows"], r["stage"]))
+        if old:
+            ratio = r["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+            flag = "  ← 느려짐" if ratio > 1.2 else ""
+            print(f"{r['rows']:>9,} {r['stage']:<34} {ratio:6.2f}x{flag}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--metrics", nargs="+", default=["cosine", "euclidean", "jensenshannon"])
+    parser.add_argument("--page-max-rows", type=int, default=10_000, help="이 행 수 이하에서만 페이지 재실행을 잰다")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 메모리 추적을 끈다")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=ROOT / "bench_results.json")
+    parser.add_argument("--compare", type=Path, help="이전 결과 JSON과 비교")
+    args = parser.parse_args()
+
+    results: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            bench_size(Path(tmp), size, args, results)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n결과 저장: {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""정보교사 연구회 홈페이지 콘텐츠와 부가 서비스."""
@@ -0,0 +1,99 @@
+"""홈페이지 콘텐츠 (web/InfoTeachersHome.jsx 의 NAV, PROGRAMS, EVENTS, RESOURCES, TEAM 과 동일).
+
+표준 라이브러리만 사용하므로 첫 화면 렌더링 시 무거운 모듈을 불러오지 않는다.
+"""
+
+NAV = [
+    {"id": "about", "label": "연구회 소개"},
+    {"id": "programs", "label": "프로그램"},
+    {"id": "events", "label": "행사"},
+    {"id": "resources", "label": "자료실"},
+    {"id": "members", "label": "회원/네트워크"},
+    {"id": "join", "label": "가입"},
+    {"id": "contact", "label": "문의"},
+]
+
+MISSION = [
+    ("👥", "교사 학습공동체 강화", "공개수업·수업나눔·컨설팅으로 전문성의 선순환을 만듭니다."),
+    ("📖", "수업·평가 혁신", "프로젝트·탐구 중심 설계와 공정한 평가체계를 지원합니다."),
+    ("🌐", "지역·대학·기업 연계", "스마트시티·산학협력으로 학생의 진로 역량을 확장합니다."),
+]
+
+VALUES = [
+    ("현장성", "수업에 바로 쓰이는 실용 자료"),
+    ("개방성", "누구나 배우고 나누는 문화"),
+    ("공정성", "투명한 평가·검토 프로세스"),
+    ("지속가능성", "학생 성장 중심 운영"),
+]
+
+PROGRAMS = [
+    {
+        "icon": "💡",
+        "title": "AI·데이터 리터러시 연수",
+        "desc": "고교 정보과 교육과정(2022 개정) 정합의 프로젝트 기반 연수. 평가 루브릭/수행평가 설계 포함.",
+        "tag": "연수",
+    },
+    {
+        "icon": "📋",
+        "title": "수업 설계 워크숍",
+        "desc": "깊이있는 학습과 핵심아이디어 구조에 맞춘 수업·평가 통합 설계 워크숍.",
+        "tag": "워크숍",
+    },
+    {
+        "icon": "📖",
+        "title": "수업 공유 세미나",
+        "desc": "동료교사 공개수업·사례발표·피드백 라운드테이블 운영.",
+        "tag": "세미나",
+    },
+    {
+        "icon": "🌐",
+        "title": "스마트시티 프로젝트",
+        "desc": "지역사회 연계 캡스톤: IoT, GIS, 데이터 시각화, 시민성 프로젝트.",
+        "tag": "프로젝트",
+    },
+]
+
+EVENTS = [
+    {"date": "2025-10-18", "title": "가을 정기 세미나: 생성형 AI 수업사례 12선", "place": "온라인(ZOOM)", "link": "#"},
+    {"date": "2025-11-09", "title": "루브릭 마스터클래스(탐구·수행평가)", "place": "서울 교원연수원", "link": "#"},
+    {"date": "2025-12-06", "title": "연말 코드 페스티벌(학생 작품전)", "place": "파트너 고교", "link": "#"},
+]
+
+PAST_EVENTS = [
+    {"title": "2025 여름 공개수업 주간", "desc": "자료 및 영상 링크를 정리해 업로드합니다. 회원 전용 아카이브에서 확인하세요."},
+    {"title": "2025 봄 AI·데이터 심포지엄", "desc": "자료 및 영상 링크를 정리해 업로드합니다. 회원 전용 아카이브에서 확인하세요."},
+    {"title": "2024 겨울 루브릭 아카데미", "desc": "자료 및 영상 링크를 정리해 업로드합니다. 회원 전용 아카이브에서 확인하세요."},
+]
+
+RESOURCES = {
+    "templates": [
+        {"name": "배드민턴 탐구 루브릭(예시)", "file": "badminton_rubric_v1.xlsx"},
+        {"name": "AI·디지털 시민성 수업안", "file": "ai_digital_citizenship_lesson.md"},
+        {"name": "프로젝트 평가 체크리스트", "file": "project_checklist.pdf"},
+    ],
+    "code": [
+        {"name": "Folium 지도 예제", "repo": "https://github.com/example/folium-map"},
+        {"name": "Streamlit 대시보드 템플릿", "repo": "https://github.com/example/streamlit-dashboard"},
+        {"name": "Google Apps Script 자동화", "repo": "https://github.com/example/gas-automation"},
+    ],
+}
+
+TEAM = [
+    {"name": "대표: 김교사", "role": "정보·AI 교육", "links": {"github": "#", "linkedin": "#"}},
+    {"name": "간사: 이교사", "role": "평가·루브릭", "links": {"github": "#", "linkedin": "#"}},
+    {"name": "연구: 박교사", "role": "스마트시티·IoT", "links": {"github": "#", "linkedin": "#"}},
+    {"name": "홍보: 최교사", "role": "디자인·콘텐츠", "links": {"github": "#", "linkedin": "#"}},
+]
+
+JOIN_BENEFITS = [
+    "슬랙/디스코드 초대",
+    "월간 뉴스레터/행사 안내",
+    "공개수업 및 실습 워크숍 우선 초대",
+    "자료실 업로드 권한",
+]
+
+CONTACT = [
+    ("✉️", "이메일", "contact@infoteachers.org"),
+    ("📍", "주소", "서울특별시 ○○구 ○○로 123, 연구회 사무국"),
+    ("📞", "연락처", "02-000-0000 (평일 10:00~17:00)"),
+]
@@ -0,0 +1,345 @@
+"""자료실 파일 다운로드 서버.
+
+RESOURCES["templates"]에 등록된 파일만 내보낸다(디렉터리 순회 불가).
+
+- 본문은 loop.sendfile(os.sendfile)로 커널에서 바로 소켓에 복사한다(zero-copy).
+- 강한 ETag = 내용 SHA-256. If-None-Match는 304, Range/If-Range로 이어받기를 지원한다.
+- /files/<이름>.<해시>.<확장자> 는 내용이 바뀌면 URL도 바뀌므로 1년 immutable 캐시,
+  /files/<이름> 은 매번 재검증(no-cache).
+- 텍스트 형식은 gzip 사본을 미리 만들어 두고 Accept-Encoding에 따라 골라 보낸다.
+- 홈페이지의 다운로드 링크는 RESOURCES_URL(이 서버의 공개 주소 + /files)이 있을 때만 싣고,
+  없으면 "준비 중"으로 표시한다.
+
+    python -m homepage.downloads --port 8766
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
+
+from homepage.content import RESOURCES
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DIR = Path(os.environ.get("RESOURCES_DIR", Path(__file__).resolve().parent / "files"))
+GZIP_DIR = ROOT / ".data" / "downloads"
+# 방문자 브라우저에서 열리는 공개 주소(예: https://example.org/files). 없으면 홈페이지에 링크를 싣지 않는다
+BASE_URL = os.environ.get("RESOURCES_URL", "").rstrip("/")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8766
+TEXT_SUFFIXES = {".md", ".txt", ".csv", ".html", ".json", ".svg"}
+IMMUTABLE = "public, max-age=31536000, immutable"
+RESCAN_INTERVAL = 1.0  # 초
+MAX_HEADER_BYTES = 16 << 10
+
+RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@dataclass(frozen=True)
+class Variant:
+    path: Path
+    size: int
+    etag: str
+
+
+@dataclass(frozen=True)
+class Entry:
+    name: str
+    hashed_name: str
+    content_type: str
+    identity: Variant
+    gzip: Variant | None
+    stat: tuple[int, int]  # (size, mtime_ns) — 재해시 여부 판단용
+
+    @property
+    def path(self) -> str:
+        """다운로드 서버 기준 경로."""
+        return f"/files/{quote(self.hashed_name)}"
+
+    @property
+    def url(self) -> str | None:
+        """공개 다운로드 URL. RESOURCES_URL이 없으면 None."""
+        return f"{BASE_URL}/{quote(self.hashed_name)}" if BASE_URL else None
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _hashed_name(name: str, digest: str) -> str:
+    stem, dot, suffix = name.rpartition(".")
+    return f"{stem}.{digest[:12]}.{suffix}" if dot else f"{name}.{digest[:12]}"
+
+
+def _entry(path: Path, previous: Entry | None) -> Entry:
+    st = path.stat()
+    stat = (st.st_size, st.st_mtime_ns)
+    if previous is not None and previous.stat == stat:
+        return previous
+    digest = _sha256(path)
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if path.suffix in (".md", ".txt", ".csv"):
+        content_type += "; charset=utf-8"
+    gz = None
+    if path.suffix in TEXT_SUFFIXES:
+        gz_path = GZIP_DIR / f"{digest}.gz"
+        if not gz_path.exists():
+            GZIP_DIR.mkdir(parents=True, exist_ok=True)
+            # 같은 파일을 여러 스레드·프로세스가 동시에 만들 수 있으므로 임시 파일 이름은 쓰는 쪽마다 다르다
+            tmp = tempfile.NamedTemporaryFile(dir=GZIP_DIR, prefix=f".{digest}.", suffix=".tmp", delete=False)
+            try:
+                with tmp:
+                    # mtime=0: 같은 입력이면 같은 바이트 → ETag가 안정적
+                    tmp.write(gzip.compress(path.read_bytes(), 9, mtime=0))
+                os.replace(tmp.name, gz_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp.name)
+                except FileNotFoundError:
+                    pass
+                raise
+        gz_size = gz_path.stat().st_size
+        if gz_size < st.st_size:
+            gz = Variant(gz_path, gz_size, f'"{digest[:32]}-gz"')
+    return Entry(path.name, _hashed_name(path.name, digest), content_type,
+                 Variant(path, st.st_size, f'"{digest[:32]}"'), gz, stat)
+
+
+class Catalog:
+    """등록된 자료 파일의 해시·변형 목록. 파일이 바뀐 경우에만 다시 해시한다.
+
+    Streamlit 세션(스레드)들이 한 인스턴스를 함께 쓰므로 다시 훑기는 잠금 안에서 한 번만 한다.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_DIR, names: list[str] | None = None):
+        self.directory = Path(directory)
+        self.names = names if names is not None else [t["file"] for t in RESOURCES["templates"]]
+        self._entries: dict[str, Entry] = {}
+        self._routes: dict[str, tuple[Entry, bool]] = {}
+        self._checked = -RESCAN_INTERVAL
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        if time.monotonic() - self._checked < RESCAN_INTERVAL:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked < RESCAN_INTERVAL:
+                return  # 기다리는 동안 다른 스레드가 훑었다
+            self._rescan(now)
+
+    def _rescan(self, now: float) -> None:
+        entries = {}
+        for name in self.names:
+            path = self.directory / name
+            if path.is_file():
+                entries[name] = _entry(path, self._entries.get(name))
+        routes = {}
+        for e in entries.values():
+            routes[e.name] = (e, False)
+            routes[e.hashed_name] = (e, True)
+        self._entries, self._routes, self._checked = entries, routes, now
+
+    def get(self, name: str) -> Entry | None:
+        """파일 이름 → Entry (없으면 None)."""
+        self.refresh()
+        return self._entries.get(name)
+
+    def resolve(self, url_name: str) -> tuple[Entry, bool] | None:
+        """URL 경로의 이름 → (Entry, 해시 URL 여부)."""
+        self.refresh()
+        return self._routes.get(url_name)
+
+    def manifest(self) -> dict[str, str]:
+        self.refresh()
+        return {name: e.url or e.path for name, e in self._entries.items()}
+
+
+_catalog: Catalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def catalog() -> Catalog:
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = Catalog()
+    return _catalog
+
+
+# --- HTTP --------------------------------------------------------------------------
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None | bool:
+    """단일 bytes 범위 → (start, end 포함). 헤더 없음/다중 범위 → None, 만족 불가 → False."""
+    m = RANGE.match(header.strip())
+    if not m or not (m[1] or m[2]):
+        return None
+    if not m[1]:
+        length = int(m[2])
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(m[1])
+    end = min(int(m[2]), size - 1) if m[2] else size - 1
+    if start >= size or end < start:
+        return False
+    return start, end
+
+
+def _head(status: str, headers: list[tuple[str, str]], keep_alive: bool) -> bytes:
+    lines = [f"HTTP/1.1 {status}", *(f"{k}: {v}" for k, v in headers),
+             "Connection: keep-alive" if keep_alive else "Connection: close"]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+class Server:
+    def __init__(self, catalog: Catalog):
+        self.catalog = catalog
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                if headers.get("content-length", "0") != "0":
+                    keep_alive = False  # 본문 있는 요청은 받지 않는다
+
+                status, out, body, span = self.respond(method, unquote(urlsplit(target).path), headers)
+                writer.write(_head(status, out, keep_alive))
+                if isinstance(body, bytes):
+                    if method != "HEAD":
+                        writer.write(body)
+                    await writer.drain()
+                elif body is not None and method == "GET":
+                    await writer.drain()
+                    start, end = span
+                    with open(body.path, "rb") as f:
+                        await loop.sendfile(writer.transport, f, start, end - start + 1)
+                else:
+                    await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def respond(self, method: str, path: str, headers: dict):
+        """→ (상태줄, 헤더 목록, 본문 bytes·보낼 Variant·None, 파일 범위 (start, end))."""
+        if path == "/manifest.json":
+            body = json.dumps(self.catalog.manifest(), ensure_ascii=False).encode()
+            return self._small("200 OK", body, "application/json; charset=utf-8")
+        if method not in ("GET", "HEAD"):
+            return self._small("405 Method Not Allowed", b"", "text/plain", [("Allow", "GET, HEAD")])
+        prefix, _, name = path.rpartition("/")
+        found = self.catalog.resolve(name) if prefix == "/files" else None
+        if found is None:
+            return self._small("404 Not Found", b"not found\n", "text/plain")
+        entry, hashed = found
+
+        variant = entry.identity
+        range_header = headers.get("range")
+        if range_header and headers.get("if-range", variant.etag) != variant.etag:
+            range_header = None  # 파일이 바뀌었으면 전체를 다시 보낸다
+        if entry.gzip is not None and not range_header and "gzip" in headers.get("accept-encoding", ""):
+            variant = entry.gzip
+
+        out = [
+            ("Content-Type", entry.content_type),
+            ("ETag", variant.etag),
+            ("Cache-Control", IMMUTABLE if hashed else "no-cache"),
+            ("Accept-Ranges", "bytes"),
+            ("Content-Disposition", f"attachment; filename*=UTF-8''{quote(entry.name)}"),
+            ("Access-Control-Allow-Origin", "*"),
+        ]
+        if entry.gzip is not None:
+            out.append(("Vary", "Accept-Encoding"))
+        if variant is entry.gzip:
+            out.append(("Content-Encoding", "gzip"))
+
+        inm = headers.get("if-none-match")
+        if inm and (inm.strip() == "*" or variant.etag in (t.strip() for t in inm.split(","))):
+            return "304 Not Modified", out, None, None
+
+        span = parse_range(range_header, variant.size) if range_header else None
+        if span is False:
+            out.append(("Content-Range", f"bytes */{variant.size}"))
+            out.append(("Content-Length", "0"))
+            return "416 Range Not Satisfiable", out, None, None
+        if span is None:
+            span, status = (0, variant.size - 1), "200 OK"
+        else:
+            status = "206 Partial Content"
+            out.append(("Content-Range", f"bytes {span[0]}-{span[1]}/{variant.size}"))
+        out.append(("Content-Length", str(span[1] - span[0] + 1)))
+        if variant.size == 0:
+            return status, out, None, None
+        return status, out, variant, span
+
+    @staticmethod
+    def _small(status: str, body: bytes, content_type: str, extra=()):
+        out = [("Content-Type", content_type), ("Content-Length", str(len(body))),
+               ("Cache-Control", "no-cache"), ("Access-Control-Allow-Origin", "*"), *extra]
+        return status, out, body, None
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, directory: Path = DEFAULT_DIR) -> asyncio.AbstractServer:
+    app = Server(Catalog(directory))
+    app.catalog.refresh()  # 첫 요청 전에 해시·gzip 사본을 만든다
+    return await asyncio.start_server(app.handle, host, port, limit=MAX_HEADER_BYTES)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="자료실 파일 다운로드 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--dir", type=Path, default=DEFAULT_DIR)
+    args = parser.parse_args()
+
+    async def run() -> None:
+        server = await serve(args.host, args.port, args.dir)
+        for name, url in Catalog(args.dir).manifest().items():
+            print(f"{name}: {url}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""사이트 검색: 한글 음절 바이그램 + 라틴 단어 역색인.
+
+- 토큰: 한글은 음절 2-gram(한 글자 단어는 그대로), 영문·숫자는 소문자 단어.
+  조사·띄어쓰기 차이에 강하고, 음절 하나를 틀려도 나머지 바이그램으로 찾아진다.
+- 마지막 질의어는 접두어로 확장하고(입력 중 검색), 못 찾은 영문 단어는 편집 거리
+  1~2의 색인어로 대체한다(오타 허용). 확장어는 가중치를 낮춘다.
+- 순위는 BM25(제목 가중 2배) × 질의어 포괄률.
+- 색인 = 디스크 기본 세그먼트(정렬된 색인어, 문서 번호·빈도 배열) + 메모리 추가분.
+  add()는 문서 하나만 토큰화해 추가분에 넣고, save()가 둘을 합쳐 원자적으로 다시 쓴다.
+
+    python -m homepage.search "루브릭 평가"
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+import unicodedata
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from homepage.content import EVENTS, PAST_EVENTS, PROGRAMS, RESOURCES, TEAM
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_INDEX = ROOT / ".data" / "search.idx"
+MAGIC = b"KSI1"
+TITLE_WEIGHT = 2
+K1, B = 1.2, 0.75
+PREFIX_WEIGHT = 0.8
+TYPO_WEIGHT = 0.6
+MAX_EXPANSIONS = 50
+
+TOKEN = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+
+def tokens(text: str) -> list[str]:
+    out = []
+    for run in TOKEN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if run[0] < "가" or len(run) == 1:
+            out.append(run)
+        else:
+            out.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return out
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """레벤슈타인 거리(limit 초과면 limit + 1)."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+
+@dataclass(frozen=True)
+class Doc:
+    key: str  # 고유 키 (같은 키로 add하면 교체)
+    kind: str
+    title: str
+    body: str = ""
+    anchor: str = ""  # 홈페이지 섹션 id
+
+
+@dataclass(frozen=True)
+class Hit:
+    doc: Doc
+    score: float
+
+
+def documents() -> list[Doc]:
+    """homepage.content 전체를 검색 문서로."""
+    docs = [Doc(f"program:{p['title']}", "프로그램", p["title"], f"{p['tag']} {p['desc']}", "programs") for p in PROGRAMS]
+    docs += [Doc(f"event:{e['date']}:{e['title']}", "행사", e["title"], f"{e['date']} {e['place']}", "events") for e in EVENTS]
+    docs += [Doc(f"past:{e['title']}", "지난 행사", e["title"], e["desc"], "events") for e in PAST_EVENTS]
+    docs += [Doc(f"template:{t['file']}", "자료", t["name"], t["file"], "resources") for t in RESOURCES["templates"]]
+    docs += [Doc(f"code:{c['repo']}", "코드", c["name"], c["repo"], "resources") for c in RESOURCES["code"]]
+    docs += [Doc(f"team:{m['name']}", "회원", m["name"], m["role"], "members") for m in TEAM]
+    return docs
+
+
+def fingerprint(docs: list[Doc]) -> str:
+    h = hashlib.sha256()
+    for d in docs:
+        h.update(json.dumps([d.key, d.kind, d.title, d.body, d.anchor], ensure_ascii=False).encode())
+    return h.hexdigest()
+
+
+class SearchIndex:
+    def __init__(self):
+        self.docs: list[Doc] = []
+        self.lengths = array("I")
+        self.deleted: set[int] = set()
+        self.by_key: dict[str, int] = {}
+        self.fingerprint = ""
+        # 기본 세그먼트: terms[i]의 포스팅 = ids/tfs[offsets[i]:offsets[i+1]]
+        self.terms: list[str] = []
+        self.term_ids: dict[str, int] = {}
+        self.offsets = array("I", [0])
+        self.ids = array("H")
+        self.tfs = array("B")
+        # 메모리 추가분 (save 전까지)
+        self.extra: dict[str, list[tuple[int, int]]] = {}
+        self.sorted_terms: list[str] = []  # 기본 + 추가분 색인어 (접두어·오타 탐색용)
+        self._total_length = 0
+
+    # --- 구축 -----------------------------------------------------------------
+
+    @classmethod
+    def build(cls, docs: list[Doc]) -> "SearchIndex":
+        index = cls()
+        for doc in docs:
+            index.add(doc)
+        index.fingerprint = fingerprint(docs)
+        index.compact()
+        return index
+
+    def add(self, doc: Doc) -> None:
+        """문서 하나를 추가(같은 key가 있으면 교체). 다른 문서는 다시 색인하지 않는다."""
+        old = self.by_key.get(doc.key)
+        if old is not None:
+            self.deleted.add(old)
+            self._total_length -= self.lengths[old]
+        n = len(self.docs)
+        self.docs.append(doc)
+        self.by_key[doc.key] = n
+        counts = Counter(tokens(doc.body))
+        for t in tokens(doc.title):
+            counts[t] += TITLE_WEIGHT
+        length = sum(counts.values())
+        self.lengths.append(length)
+        self._total_length += length
+        for term, tf in counts.items():
+            postings = self.extra.get(term)
+            if postings is None:
+                postings = self.extra[term] = []
+                if term not in self.term_ids:
+                    bisect.insort(self.sorted_terms, term)
+            postings.append((n, min(tf, 0xFF)))  # BM25는 tf가 커지면 포화하므로 1바이트로 충분
+
+    def compact(self) -> None:
+        """삭제 문서를 빼고 추가분을 기본 세그먼트로 합친다(문서 번호 재배정)."""
+        live = [i for i in range(len(self.docs)) if i not in self.deleted]
+        remap = {old: new for new, old in enumerate(live)}
+        terms, offsets, tfs = [], array("I", [0]), array("B")
+        ids = array("H" if len(live) <= 0xFFFF else "I")
+        for term in sorted(self.term_ids.keys() | self.extra.keys()):
+            for doc, tf in self.postings(term):
+                if doc in remap:
+                    ids.append(remap[doc])
+                    tfs.append(tf)
+            if len(ids) > offsets[-1]:  # 삭제 문서에만 있던 색인어는 버린다
+                terms.append(term)
+                offsets.append(len(ids))
+        self._install([self.docs[i] for i in live], array("I", (self.lengths[i] for i in live)),
+                      terms, offsets, ids, tfs)
+
+    def _install(self, docs, lengths, terms, offsets, ids, tfs) -> None:
+        self.docs, self.lengths, self.deleted = docs, lengths, set()
+        self.by_key = {d.key: i for i, d in enumerate(docs)}
+        self.terms, self.term_ids = terms, {t: i for i, t in enumerate(terms)}
+        self.offsets, self.ids, self.tfs = offsets, ids, tfs
+        self.extra = {}
+        self.sorted_terms = list(terms)
+        self._total_length = sum(lengths)
+
+    # --- 저장 -----------------------------------------------------------------
+    # MAGIC | u32 헤더 길이 | JSON 헤더(문서·색인어) | offsets u32 | ids u16/u32 | tfs u8 (리틀 엔디언)
+
+    def save(self, path: Path = DEFAULT_INDEX) -> None:
+        self.compact()
+        header = json.dumps({
+            "fingerprint": self.fingerprint,
+            "docs": [[d.key, d.kind, d.title, d.body, d.anchor] for d in self.docs],
+            "lengths": self.lengths.tolist(),
+            "terms": self.terms,
+            "ids": self.ids.typecode,
+        }, ensure_ascii=False, separators=(",", ":")).encode()
+        arrays = [self.offsets, self.ids, self.tfs]
+        if sys.byteorder != "little":
+            arrays = [array(a.typecode, a) for a in arrays]
+            for a in arrays:
+                a.byteswap()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 세션 스레드마다 다른 임시 파일에 쓰고 바꿔 끼운다(같은 이름이면 서로의 파일을 덮는다)
+        tmp = tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+        try:
+            with tmp as f:
+                f.write(MAGIC + struct.pack("<I", len(header)) + header)
+                for a in arrays:
+                    a.tofile(f)
+            os.replace(tmp.name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except FileNotFoundError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_INDEX) -> "SearchIndex":
+        data = Path(path).read_bytes()
+        if data[:4] != MAGIC:
+            raise ValueError(f"검색 색인 파일이 아닙니다: {path}")
+        (n,) = struct.unpack_from("<I", data, 4)
+        header = json.loads(data[8:8 + n])
+        pos = 8 + n
+        arrays = []
+        n_terms = len(header["terms"])
+        for typecode, count in (("I", n_terms + 1), (header["ids"], None), ("B", None)):
+            a = array(typecode)
+            if count is None:
+                count = arrays[0][-1]
+            a.frombytes(data[pos:pos + count * a.itemsize])
+            if sys.byteorder != "little":
+                a.byteswap()
+            pos += count * a.itemsize
+            arrays.append(a)
+        index = cls()
+        index._install([Doc(*d) for d in header["docs"]], array("I", header["lengths"]), header["terms"], *arrays)
+        index.fingerprint = header["fingerprint"]
+        return index
+
+    # --- 질의 -----------------------------------------------------------------
+
+    def postings(self, term: str) -> list[tuple[int, int]]:
+        out = []
+        i = self.term_ids.get(term)
+        if i is not None:
+            a, b = self.offsets[i], self.offsets[i + 1]
+            out = list(zip(self.ids[a:b], self.tfs[a:b]))
+        return out + self.extra.get(term, [])
+
+    def _prefixed(self, prefix: str) -> list[str]:
+        i = bisect.bisect_left(self.sorted_terms, prefix)
+        out = []
+        while i < len(self.sorted_terms) and self.sorted_terms[i].startswith(prefix) and len(out) < MAX_EXPANSIONS:
+            out.append(self.sorted_terms[i])
+            i += 1
+        return out
+
+    def _known(self, term: str) -> bool:
+        return term in self.term_ids or term in self.extra
+
+    def _similar(self, term: str) -> list[str]:
+        """오타 후보: 첫 글자가 같고 편집 거리 1(8자 이상은 2) 이내인 영문 색인어."""
+        limit = 1 if len(term) < 8 else 2
+        lo = bisect.bisect_left(self.sorted_terms, term[0])
+        hi = bisect.bisect_left(self.sorted_terms, chr(ord(term[0]) + 1))
+        return [t for t in self.sorted_terms[lo:hi] if edit_distance(term, t, limit) <= limit]
+
+    def expand(self, query: str) -> list[dict[str, float]]:
+        """질의어별 {색인어: 가중치}. 마지막 어절은 접두어, 모르는 영문 단어는 오타 후보로 확장."""
+        words = query.split()
+        groups = []
+        for w, word in enumerate(words):
+            word_tokens = tokens(word)
+            last = w == len(words) - 1 and not query.endswith(" ")
+            for t_i, term in enumerate(word_tokens):
+                group = {term: 1.0} if self._known(term) else {}
+                if last and t_i == len(word_tokens) - 1:
+                    for t in self._prefixed(term):
+                        group.setdefault(t, PREFIX_WEIGHT)
+                if not group and term[0] < "가" and len(term) >= 4:
+                    group = {t: TYPO_WEIGHT for t in self._similar(term)}
+                groups.append(group)
+        return groups
+
+    def search(self, query: str, limit: int = 10) -> list[Hit]:
+        groups = self.expand(query)
+        if not groups:
+            return []
+        n_docs = len(self.docs) - len(self.deleted)
+        avg = self._total_length / max(n_docs, 1)
+        norms = [K1 * (1 - B + B * n / avg) for n in self.lengths]
+        scores: dict[int, float] = {}
+        matched: Counter[int] = Counter()
+        for group in groups:
+            best: dict[int, float] = {}
+            for term, weight in group.items():
+                postings = self.postings(term)
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc, tf in postings:
+                    s = weight * idf * tf * (K1 + 1) / (tf + norms[doc])
+                    if s > best.get(doc, 0.0):
+                        best[doc] = s
+            for doc, s in best.items():
+                scores[doc] = scores.get(doc, 0.0) + s
+                matched[doc] += 1
+        ranked = heapq.nlargest(
+            limit,
+            ((s * matched[d] / len(groups), d) for d, s in scores.items() if d not in self.deleted),
+        )
+        return [Hit(self.docs[d], s) for s, d in ranked]
+
+
+_index: SearchIndex | None = None
+_index_lock = threading.Lock()
+
+
+def index(path: Path = DEFAULT_INDEX) -> SearchIndex:
+    """사이트 콘텐츠 색인. 디스크 색인이 현재 콘텐츠와 같으면 그대로 읽고, 아니면 다시 만든다."""
+    global _index
+    if _index is None:
+        with _index_lock:  # 첫 검색이 여러 세션에서 동시에 와도 한 번만 읽거나 만든다
+            if _index is None:
+                docs = documents()
+                try:
+                    loaded = SearchIndex.load(path)
+                except (OSError, ValueError):
+                    loaded = None
+                if loaded is None or loaded.fingerprint != fingerprint(docs):
+                    loaded = SearchIndex.build(docs)
+                    loaded.save(path)
+                _index = loaded
+    return _index
+
+
+if __name__ == "__main__":
+    for hit in index().search(" ".join(sys.argv[1:])):
+        print(f"{hit.score:6.2f}  [{hit.doc.kind}] {hit.doc.title}")
@@ -0,0 +1,195 @@
+"""가입 신청 저장소: 메모리 큐 + 배치 쓰기(write-behind) SQLite.
+
+폼 제출은 검증 후 큐에 넣고 바로 돌아온다(디스크 I/O 없음). 백그라운드 스레드가
+큐를 모아 한 트랜잭션으로 기록하므로, 행사 공지 직후 신청이 몰려도 제출 지연은 일정하다.
+
+- 같은 이메일은 한 행으로 합쳐진다(최신 제출 내용으로 갱신, 최초 신청 시각 유지).
+- 같은 멱등 키의 재전송(더블 클릭, 재시도)은 한 번만 반영된다.
+- DB는 WAL 모드라 기록 중에도 읽기가 막히지 않는다.
+
+표준 라이브러리만 사용한다(첫 화면 main.py에서 불러옴).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB = Path(os.environ.get("SIGNUPS_DB", ROOT / ".data" / "signups.sqlite3"))
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.2  # 초. 큐가 덜 찼어도 이 간격마다 기록
+MAX_PENDING = 10_000
+RETRY_DELAY = (0.1, 30.0)  # 초. 기록 실패 시 재시도 간격(처음, 최대) — 두 배씩 늘린다
+RECENT_KEYS = 4096
+
+EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signups (
+    email        TEXT PRIMARY KEY,
+    name         TEXT NOT NULL,
+    affiliation  TEXT NOT NULL DEFAULT '',
+    interests    TEXT NOT NULL DEFAULT '',
+    intro        TEXT NOT NULL DEFAULT '',
+    created_at   REAL NOT NULL,
+    updated_at   REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key          TEXT PRIMARY KEY,
+    email        TEXT NOT NULL,
+    created_at   REAL NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT INTO signups (email, name, affiliation, interests, intro, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(email) DO UPDATE SET
+    name = excluded.name, affiliation = excluded.affiliation, interests = excluded.interests,
+    intro = excluded.intro, updated_at = excluded.updated_at
+"""
+
+
+log = logging.getLogger(__name__)
+
+
+class QueueFull(RuntimeError):
+    """대기 중인 신청이 MAX_PENDING을 넘었다(기록기가 따라가지 못함)."""
+
+
+@dataclass(frozen=True)
+class Signup:
+    name: str
+    email: str
+    affiliation: str = ""
+    interests: str = ""
+    intro: str = ""
+    idempotency_key: str = ""
+    submitted_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_form(cls, name: str, email: str, affiliation: str = "", interests: str = "", intro: str = "",
+                  idempotency_key: str = "") -> "Signup":
+        name, email = name.strip(), email.strip().lower()
+        if not name:
+            raise ValueError("이름을 입력해 주세요")
+        if not EMAIL.match(email):
+            raise ValueError(f"이메일 형식이 올바르지 않습니다: {email or '(빈 값)'}")
+        return cls(name, email, affiliation.strip(), interests.strip(), intro.strip(), idempotency_key)
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class SignupQueue:
+    def __init__(self, path: Path = DEFAULT_DB):
+        self.path = Path(path)
+        self._queue: queue.Queue[Signup] = queue.Queue(MAX_PENDING)
+        self._recent: dict[str, None] = {}  # 최근 멱등 키(삽입 순서 = 오래된 순)
+        self._lock = threading.Lock()
+        self._flushed = threading.Condition(self._lock)  # _pending은 이 잠금 하나로만 바꾼다
+        self._pending = 0
+        self._conn = connect(self.path)
+        self._thread = threading.Thread(target=self._run, name="signup-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, signup: Signup) -> bool:
+        """신청을 큐에 넣는다. 이미 받은 멱등 키면 False(중복), 아니면 True."""
+        key = signup.idempotency_key
+        with self._lock:
+            if key and key in self._recent:
+                return False
+            try:
+                self._queue.put_nowait(signup)
+            except queue.Full:
+                raise QueueFull("신청이 몰려 잠시 후 다시 시도해 주세요") from None
+            self._pending += 1
+            if key:
+                self._recent[key] = None
+                if len(self._recent) > RECENT_KEYS:
+                    del self._recent[next(iter(self._recent))]
+        return True
+
+    def _drain(self) -> list[Signup]:
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=FLUSH_INTERVAL))
+            while len(batch) < BATCH_SIZE:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _write(self, batch: list[Signup]) -> None:
+        rows = []
+        with self._conn:
+            for s in batch:
+                if s.idempotency_key:
+                    cur = self._conn.execute(
+                        "INSERT OR IGNORE INTO idempotency_keys VALUES (?, ?, ?)",
+                        (s.idempotency_key, s.email, s.submitted_at),
+                    )
+                    if cur.rowcount == 0:
+                        continue  # 이전 배치(또는 이전 프로세스)에서 이미 반영됨
+                rows.append((s.email, s.name, s.affiliation, s.interests, s.intro, s.submitted_at, s.submitted_at))
+            self._conn.executemany(UPSERT, rows)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain()
+            delay = RETRY_DELAY[0]
+            while batch:
+                try:
+                    self._write(batch)
+                    break
+                except Exception:
+                    # 트랜잭션은 롤백됐으므로 같은 배치를 그대로 다시 쓴다(잠긴 DB, 디스크 부족 등)
+                    log.exception("가입 신청 %d건 기록 실패, %.1f초 후 재시도", len(batch), delay)
+                    time.sleep(delay)
+                    delay = min(delay * 2, RETRY_DELAY[1])
+            with self._flushed:
+                self._pending -= len(batch)
+                self._flushed.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """대기 중인 신청이 모두 기록될 때까지 기다린다."""
+        with self._flushed:
+            return self._flushed.wait_for(lambda: self._pending <= 0, timeout)
+
+    def count(self) -> int:
+        with connect(self.path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM signups").fetchone()[0]
+
+
+_queues: dict[Path, SignupQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def signup_queue(path: Path = DEFAULT_DB) -> SignupQueue:
+    """DB 경로별 프로세스 공용 큐(Streamlit 세션 간 공유)."""
+    path = Path(path).resolve()
+    with _queues_lock:
+        if path not in _queues:
+            _queues[path] = SignupQueue(path)
+        return _queues[path]
+
+
+@atexit.register
+def _flush_all() -> None:
+    for q in list(_queues.values()):
+        q.flush(timeout=5)
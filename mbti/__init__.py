@@ -0,0 +1,5 @@
+"""MBTI 16유형 국가별 데이터 분석 모듈."""
+
+from mbti.store import TYPES, Dataset, load
+
+__all__ = ["TYPES", "Dataset", "load"]
@@ -0,0 +1,368 @@
+"""MBTI 데이터셋 JSON 질의 API (asyncio 기반 로컬 HTTP 서버).
+
+홈페이지와 파트너 사이트에 통계를 임베드하기 위한 읽기 전용 API다. 표준 라이브러리의
+asyncio 스트림 위에 최소한의 HTTP/1.1(keep-alive)을 구현했다.
+
+    GET  /v1/meta
+    GET  /v1/types/{TYPE}/top?k=10&order=desc
+    GET  /v1/countries/{국가}
+    GET  /v1/countries/{국가}/margins
+    GET  /v1/countries/{국가}/similar?k=5&metric=cosine
+    POST /v1/batch   {"queries": [{"op": "top", "type": "INFJ", "k": 5}, ...]}
+
+응답은 데이터 버전별 메모리 캐시(LRU)에 gzip 본문까지 함께 저장하고, ETag는
+(데이터 버전, 요청) 해시라서 If-None-Match가 맞으면 본문 없이 304를 돌려준다.
+
+    python -m mbti.api --port 8765
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from mbti import store
+from mbti.dichotomy import margins
+from mbti.ranking import rank_index
+from mbti.similarity import METRICS, similar
+from mbti.store import Dataset
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+CACHE_ENTRIES = 4096
+GZIP_MIN_BYTES = 512
+MAX_HEADER_BYTES = 16 << 10
+MAX_BODY_BYTES = 1 << 20
+MAX_BATCH = 100
+MAX_K = 1000
+RELOAD_INTERVAL = 1.0  # 초. CSV 변경 확인 주기
+
+
+log = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _int_param(params: dict, name: str, default: int) -> int:
+    try:
+        value = int(params.get(name, default))
+    except (TypeError, ValueError):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name}는 정수여야 합니다") from None
+    if not 1 <= value <= MAX_K:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name}는 1 이상 {MAX_K} 이하여야 합니다")
+    return value
+
+
+def _country(dataset: Dataset, name: str) -> str:
+    try:
+        dataset.row(name)
+    except KeyError:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"알 수 없는 국가: {name}") from None
+    return name
+
+
+# --- 질의 --------------------------------------------------------------------------
+
+
+def query_meta(dataset: Dataset, params: dict) -> dict:
+    return {"version": dataset.version, "countries": len(dataset), "types": list(dataset.types)}
+
+
+def query_top(dataset: Dataset, params: dict) -> dict:
+    mbti_type = str(params.get("type", "")).upper()
+    if mbti_type not in dataset.types:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"알 수 없는 유형: {mbti_type}")
+    order = params.get("order", "desc")
+    if order not in ("asc", "desc"):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "order는 asc 또는 desc여야 합니다")
+    k = _int_param(params, "k", 10)
+    rows = rank_index(dataset).table(mbti_type, k, ascending=order == "asc")
+    return {"type": mbti_type, "order": order, "items": [{"rank": r, "country": c, "share": s} for r, c, s in rows]}
+
+
+def query_country(dataset: Dataset, params: dict) -> dict:
+    country = _country(dataset, str(params.get("country", "")))
+    ranks = rank_index(dataset)
+    row = dataset.row(country)
+    return {
+        "country": country,
+        "shares": {t: float(ranks.values[row, i]) for i, t in enumerate(dataset.types)},
+        "ranks": {t: ranks.rank_of(country, t) for t in dataset.types},
+        "margins": margins(dataset).profile(country),
+    }
+
+
+def query_margins(dataset: Dataset, params: dict) -> dict:
+    country = _country(dataset, str(params.get("country", "")))
+    return {"country": country, "margins": margins(dataset).profile(country)}
+
+
+def query_similar(dataset: Dataset, params: dict) -> dict:
+    country = _country(dataset, str(params.get("country", "")))
+    metric = params.get("metric", "cosine")
+    if metric not in METRICS:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"metric은 {', '.join(METRICS)} 중 하나여야 합니다")
+    k = _int_param(params, "k", 5)
+    items = similar(dataset, country, k, metric)
+    return {"country": country, "metric": metric, "items": [{"country": c, "distance": d} for c, d in items]}
+
+
+QUERIES = {
+    "meta": query_meta,
+    "top": query_top,
+    "country": query_country,
+    "margins": query_margins,
+    "similar": query_similar,
+}
+
+
+def query_batch(dataset: Dataset, body: bytes) -> dict:
+    try:
+        queries = json.loads(body or b"null")["queries"]
+    except (ValueError, TypeError, KeyError):
+        raise ApiError(HTTPStatus.BAD_REQUEST, '본문은 {"queries": [...]} 형식의 JSON이어야 합니다') from None
+    if not isinstance(queries, list) or len(queries) > MAX_BATCH:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"queries는 최대 {MAX_BATCH}개의 목록이어야 합니다")
+    results = []
+    for q in queries:
+        op = q.get("op") if isinstance(q, dict) else None
+        handler = QUERIES.get(op) if isinstance(op, str) else None
+        if handler is None:
+            results.append({"status": 400, "error": f"알 수 없는 op: {op}"})
+            continue
+        try:
+            results.append({"status": 200, "data": handler(dataset, q)})
+        except ApiError as e:
+            results.append({"status": e.status.value, "error": str(e)})
+    return {"results": results}
+
+
+def route(dataset: Dataset, method: str, path: str, params: dict, body: bytes) -> dict:
+    parts = [unquote(p) for p in path.strip("/").split("/")]
+    if parts[:1] != ["v1"]:
+        raise ApiError(HTTPStatus.NOT_FOUND, "경로를 찾을 수 없습니다")
+    parts = parts[1:]
+    if parts == ["batch"]:
+        if method != "POST":
+            raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, "POST만 허용됩니다")
+        return query_batch(dataset, body)
+    if method not in ("GET", "HEAD"):
+        raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, "GET만 허용됩니다")
+    if parts == ["meta"]:
+        return query_meta(dataset, params)
+    if len(parts) == 3 and parts[0] == "types" and parts[2] == "top":
+        return query_top(dataset, {**params, "type": parts[1]})
+    if len(parts) >= 2 and parts[0] == "countries":
+        params = {**params, "country": parts[1]}
+        if len(parts) == 2:
+            return query_country(dataset, params)
+        if parts[2:] == ["margins"]:
+            return query_margins(dataset, params)
+        if parts[2:] == ["similar"]:
+            return query_similar(dataset, params)
+    raise ApiError(HTTPStatus.NOT_FOUND, "경로를 찾을 수 없습니다")
+
+
+# --- HTTP --------------------------------------------------------------------------
+
+
+class Response:
+    """직렬화된 응답. gzip 본문은 표현이 다르므로 ETag도 따로 둔다(-gz 접미사)."""
+
+    __slots__ = ("status", "body", "gzipped", "etag", "gzip_etag")
+
+    def __init__(self, status: int, payload: dict, etag: str | None):
+        self.status = status
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+        self.gzipped = gzip.compress(self.body, 6) if len(self.body) >= GZIP_MIN_BYTES else None
+        self.etag = etag
+        self.gzip_etag = f'{etag[:-1]}-gz"' if etag and self.gzipped is not None else None
+
+
+class Server:
+    def __init__(self, csv_path=store.DEFAULT_CSV, cache_entries: int = CACHE_ENTRIES):
+        self.csv_path = csv_path
+        self.cache_entries = cache_entries
+        self._cache: OrderedDict[tuple, Response] = OrderedDict()
+        self._dataset: Dataset | None = None
+        self._checked = 0.0
+        self._reloading: asyncio.Future | None = None
+
+    async def dataset(self) -> Dataset:
+        """현재 판. CSV 확인과 재컴파일·파생 테이블 이어받기는 실행기 스레드에서 하므로 이벤트 루프를
+        막지 않고, 새 판이 준비되기 전까지의 요청에는 직전 판으로 답한다."""
+        if self._reloading is None and (self._dataset is None or time.monotonic() - self._checked >= RELOAD_INTERVAL):
+            self._reloading = asyncio.ensure_future(self._reload())
+        if self._dataset is None:
+            # 첫 판은 기다린다. 연결이 끊겨 이 처리기가 취소되어도 공유하는 읽기는 계속한다
+            await asyncio.shield(self._reloading)
+        return self._dataset
+
+    async def _reload(self) -> None:
+        try:
+            dataset = await asyncio.get_running_loop().run_in_executor(None, store.load, self.csv_path)
+        except Exception:
+            if self._dataset is None:
+                raise
+            log.exception("데이터를 다시 읽지 못해 직전 판으로 계속 답합니다: %s", self.csv_path)
+        else:
+            if self._dataset is not None and dataset.version != self._dataset.version:
+                self._cache.clear()
+            self._dataset = dataset
+        finally:
+            self._checked = time.monotonic()
+            self._reloading = None
+
+    async def respond(self, method: str, target: str, body: bytes) -> Response:
+        try:
+            dataset = await self.dataset()
+        except Exception:
+            log.exception("데이터를 열지 못했습니다: %s", self.csv_path)
+            return Response(500, {"error": "서버 내부 오류"}, None)
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        body_key = hashlib.sha1(body).hexdigest() if body else ""
+        key = (dataset.version, "GET" if method == "HEAD" else method, url.path, tuple(sorted(params.items())), body_key)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        try:
+            # 캐시에 없으면 파생 테이블(순위, 거리 등)을 처음 만들 수 있어 실행기 스레드에서 계산한다
+            payload = await asyncio.get_running_loop().run_in_executor(
+                None, route, dataset, method, url.path, params, body
+            )
+            status = 200
+        except ApiError as e:
+            payload, status = {"error": str(e)}, e.status.value
+        except Exception:
+            # 예상 못 한 오류도 JSON 500으로 답하고 연결을 유지한다(캐시하지 않음)
+            log.exception("처리 중 오류: %s %s", method, target)
+            return Response(500, {"error": "서버 내부 오류"}, None)
+        etag = None
+        if status == 200:
+            etag = '"' + hashlib.sha1(repr(key).encode()).hexdigest()[:20] + '"'
+        response = Response(status, payload, etag)
+        if dataset is self._dataset:  # 계산하는 동안 새 판으로 바뀌었으면 지난 판 응답은 넣지 않는다
+            self._cache[key] = response
+            if len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return response
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_raw(431, b"", keep_alive=False))
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    writer.write(_raw(400, b"", keep_alive=False))
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY_BYTES:
+                    writer.write(_raw(413, b"", keep_alive=False))
+                    break
+                try:
+                    body = await reader.readexactly(length) if length else b""
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break  # 본문을 다 보내기 전에 끊긴 연결
+
+                if method == "OPTIONS":
+                    writer.write(_raw(204, b"", keep_alive))
+                else:
+                    response = await self.respond(method, target, body)
+                    writer.write(_encode(response, method, headers, keep_alive))
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    break
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+
+def _raw(status: int, body: bytes, keep_alive: bool, extra: list[str] = ()) -> bytes:
+    lines = [
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+        f"Content-Length: {len(body)}",
+        "Access-Control-Allow-Origin: *",
+        "Access-Control-Allow-Methods: GET, POST, OPTIONS",
+        "Access-Control-Allow-Headers: Content-Type, If-None-Match",
+        "Connection: keep-alive" if keep_alive else "Connection: close",
+        *extra,
+    ]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def _encode(response: Response, method: str, headers: dict, keep_alive: bool) -> bytes:
+    extra = ["Content-Type: application/json; charset=utf-8", "Vary: Accept-Encoding"]
+    body, etag = response.body, response.etag
+    if response.gzipped is not None and "gzip" in headers.get("accept-encoding", ""):
+        body, etag = response.gzipped, response.gzip_etag
+        extra.append("Content-Encoding: gzip")
+    if etag:
+        extra += [f"ETag: {etag}", "Cache-Control: no-cache"]
+        if etag in (t.strip() for t in headers.get("if-none-match", "").split(",")):
+            return _raw(304, b"", keep_alive, [h for h in extra[1:] if not h.startswith("Content-Encoding")])
+    data = _raw(response.status, body, keep_alive, extra)
+    if method == "HEAD":
+        return data[: len(data) - len(body)]
+    return data
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, csv_path=store.DEFAULT_CSV) -> asyncio.AbstractServer:
+    app = Server(csv_path)
+    await app.dataset()  # 첫 요청 전에 데이터와 파생 테이블을 연다
+    return await asyncio.start_server(app.handle, host, port, limit=MAX_HEADER_BYTES)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MBTI 데이터셋 JSON 질의 API")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--csv", default=store.DEFAULT_CSV)
+    args = parser.parse_args()
+
+    async def run() -> None:
+        server = await serve(args.host, args.port, args.csv)
+        print(f"http://{args.host}:{args.port}/v1/meta")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
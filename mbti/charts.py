@@ -0,0 +1,210 @@
+"""차트 명세(Vega-Lite JSON) 캐시.
+
+차트 하나는 (종류, 유형, 상위 k, 정렬, 정규화, 데이터 버전) 키로 식별하고, 직렬화한 JSON을
+바이트 예산이 있는 프로세스 내 LRU와 .mbti_cache/charts/ 디스크 캐시(용량 상한, 오래 안 쓴
+파일부터 삭제)에 둔다. 같은 차트를 다시 볼 때는 계산도 명세 생성도 하지 않는다.
+긴 계열은 직렬화 전에 MAX_POINTS개로 줄여 브라우저로 보내는 양을 줄인다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from mbti.profiling import timed
+from mbti.ranking import rank_index
+from mbti.store import CACHE_DIRNAME, ROOT, Dataset, _write_atomic
+
+CHART_DIR = ROOT / CACHE_DIRNAME / "charts"
+MEMORY_BUDGET = 32 << 20
+DISK_BUDGET = 256 << 20
+MAX_POINTS = 500
+DEFAULT_K = 10
+NORMALIZATIONS = ("percent", "zscore")
+SPEC_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ChartKey:
+    kind: str
+    mbti_type: str
+    k: int
+    ascending: bool
+    normalization: str
+    version: str
+
+    def digest(self) -> str:
+        raw = json.dumps([SPEC_VERSION, asdict(self)], sort_keys=True).encode()
+        return hashlib.sha1(raw).hexdigest()
+
+
+class ChartCache:
+    def __init__(self, directory: Path = CHART_DIR, memory_budget: int = MEMORY_BUDGET, disk_budget: int = DISK_BUDGET):
+        self.directory = Path(directory)
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self._lru: OrderedDict[ChartKey, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = {"memory": 0, "disk": 0, "miss": 0}
+
+    def _remember(self, key: ChartKey, payload: bytes) -> None:
+        with self._lock:
+            old = self._lru.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            if len(payload) > self.memory_budget:
+                return
+            self._lru[key] = payload
+            self._bytes += len(payload)
+            while self._bytes > self.memory_budget:
+                _, evicted = self._lru.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def get(self, key: ChartKey, build: Callable[[], dict]) -> dict:
+        with self._lock:
+            payload = self._lru.get(key)
+            if payload is not None:
+                self._lru.move_to_end(key)
+                self.hits["memory"] += 1
+                return json.loads(payload)
+        path = self.directory / f"{key.digest()}.json"
+        try:
+            payload = path.read_bytes()
+            os.utime(path)  # 디스크 정리 시 최근 사용 순서로 쓴다
+            self.hits["disk"] += 1
+        except FileNotFoundError:
+            payload = json.dumps(build(), ensure_ascii=False, separators=(",", ":")).encode()
+            self.hits["miss"] += 1
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _write_atomic(path, lambda f: f.write(payload), "wb")
+            self._trim_disk()
+        self._remember(key, payload)
+        return json.loads(payload)
+
+    def _trim_disk(self) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.disk_budget:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._bytes
+
+
+_cache = ChartCache()
+
+
+def downsample(x: np.ndarray, max_points: int = MAX_POINTS) -> np.ndarray:
+    """정렬된 계열에서 처음과 끝을 포함해 고르게 max_points개 위치를 고른다."""
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max_points).round().astype(np.intp))
+
+
+def _normalize(values: np.ndarray, column: np.ndarray, normalization: str) -> tuple[np.ndarray, str, str]:
+    """(값, 축 제목, 숫자 형식)."""
+    if normalization == "percent":
+        return values * 100, "비율 (%)", ".2f"
+    if normalization == "zscore":
+        std = column.std()
+        return (values - column.mean()) / (std if std > 0 else 1.0), "표준점수 (z)", ".2f"
+    raise ValueError(f"지원하지 않는 정규화: {normalization!r} (가능: {', '.join(NORMALIZATIONS)})")
+
+
+@timed("charts.build")
+def _ranking_spec(dataset: Dataset, key: ChartKey) -> dict:
+    ranks = rank_index(dataset)
+    col = dataset.column(key.mbti_type)
+    rows = ranks.bottom(key.mbti_type, key.k) if key.ascending else ranks.top(key.mbti_type, key.k)
+    rows = rows[downsample(rows)]
+    column = ranks.values[:, col]
+    values, title, fmt = _normalize(column[rows], column, key.normalization)
+    data = [
+        {"국가": dataset.countries[r], "값": round(float(v), 4), "순위": int(ranks.rank[col, r]) + 1}
+        for r, v in zip(rows, values)
+    ]
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "data": {"values": data},
+        "mark": {"type": "bar", "tooltip": True},
+        "encoding": {
+            "x": {"field": "국가", "type": "nominal", "sort": None, "title": None},
+            "y": {"field": "값", "type": "quantitative", "title": f"{key.mbti_type} {title}", "axis": {"format": fmt}},
+            "tooltip": [{"field": "순위"}, {"field": "국가"}, {"field": "값", "format": fmt}],
+        },
+    }
+
+
+@timed("charts.build")
+def _distribution_spec(dataset: Dataset, key: ChartKey) -> dict:
+    ranks = rank_index(dataset)
+    col = dataset.column(key.mbti_type)
+    order = ranks.order[col]
+    keep = downsample(order)
+    column = ranks.values[:, col]
+    values, title, fmt = _normalize(column[order[keep]], column, key.normalization)
+    data = [
+        {"순위": int(i) + 1, "국가": dataset.countries[order[i]], "값": round(float(v), 4)}
+        for i, v in zip(keep, values)
+    ]
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "data": {"values": data},
+        "mark": {"type": "area", "line": True, "tooltip": True, "opacity": 0.4},
+        "encoding": {
+            "x": {"field": "순위", "type": "quantitative", "title": f"순위 (전체 {len(order)}개)"},
+            "y": {"field": "값", "type": "quantitative", "title": f"{key.mbti_type} {title}", "axis": {"format": fmt}},
+            "tooltip": [{"field": "순위"}, {"field": "국가"}, {"field": "값", "format": fmt}],
+        },
+    }
+
+
+def ranking_chart(
+    dataset: Dataset, mbti_type: str, k: int = DEFAULT_K, ascending: bool = False, normalization: str = "percent"
+) -> dict:
+    """유형별 상위(또는 하위) k개국 막대 차트 명세."""
+    key = ChartKey("ranking", mbti_type.upper(), k, ascending, normalization, dataset.version)
+    return _cache.get(key, lambda: _ranking_spec(dataset, key))
+
+
+def distribution_chart(dataset: Dataset, mbti_type: str, normalization: str = "percent") -> dict:
+    """유형 비율을 내림차순으로 늘어놓은 전체 분포 차트 명세."""
+    key = ChartKey("distribution", mbti_type.upper(), 0, False, normalization, dataset.version)
+    return _cache.get(key, lambda: _distribution_spec(dataset, key))
+
+
+def prewarm(dataset: Dataset) -> int:
+    """16개 유형의 기본 차트(상위 DEFAULT_K개, 비율)를 미리 만든다. 버전당 한 번만 실행된다."""
+
+    def build(ds: Dataset) -> int:
+        for mbti_type in ds.types:
+            ranking_chart(ds, mbti_type)
+            distribution_chart(ds, mbti_type)
+        return len(ds.types)
+
+    return dataset.derived("charts:prewarm", build)
+
+
+def cache() -> ChartCache:
+    return _cache
@@ -0,0 +1,214 @@
+"""MBTI 프로필에 따른 국가 군집화.
+
+k-평균은 k-means++ 초기화와 행렬곱 기반 거리 계산으로 벡터화했고, cosine 척도에서는
+행을 단위 벡터로 맞춘 구면 k-평균을 쓴다. 계층 군집(평균/완전 연결)은 similarity 모듈이
+캐시해 둔 N×N 거리 행렬 위에서 Lance–Williams 갱신과 행별 최근접 캐시로 병합한다.
+
+결과는 (데이터 버전, 방법, k, 척도)별로 캐시된다. CSV가 바뀌어 새 버전을 계산할 때
+이전 버전과 달라진 행이 WARM_START_FRACTION 이하이면 이전 중심점에서 다시 시작한다.
+이를 위해 남겨 두는 것은 중심점과 재정규화 행렬 사본뿐이며 이전 Dataset은 붙잡지 않는다.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from mbti.profiling import timed
+from mbti.quality import normalized
+from mbti.similarity import FULL_MATRIX_LIMIT, METRICS, neighbour_index
+from mbti.store import Dataset
+
+METHODS = ("kmeans", "agglomerative")
+KMEANS_METRICS = ("euclidean", "cosine")
+LINKAGES = ("average", "complete")
+WARM_START_FRACTION = 0.1
+MAX_ITER = 100
+TOL = 1e-8
+
+_previous_lock = threading.Lock()
+_previous: dict[tuple[int, str], "_WarmStart"] = {}  # (k, 척도) → 마지막 k-평균의 이어 시작 정보
+
+
+@dataclass(frozen=True, eq=False)
+class _WarmStart:
+    version: str
+    types: tuple[str, ...]
+    rows: dict[str, int]  # 국가 → normalized 행
+    normalized: np.ndarray  # 이전 판 재정규화 행렬의 사본 (공유 메모리 뷰일 수 있으므로 복사한다)
+    centroids: np.ndarray
+
+
+@dataclass(eq=False)
+class ClusterResult:
+    dataset: Dataset
+    method: str
+    metric: str
+    labels: np.ndarray  # (행,) 0..k-1
+    centroids: np.ndarray  # (k, 유형) 재정규화 비율의 군집 평균
+    inertia: float
+    iterations: int
+    warm_started: bool = False
+
+    @property
+    def k(self) -> int:
+        return len(self.centroids)
+
+    def sizes(self) -> np.ndarray:
+        return np.bincount(self.labels, minlength=self.k)
+
+    def members(self, cluster: int) -> list[str]:
+        return [self.dataset.countries[i] for i in np.flatnonzero(self.labels == cluster)]
+
+    def label_of(self, country: str) -> int:
+        return int(self.labels[self.dataset.row(country)])
+
+
+def _space(values: np.ndarray, metric: str) -> np.ndarray:
+    if metric == "cosine":
+        norms = np.linalg.norm(values, axis=1, keepdims=True)
+        return values / np.where(norms > 0, norms, 1.0)
+    return values
+
+
+def _sq_distances(x: np.ndarray, x_sq: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    d = x_sq[:, None] - 2.0 * (x @ centers.T) + np.einsum("ij,ij->i", centers, centers)[None, :]
+    return np.maximum(d, 0.0)
+
+
+def _kmeans_pp(x: np.ndarray, x_sq: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    centers = np.empty((k, x.shape[1]))
+    centers[0] = x[rng.integers(len(x))]
+    closest = _sq_distances(x, x_sq, centers[:1])[:, 0]
+    for i in range(1, k):
+        total = closest.sum()
+        pick = rng.choice(len(x), p=closest / total) if total > 0 else rng.integers(len(x))
+        centers[i] = x[pick]
+        closest = np.minimum(closest, _sq_distances(x, x_sq, centers[i:i + 1])[:, 0])
+    return centers
+
+
+def lloyd(x: np.ndarray, centers: np.ndarray, max_iter: int = MAX_ITER, tol: float = TOL, spherical: bool = False):
+    """(labels, centers, inertia, iterations). 빈 군집은 가장 먼 점으로 다시 채운다."""
+    x_sq = np.einsum("ij,ij->i", x, x)
+    k = len(centers)
+    for iteration in range(1, max_iter + 1):
+        d = _sq_distances(x, x_sq, centers)
+        labels = d.argmin(axis=1)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centers)
+        np.add.at(sums, labels, x)
+        new = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centers)
+        for empty in np.flatnonzero(counts == 0):
+            new[empty] = x[d[np.arange(len(x)), labels].argmax()]
+        if spherical:
+            new = _space(new, "cosine")
+        shift = float(((new - centers) ** 2).sum())
+        centers = new
+        if shift <= tol:
+            break
+    d = _sq_distances(x, x_sq, centers)
+    labels = d.argmin(axis=1)
+    return labels, centers, float(d[np.arange(len(x)), labels].sum()), iteration
+
+
+def _changed_fraction(old: _WarmStart, new: Dataset) -> float:
+    if old.types != new.types:
+        return 1.0
+    common = [c for c in new.countries if c in old.rows]
+    if not common:
+        return 1.0
+    a = old.normalized[[old.rows[c] for c in common]]
+    b = normalized(new)[[new.row(c) for c in common]]
+    changed = int((~np.isclose(a, b, rtol=0, atol=1e-9).all(axis=1)).sum())
+    return (changed + len(new) - len(common)) / max(len(new), 1)
+
+
+def _centroids(values: np.ndarray, labels: np.ndarray, k: int) -> np.ndarray:
+    sums = np.zeros((k, values.shape[1]))
+    np.add.at(sums, labels, values)
+    return sums / np.maximum(np.bincount(labels, minlength=k), 1)[:, None]
+
+
+@timed("clustering.kmeans")
+def kmeans(dataset: Dataset, k: int, metric: str = "euclidean", seed: int = 0) -> ClusterResult:
+    if metric not in KMEANS_METRICS:
+        raise ValueError(f"k-평균은 {', '.join(KMEANS_METRICS)} 척도만 지원합니다: {metric!r}")
+    values = normalized(dataset)
+    k = max(1, min(k, len(values)))
+    x = _space(values, metric)
+    with _previous_lock:
+        previous = _previous.get((k, metric))
+    warm = (
+        previous is not None
+        and previous.version != dataset.version
+        and _changed_fraction(previous, dataset) <= WARM_START_FRACTION
+    )
+    if warm:
+        init = _space(previous.centroids, metric)
+    else:
+        init = _kmeans_pp(x, np.einsum("ij,ij->i", x, x), k, np.random.default_rng(seed))
+    labels, _, inertia, iterations = lloyd(x, init, spherical=metric == "cosine")
+    result = ClusterResult(dataset, "kmeans", metric, labels, _centroids(values, labels, k), inertia, iterations, warm)
+    state = _WarmStart(dataset.version, dataset.types, dict(dataset._index), np.array(values), result.centroids)
+    with _previous_lock:
+        _previous[(k, metric)] = state
+    return result
+
+
+@timed("clustering.agglomerative")
+def agglomerative(dataset: Dataset, k: int, metric: str = "euclidean", linkage: str = "average") -> ClusterResult:
+    if linkage not in LINKAGES:
+        raise ValueError(f"지원하지 않는 연결 방식: {linkage!r} (가능: {', '.join(LINKAGES)})")
+    n = len(dataset)
+    if n > FULL_MATRIX_LIMIT:
+        raise ValueError(f"계층 군집은 {FULL_MATRIX_LIMIT}행 이하에서만 지원합니다 (현재 {n}행)")
+    k = max(1, min(k, n))
+    dist = neighbour_index(dataset, metric).distances(np.arange(n)).astype(np.float64, copy=True)
+    np.fill_diagonal(dist, np.inf)
+    size = np.ones(n)
+    active = np.ones(n, dtype=bool)
+    parent = np.arange(n)
+    nearest = dist.argmin(axis=1)  # 행별 최근접 활성 클러스터
+
+    for _ in range(n - k):
+        rows = np.flatnonzero(active)
+        i = rows[dist[rows, nearest[rows]].argmin()]
+        j = nearest[i]
+        if linkage == "average":
+            merged = (size[i] * dist[i] + size[j] * dist[j]) / (size[i] + size[j])
+        else:
+            merged = np.maximum(dist[i], dist[j])
+        dist[i], dist[:, i] = merged, merged
+        dist[i, i] = np.inf
+        dist[j], dist[:, j] = np.inf, np.inf
+        size[i] += size[j]
+        active[j] = False
+        parent[parent == j] = i
+        # i, j를 최근접으로 가리키던 행과 i 자신만 다시 계산한다
+        stale = np.flatnonzero(active & ((nearest == i) | (nearest == j)))
+        stale = np.union1d(stale, [i])
+        nearest[stale] = dist[stale].argmin(axis=1)
+        closer = active & (merged < dist[np.arange(n), nearest])
+        nearest[closer] = i
+
+    _, labels = np.unique(parent, return_inverse=True)
+    values = normalized(dataset)
+    centroids = _centroids(values, labels, k)
+    inertia = float(((values - centroids[labels]) ** 2).sum())
+    return ClusterResult(dataset, "agglomerative", metric, labels, centroids, inertia, n - k)
+
+
+def clusters(dataset: Dataset, k: int, metric: str = "euclidean", method: str = "kmeans") -> ClusterResult:
+    """(데이터 버전, 방법, k, 척도)별로 캐시된 군집 결과."""
+    if method == "kmeans":
+        build = lambda ds: kmeans(ds, k, metric)  # noqa: E731
+    elif method == "agglomerative":
+        if metric not in METRICS:
+            raise ValueError(f"지원하지 않는 거리 척도: {metric!r}")
+        build = lambda ds: agglomerative(ds, k, metric)  # noqa: E731
+    else:
+        raise ValueError(f"지원하지 않는 군집 방법: {method!r} (가능: {', '.join(METHODS)})")
+    return dataset.derived(f"clusters:{method}:{k}:{metric}", build)
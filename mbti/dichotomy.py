@@ -0,0 +1,69 @@
+"""네 가지 선호 지표(E/I, S/N, T/F, J/P)와 기질(NT, NF, SJ, SP) 비율.
+
+유형 코드에서 고정된 16×12 투영 행렬을 만들어 두고, 모든 국가의 지표 비율을
+행렬곱 한 번으로 구한다. 열 순서가 불규칙해도 유형 이름으로 투영 행렬을 만들므로 안전하다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from mbti.profiling import timed
+from mbti.quality import normalized
+from mbti.store import Dataset
+
+AXES = (("E", "I"), ("S", "N"), ("T", "F"), ("J", "P"))
+LETTERS = tuple(letter for pair in AXES for letter in pair)
+TEMPERAMENTS = ("NT", "NF", "SJ", "SP")
+LABELS = LETTERS + TEMPERAMENTS
+
+
+def _matches(code: str, label: str) -> bool:
+    if len(label) == 1:
+        return label in code
+    # 기질: N 계열은 두 번째 글자(T/F), S 계열은 네 번째 글자(J/P)로 나눈다
+    if label[0] == "N":
+        return code[1] == "N" and code[2] == label[1]
+    return code[1] == "S" and code[3] == label[1]
+
+
+def projection(types: tuple[str, ...]) -> np.ndarray:
+    """유형 열 순서에 맞춘 (len(types) × len(LABELS)) 0/1 투영 행렬."""
+    return np.array([[_matches(code, label) for label in LABELS] for code in types], dtype=np.float64)
+
+
+@dataclass(eq=False)
+class Margins:
+    dataset: Dataset
+    values: np.ndarray  # (국가 수 × len(LABELS))
+
+    @classmethod
+    @timed("dichotomy.build")
+    def build(cls, dataset: Dataset) -> "Margins":
+        values = normalized(dataset) @ projection(dataset.types)
+        values.setflags(write=False)
+        return cls(dataset, values)
+
+    @classmethod
+    @timed("dichotomy.rebase")
+    def rebase(cls, previous: "Margins", dataset: Dataset, old_rows: np.ndarray, new_rows: np.ndarray) -> "Margins":
+        """값이 같은 행(old_rows → new_rows)은 이전 판에서 복사하고 나머지 행만 투영한다."""
+        values = np.empty((len(dataset), len(LABELS)))
+        values[new_rows] = previous.values[old_rows]
+        changed = np.setdiff1d(np.arange(len(dataset)), new_rows)
+        values[changed] = normalized(dataset)[changed] @ projection(dataset.types)
+        values.setflags(write=False)
+        return cls(dataset, values)
+
+    def column(self, label: str) -> np.ndarray:
+        return self.values[:, LABELS.index(label.upper())]
+
+    def profile(self, country: str) -> dict[str, float]:
+        row = self.values[self.dataset.row(country)]
+        return {label: float(v) for label, v in zip(LABELS, row)}
+
+
+def margins(dataset: Dataset) -> Margins:
+    return dataset.derived("dichotomy", Margins.build)
@@ -0,0 +1,141 @@
+"""유형 비율에 대한 다중 조건 필터.
+
+"INFJ > 5% AND ENTP < 4% AND ESTJ 8~12%" 같은 복합 조건을 전체 스캔 없이 처리한다.
+유형(열)마다 오름차순 정렬 값과 행 번호(순위 인덱스 재사용), 그리고 정렬 위치를
+BUCKETS개의 같은 크기 구간으로 나눈 누적 비트맵(packbits)을 만들어 둔다.
+범위 조건 하나는 이진 탐색으로 정렬 위치 [a, b)를 구한 뒤, 통째로 포함되는 구간은
+누적 비트맵 두 개의 AND NOT으로, 양 끝의 자투리 구간만 개별 비트로 채운다.
+여러 조건은 비트맵 AND로 합친다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from mbti.profiling import timed
+from mbti.quality import normalized
+from mbti.ranking import rank_index
+from mbti.store import Dataset
+
+BUCKETS = 16
+OPS = (">", ">=", "<", "<=", "between")
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """mbti_type op value. between은 value <= x <= upper."""
+
+    mbti_type: str
+    op: str
+    value: float
+    upper: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.op not in OPS:
+            raise ValueError(f"지원하지 않는 연산자: {self.op!r} (가능: {', '.join(OPS)})")
+        if self.op == "between" and self.upper is None:
+            raise ValueError("between 조건에는 upper가 필요합니다")
+
+
+@dataclass(eq=False)
+class FilterIndex:
+    dataset: Dataset
+    order: np.ndarray  # (유형, 행) 오름차순 행 번호
+    sorted_values: np.ndarray  # (유형, 행) 오름차순 값
+    edges: np.ndarray  # (BUCKETS + 1,) 구간 경계(정렬 위치)
+    prefix: np.ndarray  # (유형, BUCKETS + 1, 바이트) 정렬 위치 < edges[b] 인 행의 비트맵
+
+    @classmethod
+    @timed("filters.build")
+    def build(cls, dataset: Dataset, buckets: int = BUCKETS) -> "FilterIndex":
+        values = normalized(dataset)
+        order = np.ascontiguousarray(rank_index(dataset).order[:, ::-1])
+        n_types, n = order.shape
+        sorted_values = np.take_along_axis(values.T, order, axis=1)
+        edges = np.linspace(0, n, min(buckets, max(n, 1)) + 1).astype(np.intp)
+
+        prefix = np.empty((n_types, len(edges), -(-n // 8)), dtype=np.uint8)
+        position = np.empty(n, dtype=np.intp)
+        for t in range(n_types):
+            # 임시 불리언 배열이 (경계 × 행) 크기를 넘지 않도록 유형별로 만든다
+            position[order[t]] = np.arange(n)
+            prefix[t] = np.packbits(position[None, :] < edges[:, None], axis=1)
+        return cls(dataset, order, sorted_values, edges, prefix)
+
+    @property
+    def n_bytes(self) -> int:
+        return self.prefix.shape[2]
+
+    def _positions(self, col: int, pred: Predicate) -> tuple[int, int]:
+        vals = self.sorted_values[col]
+        lo, hi = 0, len(vals)
+        if pred.op == ">":
+            lo = np.searchsorted(vals, pred.value, "right")
+        elif pred.op == ">=":
+            lo = np.searchsorted(vals, pred.value, "left")
+        elif pred.op == "<":
+            hi = np.searchsorted(vals, pred.value, "left")
+        elif pred.op == "<=":
+            hi = np.searchsorted(vals, pred.value, "right")
+        else:
+            lo = np.searchsorted(vals, pred.value, "left")
+            hi = np.searchsorted(vals, pred.upper, "right")
+        return int(lo), int(max(lo, hi))
+
+    def _scatter(self, rows: np.ndarray) -> np.ndarray:
+        # 행 번호가 서로 다르므로 같은 바이트 안의 비트를 더하는 것이 OR와 같다
+        weights = (128 >> (rows & 7)).astype(np.float64)
+        return np.bincount(rows >> 3, weights=weights, minlength=self.n_bytes).astype(np.uint8)
+
+    def bitmap(self, pred: Predicate) -> np.ndarray:
+        col = self.dataset.column(pred.mbti_type)
+        a, b = self._positions(col, pred)
+        first = int(np.searchsorted(self.edges, a, "left"))  # a 이상인 첫 경계
+        last = int(np.searchsorted(self.edges, b, "right")) - 1  # b 이하인 마지막 경계
+        order = self.order[col]
+        if first >= last:
+            return self._scatter(order[a:b])
+        bits = self.prefix[col, last] & ~self.prefix[col, first]
+        edge_rows = np.concatenate([order[a:self.edges[first]], order[self.edges[last]:b]])
+        if len(edge_rows):
+            bits |= self._scatter(edge_rows)
+        return bits
+
+    def match(self, predicates: list[Predicate]) -> np.ndarray:
+        """모든 조건을 만족하는 행의 비트맵(packbits)."""
+        n = len(self.dataset)
+        if not predicates:
+            return np.packbits(np.ones(n, dtype=bool))
+        result = None
+        for pred in predicates:
+            bits = self.bitmap(pred)
+            result = bits if result is None else result & bits
+            if not result.any():
+                break
+        return result
+
+    def query(self, predicates: list[Predicate], limit: int | None = None) -> np.ndarray:
+        """모든 조건을 만족하는 행 번호(오름차순). limit이 있으면 앞에서부터 그 수만큼만 푼다."""
+        result = self.match(predicates)
+        n = len(self.dataset)
+        if limit is None:
+            return np.flatnonzero(np.unpackbits(result, count=n))
+        # 0이 아닌 바이트마다 적어도 한 행이 있으므로 앞쪽 limit개 바이트만 풀면 충분하다
+        nonzero = np.flatnonzero(result)[:limit]
+        bits = np.unpackbits(result[nonzero]).reshape(-1, 8).astype(bool)
+        rows = (nonzero[:, None] * 8 + np.arange(8))[bits]
+        return rows[rows < n][:limit]
+
+    def count(self, predicates: list[Predicate]) -> int:
+        return int(_POPCOUNT[self.match(predicates)].sum(dtype=np.int64))
+
+
+def filter_index(dataset: Dataset) -> FilterIndex:
+    return dataset.derived("filters", FilterIndex.build)
+
+
+def query(dataset: Dataset, predicates: list[Predicate], limit: int | None = None) -> np.ndarray:
+    return filter_index(dataset).query(predicates, limit)
@@ -0,0 +1,396 @@
+"""오프라인 세계 지도(코로플레스).
+
+국가 경계는 Natural Earth 1:110m(퍼블릭 도메인)을 미리 단순화한 mbti/data/world_lod.json.gz 에
+묶어 두므로 네트워크 없이 동작한다. 좌표는 1/QUANTIZATION 도 단위 정수로 양자화하고
+링마다 차분 부호화했으며, 단순화 정도가 다른 LOD(0: 원본, 1: 중간, 2: 거침)를 함께 담는다.
+확대 수준에 필요한 LOD와 화면 범위 안의 국가만 GeoJSON으로 풀어 Vega-Lite 명세에 넣는다.
+
+CSV 국가명 → 경계 매칭은 이름 정규화와 ALIASES 표로 한 번만 계산해 데이터 버전별로 캐시한다.
+
+묶음 파일 다시 만들기 (pyshp 필요, 빌드할 때만):
+    python -m mbti.geo build naturalearth_lowres.shp
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import gzip
+import json
+import re
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from mbti.charts import ChartKey, _normalize, cache
+from mbti.dichotomy import LABELS, margins
+from mbti.profiling import timed
+from mbti.quality import normalized
+from mbti.store import Dataset
+
+BUNDLE_PATH = Path(__file__).resolve().parent / "data" / "world_lod.json.gz"
+BUNDLE_FORMAT = 2  # 2: 퇴화 링 제거, 외곽 링 시계 방향 유지
+QUANTIZATION = 100
+LOD_TOLERANCES = (0.0, 0.25, 0.8)  # 도 단위 Douglas–Peucker 허용 오차
+ZOOMS = ("world", "continent", "local")
+ZOOM_LOD = {"world": 2, "continent": 1, "local": 0}
+LOCAL_MARGIN = 12.0  # local 확대 시 선택 국가 경계 상자 바깥 여유(도)
+
+# 정규화한 CSV 국가명 → Natural Earth 국가명(정규화)
+ALIASES = {
+    "bosnia and herzegovina": "bosnia and herz",
+    "central african republic": "central african rep",
+    "democratic republic of the congo": "dem rep congo",
+    "dr congo": "dem rep congo",
+    "congo kinshasa": "dem rep congo",
+    "congo brazzaville": "congo",
+    "congo": "congo",
+    "republic of the congo": "congo",
+    "dominican republic": "dominican rep",
+    "equatorial guinea": "eq guinea",
+    "south sudan": "s sudan",
+    "united states": "united states of america",
+    "usa": "united states of america",
+    "czech republic": "czechia",
+    "ivory coast": "cote divoire",
+    "cote divoire": "cote divoire",
+    "eswatini": "eswatini",
+    "swaziland": "eswatini",
+    "north macedonia": "north macedonia",
+    "macedonia": "north macedonia",
+    "solomon islands": "solomon is",
+    "falkland islands": "falkland is",
+    "western sahara": "w sahara",
+    "east timor": "timor leste",
+    "timor leste": "timor leste",
+    "myanmar": "myanmar",
+    "burma": "myanmar",
+    "palestine": "palestine",
+    "south korea": "south korea",
+    "korea": "south korea",
+    "north korea": "north korea",
+    "turkey": "turkey",
+    "turkiye": "turkey",
+    "cape verde": "cabo verde",
+    "french southern territories": "fr s antarctic lands",
+    "northern cyprus": "n cyprus",
+}
+
+# 1:110m 경계에 없는 작은 나라는 (경도, 위도, 대륙) 점으로 표시한다. 키는 ALIASES를 거친 이름
+MARKERS = {
+    "andorra": (1.52, 42.51, "Europe"),
+    "antigua and barbuda": (-61.80, 17.06, "North America"),
+    "bahrain": (50.55, 26.07, "Asia"),
+    "cabo verde": (-23.62, 15.12, "Africa"),
+    "barbados": (-59.55, 13.19, "North America"),
+    "dominica": (-61.37, 15.41, "North America"),
+    "faroe islands": (-6.91, 61.89, "Europe"),
+    "grenada": (-61.68, 12.12, "North America"),
+    "maldives": (73.22, 3.20, "Asia"),
+    "malta": (14.38, 35.94, "Europe"),
+    "mauritius": (57.55, -20.35, "Africa"),
+    "monaco": (7.42, 43.74, "Europe"),
+    "saint kitts and nevis": (-62.78, 17.36, "North America"),
+    "saint lucia": (-60.98, 13.91, "North America"),
+    "saint vincent and grenadines": (-61.20, 13.25, "North America"),
+    "seychelles": (55.49, -4.68, "Africa"),
+    "singapore": (103.82, 1.35, "Asia"),
+}
+
+
+def normalize_name(name: str) -> str:
+    """대소문자, 악센트, 문장부호, '&', 'the' 차이를 없앤 비교용 이름. 아포스트로피는 지운다(d'Ivoire → divoire)."""
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().casefold()
+    text = text.replace("'", "").replace("&", " and ")
+    text = re.sub(r"[^a-z0-9 ]+", " ", text)
+    words = [w for w in text.split() if w != "the"]
+    return " ".join(words)
+
+
+# --- 묶음 파일 만들기 -------------------------------------------------------------
+
+
+def _simplify(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """닫힌 링에 대한 Douglas–Peucker 단순화(양 끝점 유지)."""
+    if tolerance <= 0 or len(points) <= 4:
+        return points
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        seg = points[end] - points[start]
+        rel = points[start + 1:end] - points[start]
+        length = np.hypot(*seg)
+        if length == 0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0]) / length
+        i = int(dist.argmax())
+        if dist[i] > tolerance:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack.extend(((start, mid), (mid, end)))
+    return points[keep]
+
+
+def _encode_ring(points: np.ndarray) -> list[int] | None:
+    """양자화·델타 인코딩. 양자화 후 서로 다른 점이 4개 미만이면(d3-geo가 그리지 못하는 링) None."""
+    q = np.round(points * QUANTIZATION).astype(np.int64)
+    q = q[np.r_[True, (np.diff(q, axis=0) != 0).any(axis=1)]]
+    if len(np.unique(q, axis=0)) < 4:
+        return None
+    deltas = np.diff(q, axis=0, prepend=np.zeros((1, 2), dtype=np.int64))
+    return deltas.ravel().tolist()
+
+
+def build_bundle(shp_path: Path, out_path: Path = BUNDLE_PATH) -> None:
+    import shapefile  # pyshp
+
+    reader = shapefile.Reader(str(shp_path))
+    fields = [f[0] for f in reader.fields[1:]]
+    countries = []
+    for shape_record in reader.iterShapeRecords():
+        record = dict(zip(fields, shape_record.record))
+        shape = shape_record.shape
+        parts = list(shape.parts) + [len(shape.points)]
+        rings = [np.asarray(shape.points[a:b], dtype=np.float64) for a, b in zip(parts, parts[1:])]
+        # 셰이프파일에서 외곽 링은 시계 방향, 구멍은 반시계 방향이다
+        polygons: list[list[np.ndarray]] = []
+        for ring in rings:
+            x, y = ring[:, 0], ring[:, 1]
+            signed_area = 0.5 * float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+            if signed_area <= 0 or not polygons:
+                polygons.append([ring])
+            else:
+                polygons[-1].append(ring)
+        lods = []
+        for level, tolerance in enumerate(LOD_TOLERANCES):
+            encoded = []
+            for polygon in polygons:
+                # 단순화·양자화 후 퇴화한 링은 뺀다(거친 LOD에서는 작은 섬이 통째로 빠진다)
+                rings = [_encode_ring(_simplify(ring, tolerance)) for ring in polygon]
+                if rings[0] is not None:
+                    encoded.append([r for r in rings if r is not None])
+            if not encoded:  # 나라 전체가 사라지면 원본 링 중 유효한 가장 큰 외곽 링 하나는 남긴다
+                for outer in sorted((p[0] for p in polygons), key=len, reverse=True):
+                    ring = _encode_ring(outer)
+                    if ring is not None:
+                        encoded = [[ring]]
+                        break
+            lods.append(encoded)
+        countries.append(
+            {
+                "name": record["name"],
+                "iso_a3": record["iso_a3"],
+                "continent": record["continent"],
+                "bbox": [round(v, 2) for v in shape.bbox],
+                "lods": lods,
+            }
+        )
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "source": "Natural Earth 1:110m Admin 0 – Countries (public domain)",
+        "quantization": QUANTIZATION,
+        "lod_tolerances": list(LOD_TOLERANCES),
+        "countries": countries,
+    }
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(out_path, "wt", encoding="utf-8", compresslevel=9) as f:
+        json.dump(bundle, f, ensure_ascii=False, separators=(",", ":"))
+
+
+# --- 읽기 -------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=1)
+def bundle() -> dict:
+    with gzip.open(BUNDLE_PATH, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _decode_ring(deltas: list[int], scale: float) -> list[list[float]]:
+    coords = np.cumsum(np.asarray(deltas, dtype=np.int64).reshape(-1, 2), axis=0) / scale
+    ring = coords.tolist()
+    if ring[0] != ring[-1]:
+        ring.append(ring[0])
+    # 셰이프파일 순서(외곽 시계 방향) 그대로 둔다. d3-geo(Vega-Lite)는 구면 다각형의 안쪽을
+    # 링 방향으로 판단하므로 RFC 7946식 반시계 외곽 링은 지구 전체를 채운다
+    return ring
+
+
+@functools.lru_cache(maxsize=len(LOD_TOLERANCES))
+def geometries(lod: int) -> tuple[dict, ...]:
+    """LOD별로 풀어 둔 GeoJSON geometry (묶음 파일의 국가 순서)."""
+    data = bundle()
+    scale = float(data["quantization"])
+    out = []
+    for country in data["countries"]:
+        polygons = [[_decode_ring(r, scale) for r in polygon] for polygon in country["lods"][lod]]
+        out.append({"type": "MultiPolygon", "coordinates": polygons})
+    return tuple(out)
+
+
+@dataclass(eq=False)
+class GeoJoin:
+    dataset: Dataset
+    feature_of_row: np.ndarray  # (행,) 묶음 국가 번호, 없으면 -1
+    markers: dict[int, tuple[float, float, str]]  # 행 → 점 위치 (경계가 없는 작은 나라)
+    unmatched: tuple[str, ...]
+
+    @classmethod
+    @timed("geo.join")
+    def build(cls, dataset: Dataset) -> "GeoJoin":
+        by_name = {normalize_name(c["name"]): i for i, c in enumerate(bundle()["countries"])}
+        by_iso = {c["iso_a3"]: i for i, c in enumerate(bundle()["countries"])}
+        feature = np.full(len(dataset), -1, dtype=np.intp)
+        markers = {}
+        unmatched = []
+        for row, country in enumerate(dataset.countries):
+            key = normalize_name(country)
+            key = ALIASES.get(key, key)
+            index = by_name.get(key, by_iso.get(country.upper(), -1))
+            feature[row] = index
+            if index >= 0:
+                continue
+            if key in MARKERS:
+                markers[row] = MARKERS[key]
+            else:
+                unmatched.append(country)
+        return cls(dataset, feature, markers, tuple(unmatched))
+
+
+def geo_join(dataset: Dataset) -> GeoJoin:
+    return dataset.derived("geo:join", GeoJoin.build)
+
+
+def _column(dataset: Dataset, label: str) -> np.ndarray:
+    label = label.upper()
+    if label in dataset.types:
+        return normalized(dataset)[:, dataset.column(label)]
+    if label in LABELS:
+        return margins(dataset).column(label)
+    raise KeyError(f"알 수 없는 유형/지표: {label!r}")
+
+
+def _in_view(zoom: str, focus: tuple[list[float], str] | None, bbox: list[float], continent: str) -> bool:
+    if zoom == "world" or focus is None:
+        return True
+    focus_bbox, focus_continent = focus
+    if zoom == "continent":
+        return continent == focus_continent
+    x0, y0, x1, y1 = focus_bbox
+    return (
+        bbox[0] <= x1 + LOCAL_MARGIN and bbox[2] >= x0 - LOCAL_MARGIN
+        and bbox[1] <= y1 + LOCAL_MARGIN and bbox[3] >= y0 - LOCAL_MARGIN
+    )
+
+
+@timed("charts.build")
+def _map_spec(dataset: Dataset, label: str, zoom: str, focus_country: str | None, normalization: str) -> dict:
+    join = geo_join(dataset)
+    column = _column(dataset, label)
+    countries = bundle()["countries"]
+    focus = None
+    if focus_country is not None:
+        row = dataset.row(focus_country)
+        index = join.feature_of_row[row]
+        if index >= 0:
+            focus = (countries[index]["bbox"], countries[index]["continent"])
+        elif row in join.markers:
+            lon, lat, continent = join.markers[row]
+            focus = ([lon, lat, lon, lat], continent)
+    matched = np.flatnonzero(join.feature_of_row >= 0)  # -1(경계 없음)은 키로 넣지 않는다
+    value_of = dict(zip(join.feature_of_row[matched].tolist(), matched.tolist()))
+    shapes = geometries(ZOOM_LOD[zoom])
+    values, title, fmt = _normalize(column, column, normalization)
+    features = []
+    for i, c in enumerate(countries):
+        if not _in_view(zoom, focus, c["bbox"], c["continent"]):
+            continue
+        row = value_of.get(i)
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": shapes[i],
+                "properties": {
+                    "name": dataset.countries[row] if row is not None else c["name"],
+                    "value": None if row is None else round(float(values[row]), 3),
+                },
+            }
+        )
+    points = [
+        {"name": dataset.countries[row], "lon": lon, "lat": lat, "value": round(float(values[row]), 3)}
+        for row, (lon, lat, continent) in join.markers.items()
+        if _in_view(zoom, focus, [lon, lat, lon, lat], continent)
+    ]
+    color = {
+        "field": "value",
+        "type": "quantitative",
+        "title": f"{label} {title}",
+        "scale": {"scheme": "blues"},
+    }
+    tooltip = [{"field": "name", "title": "국가"}, {"field": "value", "title": title, "format": fmt}]
+    layers = [
+        {"mark": {"type": "geoshape", "fill": "#e5e7eb", "stroke": "white", "strokeWidth": 0.4}},
+        {
+            "transform": [
+                {"calculate": "datum.properties.name", "as": "name"},
+                {"calculate": "datum.properties.value", "as": "value"},
+                {"filter": "isValid(datum.value)"},
+            ],
+            "mark": {"type": "geoshape", "stroke": "white", "strokeWidth": 0.4, "tooltip": True},
+            "encoding": {"color": color, "tooltip": tooltip},
+        },
+    ]
+    if points:
+        layers.append(
+            {
+                "data": {"values": points},
+                "mark": {"type": "circle", "size": 40, "stroke": "#334155", "strokeWidth": 0.6, "opacity": 1},
+                "encoding": {
+                    "longitude": {"field": "lon", "type": "quantitative"},
+                    "latitude": {"field": "lat", "type": "quantitative"},
+                    "color": color,
+                    "tooltip": tooltip,
+                },
+            }
+        )
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "height": 420,
+        "data": {"values": features, "format": {"type": "json"}},
+        "projection": {"type": "equalEarth" if zoom == "world" else "mercator"},
+        "layer": layers,
+    }
+
+
+def map_chart(
+    dataset: Dataset, label: str, zoom: str = "world", focus_country: str | None = None, normalization: str = "percent"
+) -> dict:
+    """유형(예: INFJ) 또는 선호 지표(E, NT 등) 비율의 코로플레스 명세. 차트 캐시를 거친다."""
+    if zoom not in ZOOMS:
+        raise ValueError(f"지원하지 않는 확대 수준: {zoom!r} (가능: {', '.join(ZOOMS)})")
+    focus_country = None if zoom == "world" else focus_country
+    # 묶음 형식을 키에 넣어 지오메트리가 바뀌면 디스크에 남은 지도 명세를 쓰지 않는다
+    key = ChartKey(f"map{bundle()['format']}:{zoom}:{focus_country or ''}", label.upper(), 0, False, normalization, dataset.version)
+    return cache().get(key, lambda: _map_spec(dataset, label, zoom, focus_country, normalization))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Natural Earth 셰이프파일로 LOD 지도 묶음을 만든다")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build")
+    build.add_argument("shp", type=Path)
+    build.add_argument("--out", type=Path, default=BUNDLE_PATH)
+    args = parser.parse_args()
+    build_bundle(args.shp, args.out)
+    print(f"저장: {args.out} ({args.out.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
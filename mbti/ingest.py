@@ -0,0 +1,203 @@
+"""응답자 단위 원자료를 16유형 비율 표로 집계하는 스트리밍 수집기.
+
+원자료(국가, 지역, 유형 코드, 응답 시각 열을 가진 CSV)를 CHUNK_ROWS 행씩 읽어
+(국가, 지역)별 16유형 응답 수를 int64 배열에 누적한다. 메모리는 청크 크기와
+(국가, 지역) 수에만 비례한다. 누적 상태와 처리한 파일 목록(sha256)은 상태 파일에
+저장하므로, 새 일별 파일을 넣으면 그 파일의 응답 수만 더한다.
+
+    python -m mbti.ingest raw/2025-10-*.csv --out countriesMBTI_raw.csv
+    python -m mbti.ingest raw/2025-10-19.csv --out countriesMBTI_raw.csv --level region
+
+출력은 countriesMBTI_16types.csv 와 같은 스키마(Country + 16유형 비율)이며,
+표본 크기는 같은 이름에 _n 을 붙인 CSV(Country, N)에 따로 쓴다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from mbti.store import CACHE_DIRNAME, ROOT, TYPES, _sha256, _write_atomic
+
+CHUNK_ROWS = 500_000
+DEFAULT_STATE = ROOT / CACHE_DIRNAME / "ingest_state.npz"
+DEFAULT_COLUMNS = {"country": "country", "region": "region", "type": "type"}
+REGION_SEPARATOR = " / "
+
+
+@dataclass(eq=False)
+class Accumulator:
+    """(국가, 지역)별 16유형 응답 수."""
+
+    keys: list[tuple[str, str]] = field(default_factory=list)
+    counts: np.ndarray = field(default_factory=lambda: np.zeros((0, len(TYPES)), dtype=np.int64))
+    files: dict[str, dict] = field(default_factory=dict)  # sha256 → {path, rows, rejected}
+    _index: dict[tuple[str, str], int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self._index:
+            self._index = {key: i for i, key in enumerate(self.keys)}
+
+    @classmethod
+    def open(cls, state_path: str | os.PathLike[str] = DEFAULT_STATE) -> "Accumulator":
+        try:
+            with np.load(state_path, allow_pickle=False) as state:
+                meta = json.loads(str(state["meta"]))
+                counts = state["counts"]
+        except FileNotFoundError:
+            return cls()
+        if meta["types"] != list(TYPES):
+            raise ValueError(f"{state_path}: 유형 열 순서가 현재 코드와 다릅니다")
+        return cls(keys=[tuple(k) for k in meta["keys"]], counts=counts, files=meta["files"])
+
+    def save(self, state_path: str | os.PathLike[str] = DEFAULT_STATE) -> None:
+        state_path = Path(state_path)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = json.dumps({"types": list(TYPES), "keys": self.keys, "files": self.files}, ensure_ascii=False)
+        _write_atomic(state_path, lambda f: np.savez(f, counts=self.counts[: len(self.keys)], meta=np.array(meta)), "wb")
+
+    def _key_rows(self, uniques) -> np.ndarray:
+        rows = np.empty(len(uniques), dtype=np.int64)
+        for i, key in enumerate(uniques):
+            row = self._index.get(key)
+            if row is None:
+                row = self._index[key] = len(self.keys)
+                self.keys.append(key)
+            rows[i] = row
+        if len(self.keys) > len(self.counts):
+            grown = np.zeros((max(len(self.keys), 2 * len(self.counts)), len(TYPES)), dtype=np.int64)
+            grown[: len(self.counts)] = self.counts
+            self.counts = grown
+        return rows
+
+    def add_chunk(self, countries, regions, types) -> int:
+        """한 청크를 누적하고, 유형 코드가 잘못됐거나 국가가 비어 버린 행 수를 돌려준다."""
+        import pandas as pd
+
+        type_codes = pd.Index(TYPES).get_indexer(pd.Series(types, dtype="string").str.strip().str.upper())
+        country = pd.Series(countries, dtype="string").str.strip()
+        valid = (type_codes >= 0) & (country.fillna("") != "").to_numpy()
+        keys = pd.MultiIndex.from_arrays(
+            [
+                country[valid],
+                pd.Series(regions, dtype="string").str.strip().fillna("")[valid],
+            ]
+        )
+        inverse, uniques = pd.factorize(keys)
+        rows = self._key_rows(list(uniques))
+        flat = rows[inverse] * len(TYPES) + type_codes[valid]
+        n_keys = len(self.keys)
+        self.counts[:n_keys] += np.bincount(flat, minlength=n_keys * len(TYPES)).reshape(n_keys, len(TYPES))
+        return int((~valid).sum())
+
+    def add_file(self, path: str | os.PathLike[str], columns: dict[str, str] = DEFAULT_COLUMNS, chunk_rows: int = CHUNK_ROWS) -> dict | None:
+        """원자료 파일 하나를 청크 단위로 누적하고 그 파일의 기록({path, rows, rejected})을 돌려준다.
+
+        이미 넣은 파일(같은 sha256)이면 None.
+        """
+        import pandas as pd
+
+        path = Path(path)
+        digest = _sha256(path)
+        if digest in self.files:
+            return None
+        usecols = [columns["country"], columns["type"]]
+        has_region = bool(columns.get("region"))
+        if has_region:
+            header = pd.read_csv(path, nrows=0).columns
+            has_region = columns["region"] in header
+            if has_region:
+                usecols.append(columns["region"])
+        rows = rejected = 0
+        # 실패하면 상태에 반쯤 더해진 값이 남지 않도록 복사본에 누적한 뒤 교체한다
+        keys, counts, index = list(self.keys), self.counts.copy(), dict(self._index)
+        try:
+            for chunk in pd.read_csv(path, usecols=usecols, dtype="string", chunksize=chunk_rows):
+                regions = chunk[columns["region"]] if has_region else np.full(len(chunk), "", dtype=object)
+                rejected += self.add_chunk(chunk[columns["country"]], regions, chunk[columns["type"]])
+                rows += len(chunk)
+        except BaseException:
+            self.keys, self.counts, self._index = keys, counts, index
+            raise
+        info = self.files[digest] = {"path": str(path), "rows": rows, "rejected": rejected}
+        return info
+
+    def table(self, level: str = "country") -> tuple[list[str], np.ndarray]:
+        """(이름 목록, 응답 수 행렬). level은 "country" 또는 "region"."""
+        counts = self.counts[: len(self.keys)]
+        if level == "region":
+            order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+            names = [f"{c}{REGION_SEPARATOR}{r}" if r else c for c, r in (self.keys[i] for i in order)]
+            return names, counts[order]
+        if level != "country":
+            raise ValueError(f"level은 'country' 또는 'region'이어야 합니다: {level!r}")
+        countries = sorted({c for c, _ in self.keys})
+        row_of = {c: i for i, c in enumerate(countries)}
+        totals = np.zeros((len(countries), len(TYPES)), dtype=np.int64)
+        np.add.at(totals, np.array([row_of[c] for c, _ in self.keys], dtype=np.intp), counts)
+        return countries, totals
+
+    def write_csv(self, out_path: str | os.PathLike[str], level: str = "country") -> Path:
+        """비율 표(기존 CSV 스키마)와 표본 크기 표(_n.csv)를 쓴다."""
+        out_path = Path(out_path)
+        names, counts = self.table(level)
+        n = counts.sum(axis=1)
+        keep = np.flatnonzero(n > 0)
+        shares = counts[keep] / n[keep, None]
+
+        def write_shares(f) -> None:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(("Country",) + TYPES)
+            for i, row in zip(keep, shares.tolist()):
+                writer.writerow([names[i]] + [f"{v:.6f}" for v in row])
+
+        def write_sizes(f) -> None:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(("Country", "N"))
+            for i in keep:
+                writer.writerow((names[i], int(n[i])))
+
+        _write_atomic(out_path, write_shares, "w")
+        sizes_path = out_path.with_name(f"{out_path.stem}_n{out_path.suffix}")
+        _write_atomic(sizes_path, write_sizes, "w")
+        return sizes_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="응답자 단위 원자료를 16유형 비율 표로 집계한다")
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--out", type=Path, required=True, help="비율 표 CSV 경로")
+    parser.add_argument("--level", choices=("country", "region"), default="country")
+    parser.add_argument("--state", type=Path, default=DEFAULT_STATE, help="누적 상태 파일")
+    parser.add_argument("--country-column", default=DEFAULT_COLUMNS["country"])
+    parser.add_argument("--region-column", default=DEFAULT_COLUMNS["region"])
+    parser.add_argument("--type-column", default=DEFAULT_COLUMNS["type"])
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--snapshot", action="store_true", help="쓴 비율 표를 mbti.snapshots에 새 판으로 기록")
+    args = parser.parse_args()
+
+    columns = {"country": args.country_column, "region": args.region_column, "type": args.type_column}
+    acc = Accumulator.open(args.state)
+    for path in args.files:
+        info = acc.add_file(path, columns, args.chunk_rows)
+        if info is not None:
+            print(f"{path}: {info['rows']:,}행 누적 (유형 코드·국가 누락 {info['rejected']:,}행)")
+        else:
+            print(f"{path}: 이미 집계한 파일이라 건너뜀")
+    acc.save(args.state)
+    sizes_path = acc.write_csv(args.out, args.level)
+    print(f"저장: {args.out}, {sizes_path}")
+    if args.snapshot:
+        from mbti.snapshots import record
+
+        print("스냅샷: " + ("새 판 기록" if record(args.out) else "같은 판이 이미 있음"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""재실행(rerun) 단위 프로파일링.
+
+페이지가 profiling.begin()으로 기록기를 켠 동안에만 stage()/timed()가 시간과
+할당 블록 수(sys.getallocatedblocks 증감)를 기록한다. tracemalloc이 켜져 있으면
+구간 시작 대비 메모리 최고 증가량도 남긴다. 꺼져 있을 때 stage()는 미리 만든 nullcontext를,
+timed()는 컨텍스트 변수 하나를 확인하고 원래 함수를 그대로 호출하므로 운영 환경에 두어도 된다.
+
+켜는 법: 환경변수 MBTI_PROFILE=1 또는 페이지 주소에 ?profile=1
+(값이 memory 이면 tracemalloc까지 켠다. 그 밖의 값은 모두 꺼짐으로 본다)
+tracemalloc은 메모리 모드로 기록 중인 재실행이 모두 finish()하면 다시 끈다.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import logging.handlers
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from mbti.store import CACHE_DIRNAME, ROOT
+
+ENV_VAR = "MBTI_PROFILE"
+METRICS_PATH = ROOT / CACHE_DIRNAME / "metrics.jsonl"
+METRICS_MAX_BYTES = 5 << 20
+METRICS_BACKUPS = 3
+
+_NULL = nullcontext()
+_current: ContextVar["Recorder | None"] = ContextVar("mbti_profiling", default=None)
+_writers: dict[Path, logging.Logger] = {}
+_memory_lock = threading.Lock()
+_memory_users = 0  # memory=True로 begin()하고 아직 finish()하지 않은 기록기 수
+_memory_owned = False  # tracemalloc을 이 모듈이 켰는지 (밖에서 켠 것은 끄지 않는다)
+
+
+@dataclass
+class Stage:
+    name: str
+    depth: int
+    seconds: float = 0.0
+    blocks: int = 0
+    peak_bytes: int | None = None
+
+
+@dataclass
+class Recorder:
+    page: str
+    started: float = field(default_factory=time.time)
+    stages: list[Stage] = field(default_factory=list)
+    memory: bool = False
+    _depth: int = 0
+    _peaks: list[int] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str):
+        entry = Stage(name, self._depth)
+        self.stages.append(entry)
+        self._depth += 1
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # 안쪽 구간이 reset_peak()로 지우기 전에 바깥 구간의 최고치를 넘겨 둔다
+            current, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            self._peaks.append(current)
+            tracemalloc.reset_peak()
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry.seconds = time.perf_counter() - start
+            entry.blocks = sys.getallocatedblocks() - blocks
+            if tracing:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                entry.peak_bytes = peak - current
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+            self._depth -= 1
+
+    @property
+    def total(self) -> float:
+        return sum(s.seconds for s in self.stages if s.depth == 0)
+
+    def rows(self) -> list[dict]:
+        return [
+            {
+                "단계": "　" * s.depth + s.name,
+                "ms": round(s.seconds * 1e3, 3),
+                "할당 블록": s.blocks,
+                "피크 KiB": None if s.peak_bytes is None else round(s.peak_bytes / 1024, 1),
+            }
+            for s in self.stages
+        ]
+
+
+def stage(name: str):
+    """기록 중이면 구간을 재고, 아니면 아무 일도 하지 않는 컨텍스트 매니저."""
+    recorder = _current.get()
+    if recorder is None:
+        return _NULL
+    return recorder.stage(name)
+
+
+def timed(name: str):
+    """함수 호출 전체를 하나의 구간으로 기록하는 데코레이터."""
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _current.get()
+            if recorder is None:
+                return func(*args, **kwargs)
+            with recorder.stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def parse_mode(value: str | None) -> str | None:
+    """MBTI_PROFILE·?profile 값 해석. "1" → "time", "memory" → "memory", 그 밖에는 None(꺼짐)."""
+    value = (value or "").strip().lower()
+    if value == "1":
+        return "time"
+    if value == "memory":
+        return "memory"
+    return None
+
+
+def begin(page: str, enabled: bool, memory: bool = False) -> Recorder | None:
+    """이번 재실행의 기록기를 켠다. enabled가 거짓이면 None."""
+    if not enabled:
+        _current.set(None)
+        return None
+    global _memory_users, _memory_owned
+    if memory:
+        # 추적은 메모리 모드로 기록 중인 재실행이 하나라도 있는 동안만 켜 둔다
+        with _memory_lock:
+            if _memory_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _memory_owned = True
+            _memory_users += 1
+    recorder = Recorder(page, memory=memory)
+    _current.set(recorder)
+    return recorder
+
+
+def finish(recorder: Recorder | None, path: Path = METRICS_PATH) -> None:
+    """기록을 끝내고 크기 제한이 있는 JSON Lines 파일에 한 줄로 덧붙인다."""
+    global _memory_users, _memory_owned
+    _current.set(None)
+    if recorder is None:
+        return
+    if recorder.memory:
+        recorder.memory = False  # 같은 기록기로 두 번 불러도 한 번만 센다
+        with _memory_lock:
+            _memory_users -= 1
+            if _memory_users == 0 and _memory_owned:
+                tracemalloc.stop()
+                _memory_owned = False
+    record = {
+        "ts": recorder.started,
+        "page": recorder.page,
+        "total_ms": round(recorder.total * 1e3, 3),
+        "stages": [
+            {"name": s.name, "depth": s.depth, "ms": round(s.seconds * 1e3, 3), "blocks": s.blocks, "peak_bytes": s.peak_bytes}
+            for s in recorder.stages
+        ],
+    }
+    _writer(path).info(json.dumps(record, ensure_ascii=False))
+
+
+def _writer(path: Path) -> logging.Logger:
+    logger = _writers.get(path)
+    if logger is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        logger = logging.getLogger(f"mbti.profiling.{path}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=METRICS_MAX_BYTES, backupCount=METRICS_BACKUPS, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        _writers[path] = logger
+    return logger
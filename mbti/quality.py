@@ -0,0 +1,113 @@
+"""16유형 비율 데이터 품질 검사와 재정규화.
+
+행렬을 한 번 훑으면서 행 합계, 음수, 결측(NaN), 중복 국가명, 누락 유형 열을 검사하고
+각 행을 합이 정확히 1인 단체(simplex) 벡터로 재정규화한다. 결과는 데이터 버전별로 캐시된다.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+
+import numpy as np
+
+from mbti.profiling import timed
+from mbti.store import TYPES, Dataset
+
+SUM_TOLERANCE = 0.005
+
+
+@dataclass(frozen=True)
+class QualityReport:
+    version: str
+    n_rows: int
+    missing_types: tuple[str, ...]
+    extra_types: tuple[str, ...]
+    duplicate_countries: tuple[str, ...]
+    nan_rows: tuple[str, ...]
+    negative_rows: tuple[str, ...]
+    off_sum_rows: tuple[tuple[str, float], ...]
+    max_sum_deviation: float
+    tolerance: float
+
+    @property
+    def ok(self) -> bool:
+        return not (
+            self.missing_types
+            or self.duplicate_countries
+            or self.nan_rows
+            or self.negative_rows
+            or self.off_sum_rows
+        )
+
+    def issues(self) -> list[str]:
+        """화면 표시용 한 줄 요약 목록."""
+        lines = []
+        if self.missing_types:
+            lines.append(f"누락된 유형 열: {', '.join(self.missing_types)}")
+        if self.extra_types:
+            lines.append(f"알 수 없는 열: {', '.join(self.extra_types)}")
+        if self.duplicate_countries:
+            lines.append(f"중복 국가명: {', '.join(self.duplicate_countries)}")
+        if self.nan_rows:
+            lines.append(f"결측값 포함 {len(self.nan_rows)}개국: {', '.join(self.nan_rows)}")
+        if self.negative_rows:
+            lines.append(f"음수 포함 {len(self.negative_rows)}개국: {', '.join(self.negative_rows)}")
+        if self.off_sum_rows:
+            worst = ", ".join(f"{c}({s:.4f})" for c, s in self.off_sum_rows[:5])
+            lines.append(f"합계가 1±{self.tolerance}를 벗어난 {len(self.off_sum_rows)}개국: {worst}")
+        return lines
+
+
+@dataclass(eq=False)
+class CleanMatrix:
+    """재정규화된 float64 행렬. 결측/음수 칸은 0으로 두고 나머지로 합을 1로 맞춘다."""
+
+    values: np.ndarray
+    report: QualityReport
+
+
+@timed("quality.check")
+def check(dataset: Dataset, tolerance: float = SUM_TOLERANCE) -> CleanMatrix:
+    raw = np.asarray(dataset.values, dtype=np.float64)
+    countries = np.asarray(dataset.countries, dtype=object)
+
+    nan_mask = np.isnan(raw)
+    neg_mask = raw < 0
+    cleaned = np.where(nan_mask | neg_mask, 0.0, raw)
+    sums = cleaned.sum(axis=1)
+    raw_sums = np.where(nan_mask, 0.0, raw).sum(axis=1)
+    deviation = np.abs(raw_sums - 1.0)
+    off = np.flatnonzero(deviation > tolerance)
+    off = off[np.argsort(-deviation[off], kind="stable")]
+
+    # 합이 0인 행(전부 결측)은 균등분포로 둔다
+    values = np.divide(cleaned, sums[:, None], out=np.full_like(cleaned, 1.0 / raw.shape[1]), where=sums[:, None] > 0)
+
+    counts = Counter(dataset.countries)
+    report = QualityReport(
+        version=dataset.version,
+        n_rows=len(dataset),
+        missing_types=tuple(t for t in TYPES if t not in dataset.types),
+        extra_types=tuple(t for t in dataset.types if t not in TYPES),
+        duplicate_countries=tuple(c for c, n in counts.items() if n > 1),
+        nan_rows=tuple(countries[nan_mask.any(axis=1)]),
+        negative_rows=tuple(countries[neg_mask.any(axis=1)]),
+        off_sum_rows=tuple((str(countries[i]), float(raw_sums[i])) for i in off),
+        max_sum_deviation=float(deviation.max()) if len(deviation) else 0.0,
+        tolerance=tolerance,
+    )
+    values.setflags(write=False)
+    return CleanMatrix(values, report)
+
+
+def clean(dataset: Dataset) -> CleanMatrix:
+    return dataset.derived("quality", check)
+
+
+def normalized(dataset: Dataset) -> np.ndarray:
+    return clean(dataset).values
+
+
+def report(dataset: Dataset) -> QualityReport:
+    return clean(dataset).report
@@ -0,0 +1,118 @@
+"""유형별 국가 순위 엔진.
+
+16개 유형 각각에 대해 내림차순 argsort와 그 역순열(순위)을 한 번만 계산해 두고,
+"유형 X 상위 N개국", "국가 C의 유형 X 순위", 백분위 조회를 슬라이스/인덱싱으로 처리한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from mbti.profiling import timed
+from mbti.quality import normalized
+from mbti.store import Dataset
+
+
+def top_k(scores: np.ndarray, k: int, largest: bool = True) -> np.ndarray:
+    """임의의 1차원 점수 벡터에서 상위(또는 하위) k개 인덱스를 정렬해 돌려준다."""
+    n = scores.shape[0]
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    keyed = -scores if largest else scores
+    if k < n:
+        part = np.argpartition(keyed, k - 1)[:k]
+    else:
+        part = np.arange(n)
+    return part[np.argsort(keyed[part], kind="stable")]
+
+
+@dataclass(eq=False)
+class RankIndex:
+    """유형(열)별 정렬 인덱스. order[t]는 내림차순 행 번호, rank[t, i]는 0부터 시작하는 순위."""
+
+    dataset: Dataset
+    values: np.ndarray
+    order: np.ndarray
+    rank: np.ndarray
+
+    @classmethod
+    @timed("ranking.build")
+    def build(cls, dataset: Dataset) -> "RankIndex":
+        values = normalized(dataset)
+        columns = np.ascontiguousarray(values.T)
+        order = np.argsort(-columns, axis=1, kind="stable").astype(np.int32)
+        n_types, n = order.shape
+        rank = np.empty_like(order)
+        positions = np.broadcast_to(np.arange(n, dtype=np.int32), (n_types, n))
+        np.put_along_axis(rank, order, positions, axis=1)
+        return cls(dataset, values, order, rank)
+
+    @classmethod
+    @timed("ranking.rebase")
+    def rebase(cls, previous: "RankIndex", dataset: Dataset, old_rows: np.ndarray, new_rows: np.ndarray) -> "RankIndex":
+        """이전 판의 순위에서 바뀐 행만 다시 끼워 넣는다.
+
+        old_rows[i](이전 판) 행과 new_rows[i](이 판) 행은 값이 같은 국가다. 나머지 행은 새로 정렬해
+        이분 탐색으로 삽입하므로 build()와 같은 (비율 내림차순, 행 번호) 순서가 나온다.
+        """
+        values = normalized(dataset)
+        n = len(dataset)
+        changed = np.setdiff1d(np.arange(n, dtype=np.int32), new_rows)
+        # 행 번호 동순위 규칙을 지키려면 남은 행의 상대 순서가 그대로여야 한다
+        if len(changed) > n // 4 or np.any(np.diff(new_rows) <= 0) or np.any(np.diff(old_rows) <= 0):
+            return cls.build(dataset)
+        old_to_new = np.full(len(previous.dataset), -1, dtype=np.int32)
+        old_to_new[old_rows] = new_rows
+        order = np.empty((len(dataset.types), n), dtype=np.int32)
+        for t in range(len(dataset.types)):
+            kept = old_to_new[previous.order[t]]
+            kept = kept[kept >= 0]
+            key = -values[kept, t]
+            ins_key = -values[changed, t]
+            ins = np.lexsort((changed, ins_key))
+            ins_rows, ins_key = changed[ins], ins_key[ins]
+            pos = np.searchsorted(key, ins_key, side="left")
+            end = np.searchsorted(key, ins_key, side="right")
+            for i in np.flatnonzero(end > pos):  # 같은 비율이면 행 번호 순
+                pos[i] += np.searchsorted(kept[pos[i]:end[i]], ins_rows[i])
+            order[t] = np.insert(kept, pos, ins_rows)
+        rank = np.empty_like(order)
+        positions = np.broadcast_to(np.arange(n, dtype=np.int32), order.shape)
+        np.put_along_axis(rank, order, positions, axis=1)
+        return cls(dataset, values, order, rank)
+
+    def top(self, mbti_type: str, k: int) -> np.ndarray:
+        return self.order[self.dataset.column(mbti_type), :k]
+
+    def bottom(self, mbti_type: str, k: int) -> np.ndarray:
+        if k <= 0:
+            return self.order[0, :0]
+        return self.order[self.dataset.column(mbti_type), -k:][::-1]
+
+    def rank_of(self, country: str, mbti_type: str) -> int:
+        """1위부터 세는 순위."""
+        return int(self.rank[self.dataset.column(mbti_type), self.dataset.row(country)]) + 1
+
+    def percentile(self, country: str, mbti_type: str) -> float:
+        """해당 유형에서 이 국가보다 비율이 낮은 국가의 백분율(0~100)."""
+        n = len(self.dataset)
+        if n <= 1:
+            return 100.0
+        below = n - self.rank_of(country, mbti_type)
+        return 100.0 * below / (n - 1)
+
+    def table(self, mbti_type: str, k: int, ascending: bool = False) -> list[tuple[int, str, float]]:
+        """(순위, 국가, 비율) 목록."""
+        col = self.dataset.column(mbti_type)
+        rows = self.bottom(mbti_type, k) if ascending else self.top(mbti_type, k)
+        return [
+            (int(self.rank[col, r]) + 1, self.dataset.countries[r], float(self.values[r, col]))
+            for r in rows
+        ]
+
+
+def rank_index(dataset: Dataset) -> RankIndex:
+    return dataset.derived("ranking", RankIndex.build)
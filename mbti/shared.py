@@ -0,0 +1,261 @@
+"""여러 워커 프로세스가 공유하는 데이터셋.
+
+원본 행렬, 재정규화 행렬, 유형별 순위 인덱스, 선호 지표 비율, 그리고 행 수가
+FULL_MATRIX_LIMIT 이하이면 세 거리 척도의 N×N 유사도 행렬까지
+multiprocessing.shared_memory 세그먼트 하나에 한 번만 올리고, 각 프로세스는
+읽기 전용 NumPy 뷰로 붙어서 쓴다. 세그먼트별로 붙어 있는 프로세스(pid)를
+.mbti_cache/shared.json 에 기록해 참조를 세고(shared.lock 파일 잠금으로 보호),
+CSV가 바뀌어 새 버전이 올라오면 더 이상 아무도 붙어 있지 않은 이전 버전 세그먼트를 해제한다.
+현재 버전 세그먼트는 다음에 뜨는 워커를 위해 참조가 없어도 남겨 둔다. 해제(unlink)해도
+프로세스 안의 매핑은 그 위에 만든 Dataset이 모두 사라질 때까지 열어 둔다.
+
+사용: 환경변수 MBTI_SHARED_MEMORY=1 이면 페이지가 mbti.shared.load()를 쓴다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import fcntl
+import json
+import os
+import struct
+import threading
+import weakref
+from contextlib import contextmanager
+from dataclasses import asdict
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+
+import numpy as np
+
+from mbti import store
+from mbti.dichotomy import Margins, margins
+from mbti.quality import CleanMatrix, QualityReport, clean
+from mbti.ranking import RankIndex, rank_index
+from mbti.similarity import FULL_MATRIX_LIMIT, METRICS, NeighbourIndex, neighbour_index
+from mbti.store import Dataset
+
+SEGMENT_PREFIX = "mbti_"
+_HEADER = struct.Struct("<q")  # 매니페스트 길이
+_ALIGN = 64
+
+_lock = threading.Lock()
+_current: "SharedDataset | None" = None
+
+
+def _segment_name(version: str) -> str:
+    return f"{SEGMENT_PREFIX}{version[:24]}"
+
+
+def _open_segment(name: str, size: int = 0) -> shared_memory.SharedMemory:
+    # 수명은 참조 카운트로 직접 관리하므로 resource_tracker가 프로세스 종료 시 지우지 않게 한다
+    shm = shared_memory.SharedMemory(name=name, create=size > 0, size=size)
+    try:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+@contextmanager
+def _registry(csv_path: Path):
+    """잠금을 잡은 채 {"current": 세그먼트명, "holders": {세그먼트명: [pid, ...]}} 레지스트리를 연다.
+
+    비정상 종료한 프로세스의 참조는 열 때마다 걸러내고, 아무도 붙어 있지 않은
+    지난 버전 세그먼트는 닫을 때 지운다.
+    """
+    cache_dir = csv_path.parent / store.CACHE_DIRNAME
+    cache_dir.mkdir(exist_ok=True)
+    registry_path = cache_dir / "shared.json"
+    with open(cache_dir / "shared.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            try:
+                with open(registry_path, encoding="utf-8") as f:
+                    registry = json.load(f)
+            except (OSError, ValueError):
+                registry = {"current": None, "holders": {}}
+            registry["holders"] = {
+                name: [pid for pid in pids if _alive(pid)] for name, pids in registry["holders"].items()
+            }
+            yield registry
+            for name, pids in list(registry["holders"].items()):
+                if not pids and name != registry["current"]:
+                    _unlink(name)
+                    del registry["holders"][name]
+            with open(registry_path, "w", encoding="utf-8") as f:
+                json.dump(registry, f)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _unlink(name: str) -> None:
+    # 추적 등록을 유지한 채 열어야 unlink()의 등록 해제가 짝이 맞는다
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shm.unlink()
+    shm.close()
+
+
+def _tables(dataset: Dataset) -> dict[str, np.ndarray]:
+    ranks = rank_index(dataset)
+    tables = {
+        "values": np.asarray(dataset.values),
+        "normalized": clean(dataset).values,
+        "rank_order": ranks.order,
+        "rank": ranks.rank,
+        "margins": margins(dataset).values,
+    }
+    if len(dataset) <= FULL_MATRIX_LIMIT:
+        # 가장 큰 파생 테이블이므로 워커마다 따로 만들지 않도록 함께 올린다
+        for metric in METRICS:
+            index = neighbour_index(dataset, metric)
+            tables[f"similarity:{metric}:values"] = index.values
+            tables[f"similarity:{metric}:aux"] = index._aux
+            tables[f"similarity:{metric}:full"] = index._full
+    return tables
+
+
+def _create(name: str, dataset: Dataset) -> shared_memory.SharedMemory:
+    tables = _tables(dataset)
+    layout = {}
+    offset = 0
+    for key, array in tables.items():
+        layout[key] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += -(-array.nbytes // _ALIGN) * _ALIGN
+    manifest = json.dumps(
+        {
+            "version": dataset.version,
+            "countries": list(dataset.countries),
+            "types": list(dataset.types),
+            "report": asdict(clean(dataset).report),
+            "tables": layout,
+        },
+        ensure_ascii=False,
+    ).encode()
+    data_start = -(-(_HEADER.size + len(manifest)) // _ALIGN) * _ALIGN
+    shm = _open_segment(name, size=data_start + max(offset, 1))
+    _HEADER.pack_into(shm.buf, 0, len(manifest))
+    shm.buf[_HEADER.size:_HEADER.size + len(manifest)] = manifest
+    for key, array in tables.items():
+        spec = layout[key]
+        view = np.ndarray(array.shape, array.dtype, buffer=shm.buf, offset=data_start + spec["offset"])
+        view[...] = array
+    return shm
+
+
+class SharedDataset:
+    """공유 메모리 세그먼트 하나에 대한 핸들. dataset 속성은 공유 뷰 위에 만든 Dataset."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, csv_path: Path):
+        self._shm = shm
+        self._csv_path = csv_path
+        (length,) = _HEADER.unpack_from(shm.buf, 0)
+        manifest = json.loads(bytes(shm.buf[_HEADER.size:_HEADER.size + length]))
+        data_start = -(-(_HEADER.size + length) // _ALIGN) * _ALIGN
+        tables = {}
+        for key, spec in manifest["tables"].items():
+            view = np.ndarray(spec["shape"], np.dtype(spec["dtype"]), buffer=shm.buf, offset=data_start + spec["offset"])
+            view.setflags(write=False)
+            tables[key] = view
+        self.name = shm.name
+        self.version = manifest["version"]
+        self.dataset = _attach_dataset(manifest, tables)
+        # NumPy 뷰는 버퍼를 붙잡지 않으므로 close()가 매핑을 바로 풀어 버린다. 세션이 아직 들고 있는
+        # Dataset(과 그것을 가리키는 파생 테이블)이 모두 사라진 뒤에만 닫는다. 종료 시에는 OS가 정리한다
+        weakref.finalize(self.dataset, shm.close).atexit = False
+
+    def release(self) -> None:
+        """참조를 하나 내려놓고, 아무도 쓰지 않는 지난 버전이면 세그먼트를 지운다.
+
+        이 프로세스의 매핑은 Dataset이 가비지 컬렉션될 때 닫힌다.
+        """
+        if self._shm is None:
+            return
+        self._shm = None
+        with _registry(self._csv_path) as registry:
+            holders = registry["holders"].get(self.name, [])
+            if os.getpid() in holders:
+                holders.remove(os.getpid())
+        self.dataset = None
+
+    def __enter__(self) -> "SharedDataset":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def _attach_dataset(manifest: dict, tables: dict[str, np.ndarray]) -> Dataset:
+    dataset = Dataset(
+        countries=tuple(manifest["countries"]),
+        types=tuple(manifest["types"]),
+        values=tables["values"],
+        version=manifest["version"],
+    )
+    report = manifest["report"]
+    for key in ("missing_types", "extra_types", "duplicate_countries", "nan_rows", "negative_rows"):
+        report[key] = tuple(report[key])
+    report["off_sum_rows"] = tuple((c, s) for c, s in report["off_sum_rows"])
+    dataset._derived.update(
+        quality=CleanMatrix(tables["normalized"], QualityReport(**report)),
+        ranking=RankIndex(dataset, tables["normalized"], tables["rank_order"], tables["rank"]),
+        dichotomy=Margins(dataset, tables["margins"]),
+    )
+    for metric in METRICS:
+        if f"similarity:{metric}:full" in tables:
+            dataset._derived[f"similarity:{metric}"] = NeighbourIndex(
+                dataset,
+                metric,
+                tables[f"similarity:{metric}:values"],
+                tables[f"similarity:{metric}:aux"],
+                tables[f"similarity:{metric}:full"],
+            )
+    return dataset
+
+
+def acquire(csv_path: str | os.PathLike[str] = store.DEFAULT_CSV) -> SharedDataset:
+    """현재 CSV 버전의 세그먼트에 붙는다. 없으면 이 프로세스가 만들어 올린다."""
+    csv_path = Path(csv_path).resolve()
+    with _registry(csv_path) as registry:
+        local = store.load(csv_path)
+        name = _segment_name(local.version)
+        try:
+            shm = _open_segment(name)
+        except FileNotFoundError:
+            # 세그먼트용 테이블은 버리는 Dataset에서 계산해, store.load() 캐시에 사본이 남지 않게 한다
+            shm = _create(name, Dataset(local.countries, local.types, local.values, local.version))
+        registry["holders"].setdefault(name, []).append(os.getpid())
+        registry["current"] = name
+        return SharedDataset(shm, csv_path)
+
+
+def load(csv_path: str | os.PathLike[str] = store.DEFAULT_CSV) -> Dataset:
+    """프로세스당 하나의 공유 핸들을 유지하며, CSV 버전이 바뀌면 새 세그먼트로 갈아탄다."""
+    global _current
+    with _lock:
+        version = store.load(csv_path).version
+        if _current is not None and _current.version == version:
+            return _current.dataset
+        previous, _current = _current, acquire(csv_path)
+        if previous is not None:
+            previous.release()
+        return _current.dataset
+
+
+@atexit.register
+def _release_current() -> None:
+    if _current is not None:
+        _current.release()
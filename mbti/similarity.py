@@ -0,0 +1,130 @@
+"""MBTI 프로필(16차원) 기반 유사 국가 검색.
+
+거리 척도는 코사인, 유클리드, 젠슨-섀넌(밑 2, 0~1) 세 가지를 지원한다.
+행 수가 FULL_MATRIX_LIMIT 이하이면 N×N 거리 행렬을 한 번 계산해 캐시하고,
+그보다 크면 N×N을 만들지 않고 행 블록 단위 행렬곱/브로드캐스팅으로 질의 행만 계산한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from mbti.profiling import timed
+from mbti.quality import normalized
+from mbti.ranking import top_k
+from mbti.store import Dataset
+
+METRICS = ("cosine", "euclidean", "jensenshannon")
+FULL_MATRIX_LIMIT = 4096
+BLOCK_ELEMENTS = 1 << 22  # 블록당 (질의 × 행 × 16) 원소 수 상한
+
+
+def _xlogx(x: np.ndarray) -> np.ndarray:
+    return np.where(x > 0, x * np.log2(np.where(x > 0, x, 1.0)), 0.0)
+
+
+@dataclass(eq=False)
+class NeighbourIndex:
+    dataset: Dataset
+    metric: str
+    values: np.ndarray
+    _aux: np.ndarray
+    _full: np.ndarray | None = field(default=None, repr=False)
+
+    @classmethod
+    def _prepare(cls, dataset: Dataset, metric: str) -> "NeighbourIndex":
+        if metric not in METRICS:
+            raise ValueError(f"지원하지 않는 거리 척도: {metric!r} (가능: {', '.join(METRICS)})")
+        values = normalized(dataset)
+        if metric == "cosine":
+            norms = np.linalg.norm(values, axis=1)
+            values = values / np.where(norms > 0, norms, 1.0)[:, None]
+            aux = norms
+        elif metric == "euclidean":
+            aux = np.einsum("ij,ij->i", values, values)
+        else:
+            aux = _xlogx(values).sum(axis=1)  # -H(P)
+        return cls(dataset, metric, values, aux)
+
+    @classmethod
+    @timed("similarity.build")
+    def build(cls, dataset: Dataset, metric: str = "cosine") -> "NeighbourIndex":
+        index = cls._prepare(dataset, metric)
+        if len(index.values) <= FULL_MATRIX_LIMIT:
+            # _full이 비어 있는 동안 distances()는 BLOCK_ELEMENTS 단위 블록으로 계산한다
+            index._full = index.distances(np.arange(len(index.values)))
+            index._full.setflags(write=False)
+        return index
+
+    @classmethod
+    @timed("similarity.rebase")
+    def rebase(cls, previous: "NeighbourIndex", dataset: Dataset, old_rows: np.ndarray, new_rows: np.ndarray) -> "NeighbourIndex":
+        """값이 같은 행끼리의 거리는 이전 판 행렬에서 옮기고, 바뀐 행의 행/열만 새로 계산한다."""
+        index = cls._prepare(dataset, previous.metric)
+        n = len(index.values)
+        if previous._full is None or n > FULL_MATRIX_LIMIT:
+            return index if n > FULL_MATRIX_LIMIT else cls.build(dataset, previous.metric)
+        if previous.dataset.countries == dataset.countries:
+            full = previous._full.copy()  # 국가 배치가 같으면 통째로 복사하고 바뀐 행/열만 덮어쓴다
+        else:
+            source = np.zeros(n, dtype=np.intp)  # 바뀐 행은 아무 행이나 가져왔다가 아래에서 덮어쓴다
+            source[new_rows] = old_rows
+            full = previous._full.take(source, axis=0).take(source, axis=1)
+        changed = np.setdiff1d(np.arange(n), new_rows)
+        block = index.distances(changed)
+        full[changed] = block
+        full[:, changed] = block.T
+        full.setflags(write=False)
+        index._full = full
+        return index
+
+    def _block(self, rows: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """질의 행 rows와 [start, stop) 구간 행 사이의 거리 (len(rows) × (stop-start))."""
+        q = self.values[rows]
+        b = self.values[start:stop]
+        if self.metric == "cosine":
+            return np.clip(1.0 - q @ b.T, 0.0, 2.0)
+        if self.metric == "euclidean":
+            sq = self._aux[rows][:, None] + self._aux[start:stop][None, :] - 2.0 * (q @ b.T)
+            return np.sqrt(np.maximum(sq, 0.0))
+        m = 0.5 * (q[:, None, :] + b[None, :, :])
+        # JS = H(M) - (H(P) + H(Q)) / 2
+        js = 0.5 * (self._aux[rows][:, None] + self._aux[start:stop][None, :]) - _xlogx(m).sum(axis=2)
+        return np.sqrt(np.clip(js, 0.0, 1.0))
+
+    def distances(self, rows: np.ndarray) -> np.ndarray:
+        """질의 행들과 전체 행 사이의 거리 행렬."""
+        rows = np.atleast_1d(np.asarray(rows, dtype=np.intp))
+        if self._full is not None:
+            return self._full[rows]
+        n = len(self.values)
+        step = max(1, BLOCK_ELEMENTS // max(1, len(rows) * self.values.shape[1]))
+        out = np.empty((len(rows), n))
+        for start in range(0, n, step):
+            stop = min(n, start + step)
+            out[:, start:stop] = self._block(rows, start, stop)
+        return out
+
+    def nearest_rows(self, rows: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """각 질의 행의 최근접 k개 (자기 자신 제외) 행 번호와 거리."""
+        rows = np.atleast_1d(np.asarray(rows, dtype=np.intp))
+        dist = self.distances(rows).copy()
+        dist[np.arange(len(rows)), rows] = np.inf
+        k = min(k, len(self.values) - 1)
+        idx = np.stack([top_k(d, k, largest=False) for d in dist]) if len(rows) else np.empty((0, k), np.intp)
+        return idx, np.take_along_axis(dist, idx, axis=1)
+
+    def nearest(self, country: str, k: int = 5) -> list[tuple[str, float]]:
+        idx, dist = self.nearest_rows(np.array([self.dataset.row(country)]), k)
+        return [(self.dataset.countries[i], float(d)) for i, d in zip(idx[0], dist[0])]
+
+
+def neighbour_index(dataset: Dataset, metric: str = "cosine") -> NeighbourIndex:
+    return dataset.derived(f"similarity:{metric}", lambda ds: NeighbourIndex.build(ds, metric))
+
+
+def similar(dataset: Dataset, country: str, k: int = 5, metric: str = "cosine") -> list[tuple[str, float]]:
+    """country와 가장 비슷한 k개국 (국가, 거리) 목록."""
+    return neighbour_index(dataset, metric).nearest(country, k)
@@ -0,0 +1,369 @@
+"""데이터셋 판(edition) 스냅샷 저장소.
+
+새 CSV 판이 들어올 때마다 직전 판 대비 바뀐 칸만 델타로 저장한다(추가·삭제 국가 포함).
+BASE_EVERY개 델타마다 전체 행렬(기준판)을 한 번 저장해 복원 경로를 짧게 유지한다.
+
+    snapshots/<CSV 이름>/manifest.json   판 목록(부모, 종류, 바뀐 행·칸 수)
+    snapshots/<CSV 이름>/<버전>.npz      기준판: countries, values
+                                        델타: rows, cols, vals (+ 국가 목록이 바뀌었으면 countries)
+
+판을 전환할 때는 이미 열린 판에서 값이 같은 행의 파생 테이블(순위, 선호 지표, 유사도)을
+이어받아 바뀐 행만 다시 계산한다(rebase_derived). 판 사이 비교는 diff()로 한다.
+
+기록 시점:
+- store.load()가 실행 중에 CSV의 새 판을 만나면 직전 판과 새 판을 함께 기록한다(on_new_edition).
+  CSV를 덮어써도 비교할 이전 판이 남는다. 환경변수 MBTI_SNAPSHOTS=0 이면 끈다.
+- 프로세스가 떠 있지 않을 때 CSV를 바꾸면 직전 판을 알 수 없으므로, 바꾸기 전에 CLI add
+  또는 mbti.ingest --snapshot 으로 기록한다.
+
+    python -m mbti.snapshots add [CSV]
+    python -m mbti.snapshots list
+    python -m mbti.snapshots diff <버전 A> <버전 B>
+"""
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from mbti import store
+from mbti.dichotomy import Margins
+from mbti.ranking import RankIndex
+from mbti.similarity import NeighbourIndex
+from mbti.store import Dataset
+
+FORMAT_VERSION = 2  # 2: 판마다 유형 열 순서(types)를 따로 저장
+SNAPSHOT_DIRNAME = "snapshots"
+BASE_EVERY = 16
+OPEN_VERSIONS = 8  # 프로세스에 열어 둘 판 수 (파생 테이블 포함)
+AUTO_RECORD = os.environ.get("MBTI_SNAPSHOTS", "1") != "0"  # store.load()가 새 판을 만나면 기록
+
+log = logging.getLogger(__name__)
+
+# 파생 테이블 키 → 이어받기 함수 (나머지 키는 필요할 때 새로 계산된다)
+REBASE = {
+    "ranking": RankIndex.rebase,
+    "dichotomy": Margins.rebase,
+}
+
+
+def _rebaser(key: str):
+    if key.startswith("similarity:"):
+        return NeighbourIndex.rebase
+    return REBASE.get(key)
+
+
+def unchanged_rows(source: Dataset, target: Dataset) -> tuple[np.ndarray, np.ndarray]:
+    """두 판에서 값이 같은 국가의 (source 행, target 행). target 행 순서로 정렬된다."""
+    idx = np.array([source._index.get(c, -1) for c in target.countries], dtype=np.int64)
+    matched = np.flatnonzero(idx >= 0)
+    a = np.asarray(source.values)[idx[matched]]
+    b = np.asarray(target.values)[matched]
+    same = ((a == b) | (np.isnan(a) & np.isnan(b))).all(axis=1)
+    return idx[matched[same]].astype(np.int32), matched[same].astype(np.int32)
+
+
+def rebase_derived(source: Dataset, target: Dataset) -> list[str]:
+    """source에 계산돼 있는 파생 테이블 중 지원하는 것을 target으로 이어받는다. 이어받은 키 목록."""
+    if source.types != target.types or source is target:
+        return []
+    keys = [k for k in list(source._derived) if _rebaser(k) is not None and k not in target._derived]
+    if not keys:
+        return []
+    old_rows, new_rows = unchanged_rows(source, target)
+    if len(new_rows) == 0:
+        return []
+    for key in keys:
+        previous = source._derived[key]
+        target.derived(key, lambda ds, rebase=_rebaser(key), prev=previous: rebase(prev, ds, old_rows, new_rows))
+    return keys
+
+
+@dataclass(frozen=True)
+class Diff:
+    """두 판 사이의 변경. 칸 단위 배열(countries/types/old/new)은 |변화량| 내림차순."""
+
+    a: str
+    b: str
+    added: tuple[str, ...]
+    removed: tuple[str, ...]
+    countries: np.ndarray
+    types: np.ndarray
+    old: np.ndarray
+    new: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.countries)
+
+    @property
+    def changed_countries(self) -> list[str]:
+        return sorted(set(self.countries.tolist()))
+
+    def by_country(self, country: str) -> dict[str, tuple[float, float]]:
+        mask = self.countries == country
+        return {t: (float(o), float(n)) for t, o, n in zip(self.types[mask], self.old[mask], self.new[mask])}
+
+    def by_type(self, mbti_type: str) -> list[tuple[str, float, float]]:
+        mask = self.types == mbti_type.upper()
+        return [(c, float(o), float(n)) for c, o, n in zip(self.countries[mask], self.old[mask], self.new[mask])]
+
+    def table(self, limit: int | None = None) -> list[tuple[str, str, float, float, float]]:
+        """(국가, 유형, 이전, 이후, 변화량) 목록."""
+        rows = zip(self.countries[:limit], self.types[:limit], self.old[:limit], self.new[:limit])
+        return [(c, t, float(o), float(n), float(n - o)) for c, t, o, n in rows]
+
+
+class SnapshotStore:
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._matrices: OrderedDict[str, tuple[tuple[str, ...], tuple[str, ...], np.ndarray]] = OrderedDict()
+        self._datasets: OrderedDict[str, Dataset] = OrderedDict()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_csv(cls, csv_path: str | os.PathLike[str] = store.DEFAULT_CSV) -> "SnapshotStore":
+        csv_path = Path(csv_path).resolve()
+        return cls(csv_path.parent / SNAPSHOT_DIRNAME / csv_path.stem)
+
+    # --- 목록 -----------------------------------------------------------------
+
+    def _manifest(self) -> dict:
+        try:
+            with open(self.directory / "manifest.json", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {"format": FORMAT_VERSION, "versions": []}
+        if manifest.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{self.directory}: 지원하지 않는 스냅샷 형식 {manifest.get('format')!r}")
+        return manifest
+
+    def versions(self) -> list[dict]:
+        """오래된 순 판 목록: {"version", "parent", "kind", "created", "types", "rows", "cells"}."""
+        return self._manifest()["versions"]
+
+    def resolve(self, prefix: str) -> str:
+        """버전 해시 접두어 → 전체 해시."""
+        found = [v["version"] for v in self.versions() if v["version"].startswith(prefix)]
+        if len(found) != 1:
+            raise KeyError(f"{'알 수 없는' if not found else '모호한'} 스냅샷 버전: {prefix!r}")
+        return found[0]
+
+    @contextmanager
+    def _locked(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / "manifest.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    # --- 기록 -----------------------------------------------------------------
+
+    def commit(self, dataset: Dataset) -> bool:
+        """판을 기록한다. 이미 있으면 False."""
+        with self._locked():
+            manifest = self._manifest()
+            entries = manifest["versions"]
+            if any(v["version"] == dataset.version for v in entries):
+                return False
+            values = np.asarray(dataset.values, dtype=np.float32)
+            entry = {"version": dataset.version, "parent": None, "kind": "base", "created": time.time(),
+                     "types": list(dataset.types), "rows": len(dataset), "cells": int(values.size)}
+            path = self.directory / f"{dataset.version}.npz"
+            since_base = next((i for i, v in enumerate(reversed(entries)) if v["kind"] == "base"), None)
+            # 열 순서까지 같아야 칸 델타가 의미가 있다(다르면 새 기준판)
+            if entries and entries[-1]["types"] == list(dataset.types) and since_base is not None and since_base + 1 < BASE_EVERY:
+                parent = entries[-1]["version"]
+                p_countries, _, p_values = self.matrix(parent)
+                p_index = {c: i for i, c in enumerate(p_countries)}
+                idx = np.array([p_index.get(c, -1) for c in dataset.countries], dtype=np.int64)
+                old = np.where(idx[:, None] >= 0, p_values[np.maximum(idx, 0)], np.nan)
+                diff = ~((old == values) | (np.isnan(old) & np.isnan(values)))
+                diff[idx < 0] = True  # 새 국가는 모든 칸
+                rows, cols = np.nonzero(diff)
+                arrays = {"rows": rows.astype(np.int32), "cols": cols.astype(np.int8), "vals": values[rows, cols]}
+                if tuple(dataset.countries) != p_countries:
+                    arrays["countries"] = np.array(dataset.countries)
+                entry.update(parent=parent, kind="delta", rows=int(len(np.unique(rows))), cells=int(len(rows)))
+            else:
+                arrays = {"countries": np.array(dataset.countries), "values": values}
+            store._write_atomic(path, lambda f: np.savez(f, **arrays), "wb")
+            entries.append(entry)
+            store._write_atomic(self.directory / "manifest.json",
+                                lambda f: json.dump(manifest, f, ensure_ascii=False, indent=1), "w")
+            return True
+
+    # --- 복원 -----------------------------------------------------------------
+
+    def matrix(self, version: str) -> tuple[tuple[str, ...], tuple[str, ...], np.ndarray]:
+        """(countries, types, values) — 가장 가까운 기준판에서 델타를 차례로 적용해 복원한다."""
+        with self._lock:
+            if version in self._matrices:
+                self._matrices.move_to_end(version)
+                return self._matrices[version]
+            manifest = self._manifest()
+            entries = {v["version"]: v for v in manifest["versions"]}
+            if version not in entries:
+                raise KeyError(f"알 수 없는 스냅샷 버전: {version!r}")
+            chain = [version]
+            while entries[chain[-1]]["kind"] == "delta" and chain[-1] not in self._matrices:
+                chain.append(entries[chain[-1]]["parent"])
+            top = chain.pop()
+            if top in self._matrices:
+                countries, _, values = self._matrices[top]
+            else:
+                with np.load(self.directory / f"{top}.npz") as z:
+                    countries, values = tuple(z["countries"].tolist()), z["values"]
+            types = tuple(entries[version]["types"])
+            for v in reversed(chain):
+                with np.load(self.directory / f"{v}.npz") as z:
+                    if "countries" in z:
+                        index = {c: i for i, c in enumerate(countries)}
+                        countries = tuple(z["countries"].tolist())
+                        idx = np.array([index.get(c, -1) for c in countries], dtype=np.int64)
+                        values = np.where(idx[:, None] >= 0, values[np.maximum(idx, 0)], np.nan).astype(np.float32)
+                    else:
+                        values = values.copy()
+                    values[z["rows"], z["cols"]] = z["vals"]
+            values.setflags(write=False)
+            self._matrices[version] = (countries, types, values)
+            while len(self._matrices) > OPEN_VERSIONS:
+                self._matrices.popitem(last=False)
+            return self._matrices[version]
+
+    def dataset(self, version: str) -> Dataset:
+        """판을 Dataset으로 연다. 가장 최근에 연 판에서 파생 테이블을 이어받는다."""
+        with self._lock:
+            if version in self._datasets:
+                self._datasets.move_to_end(version)
+                return self._datasets[version]
+            countries, types, values = self.matrix(version)
+            dataset = Dataset(countries=countries, types=types, values=values, version=version)
+            if self._datasets:
+                rebase_derived(next(reversed(self._datasets.values())), dataset)
+            self.adopt(dataset)
+            return dataset
+
+    def adopt(self, dataset: Dataset) -> None:
+        """이미 열린 Dataset(store.load 결과 등)을 판 전환용 목록에 넣는다."""
+        with self._lock:
+            self._datasets[dataset.version] = dataset
+            self._datasets.move_to_end(dataset.version)
+            while len(self._datasets) > OPEN_VERSIONS:
+                self._datasets.popitem(last=False)
+
+    # --- 비교 -----------------------------------------------------------------
+
+    def diff(self, a: str, b: str) -> Diff:
+        """판 a → b 변경 내역."""
+        a_countries, a_types, a_values = self.matrix(a)
+        b_countries, b_types, b_values = self.matrix(b)
+        return diff_matrices(a, b, a_countries, a_types, a_values, b_countries, b_types, b_values)
+
+
+def diff_matrices(a: str, b: str, a_countries, a_types, a_values, b_countries, b_types, b_values) -> Diff:
+    """국가는 이름으로, 유형 열도 이름으로 맞춰 비교한다(두 판에 모두 있는 유형만)."""
+    a_index = {c: i for i, c in enumerate(a_countries)}
+    b_set = set(b_countries)
+    common = np.array([i for i, c in enumerate(b_countries) if c in a_index], dtype=np.int64)
+    types = [t for t in b_types if t in a_types]
+    a_cols = [list(a_types).index(t) for t in types]
+    b_cols = [list(b_types).index(t) for t in types]
+    a_rows = np.array([a_index[b_countries[i]] for i in common], dtype=np.int64)
+    old = np.asarray(a_values)[np.ix_(a_rows, a_cols)]
+    new = np.asarray(b_values)[np.ix_(common, b_cols)]
+    changed = ~((old == new) | (np.isnan(old) & np.isnan(new)))
+    rows, cols = np.nonzero(changed)
+    old_v, new_v = old[rows, cols].astype(np.float64), new[rows, cols].astype(np.float64)
+    order = np.argsort(-np.abs(np.nan_to_num(new_v - old_v, nan=np.inf)), kind="stable")
+    return Diff(
+        a=a,
+        b=b,
+        added=tuple(c for c in b_countries if c not in a_index),
+        removed=tuple(c for c in a_countries if c not in b_set),
+        countries=np.asarray(b_countries, dtype=object)[common[rows]][order],
+        types=np.asarray(types, dtype=object)[cols][order],
+        old=old_v[order],
+        new=new_v[order],
+    )
+
+
+_stores: dict[Path, SnapshotStore] = {}
+
+
+def snapshots(csv_path: str | os.PathLike[str] = store.DEFAULT_CSV) -> SnapshotStore:
+    directory = SnapshotStore.for_csv(csv_path).directory
+    if directory not in _stores:
+        _stores[directory] = SnapshotStore(directory)
+    return _stores[directory]
+
+
+def on_new_edition(csv_path: str | os.PathLike[str], previous: Dataset, dataset: Dataset) -> None:
+    """store.load()가 CSV의 새 판을 감지했을 때: 파생 테이블을 이어받고, 직전 판과 새 판을 기록한다.
+
+    기록은 부가 기능이라 실패해도(읽기 전용 디렉터리 등) 로그만 남기고 새 판은 그대로 쓴다.
+    """
+    rebase_derived(previous, dataset)
+    if not AUTO_RECORD:
+        return
+    snaps = snapshots(csv_path)
+    try:
+        snaps.commit(previous)
+        snaps.commit(dataset)
+    except Exception:
+        log.exception("판 스냅샷을 기록하지 못했습니다: %s", csv_path)
+        return
+    # 판 비교에서 다시 복원하지 않도록 이미 열린 두 판(파생 테이블 포함)을 넘겨 둔다
+    snaps.adopt(previous)
+    snaps.adopt(dataset)
+
+
+def record(csv_path: str | os.PathLike[str]) -> bool:
+    """CSV의 현재 판을 스냅샷으로 기록한다(CLI add, mbti.ingest --snapshot). 새로 기록했으면 True."""
+    return snapshots(csv_path).commit(store.load(csv_path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MBTI 데이터셋 판 스냅샷")
+    parser.add_argument("--csv", default=store.DEFAULT_CSV)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="기록된 판 목록")
+    add = sub.add_parser("add", help="CSV 판을 기록")
+    add.add_argument("path", nargs="?")
+    d = sub.add_parser("diff", help="두 판 비교")
+    d.add_argument("a")
+    d.add_argument("b")
+    d.add_argument("--limit", type=int, default=30)
+    args = parser.parse_args()
+
+    snaps = snapshots(args.csv)
+    if args.command == "list":
+        for v in snaps.versions():
+            created = time.strftime("%Y-%m-%d %H:%M", time.localtime(v["created"]))
+            print(f"{v['version'][:12]}  {created}  {v['kind']:<5}  행 {v['rows']:>6}  칸 {v['cells']:>8}")
+    elif args.command == "add":
+        path = args.path or args.csv
+        dataset = store.load(path)
+        recorded = snapshots(path).commit(dataset)
+        print(("기록함" if recorded else "이미 있음") + f": {dataset.version[:12]}")
+    else:
+        diff = snaps.diff(snaps.resolve(args.a), snaps.resolve(args.b))
+        print(f"추가 {len(diff.added)}개국 · 삭제 {len(diff.removed)}개국 · 바뀐 칸 {len(diff)}개")
+        for country, mbti_type, old, new, delta in diff.table(args.limit):
+            print(f"{country:<32} {mbti_type}  {old:.4f} → {new:.4f}  ({delta:+.4f})")
+
+
+if __name__ == "__main__":
+    main()
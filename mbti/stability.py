@@ -0,0 +1,167 @@
+"""몬테카를로 순위 안정성.
+
+각 국가의 16유형 비율을 (유사 표본 크기 n의) 디리클레 또는 다항분포로 재표집해
+유형별 순위를 다시 매기고, 순위 신뢰구간과 "상위 k 안에 들 확률"을 구한다.
+재표집은 청크 단위로 프로세스 풀에 나누고(워커는 맡은 청크의 히스토그램을 합쳐 하나만
+돌려준다), 청크마다 SeedSequence.spawn()으로 시드를 고정하므로 워커 수와 무관하게 결과가
+재현된다. 캐시하는 것은 순위 누적분포이고 top_k·level은 읽을 때 적용한다.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from mbti.profiling import timed
+from mbti.quality import normalized
+from mbti.store import Dataset
+
+METHODS = ("dirichlet", "multinomial")
+CHUNK_SIZE = 256
+MAX_ROWS = 1000  # 순위 히스토그램이 (유형 × 행 × 행) 크기이므로 상한을 둔다
+
+_worker_values: np.ndarray | None = None
+
+
+@dataclass(frozen=True)
+class StabilityParams:
+    n_samples: int = 2000
+    pseudo_size: int = 1000
+    method: str = "dirichlet"
+    top_k: int = 10
+    level: float = 0.95
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.method not in METHODS:
+            raise ValueError(f"지원하지 않는 재표집 방법: {self.method!r} (가능: {', '.join(METHODS)})")
+        if self.n_samples < 1:
+            raise ValueError(f"재표집 횟수는 1 이상이어야 합니다: {self.n_samples}")
+        if self.pseudo_size < 1:
+            raise ValueError(f"유사 표본 크기는 1 이상이어야 합니다: {self.pseudo_size}")
+        if self.top_k < 1:
+            raise ValueError(f"top_k는 1 이상이어야 합니다: {self.top_k}")
+        if not 0 < self.level < 1:
+            raise ValueError(f"신뢰 수준은 0과 1 사이여야 합니다: {self.level}")
+
+
+@dataclass(eq=False)
+class StabilityResult:
+    dataset: Dataset
+    params: StabilityParams
+    lower: np.ndarray  # (국가 × 유형) 1위부터 세는 순위 구간 하한
+    median: np.ndarray
+    upper: np.ndarray
+    p_top_k: np.ndarray  # (국가 × 유형) 상위 k 안에 든 비율
+
+    def table(self, mbti_type: str, rows: np.ndarray) -> list[tuple[str, int, int, int, float]]:
+        """(국가, 하한, 중앙값, 상한, 상위 k 확률) 목록."""
+        col = self.dataset.column(mbti_type)
+        return [
+            (
+                self.dataset.countries[r],
+                int(self.lower[r, col]),
+                int(self.median[r, col]),
+                int(self.upper[r, col]),
+                float(self.p_top_k[r, col]),
+            )
+            for r in rows
+        ]
+
+
+def _resample(values: np.ndarray, size: int, params: StabilityParams, rng: np.random.Generator) -> np.ndarray:
+    if params.method == "multinomial":
+        counts = rng.multinomial(params.pseudo_size, values, size=(size, values.shape[0]))
+        return counts / params.pseudo_size
+    alpha = np.maximum(values * params.pseudo_size, 1e-3)
+    draws = rng.standard_gamma(alpha, size=(size,) + values.shape)
+    return draws / draws.sum(axis=2, keepdims=True)
+
+
+def _rank_histogram(values: np.ndarray, size: int, params: StabilityParams, seed: np.random.SeedSequence) -> np.ndarray:
+    """재표집 size번의 유형별 순위 분포 (유형 × 국가 × 순위) 도수."""
+    rng = np.random.default_rng(seed)
+    n_rows, n_types = values.shape
+    samples = _resample(values, size, params, rng)
+    # 국가 축을 마지막으로 옮겨 연속 메모리에서 정렬한다: (표본, 유형, 순위) → 행.
+    # 다항 표집은 동점이 흔하므로 동점은 난수로 가른다(정렬 순서에 맡기면 앞 행이 유리해진다)
+    keys = np.ascontiguousarray(-samples.transpose(0, 2, 1))
+    order = np.lexsort((rng.random(keys.shape), keys), axis=2)
+    # 평탄화한 (유형, 국가, 순위) 위치를 bincount로 한 번에 센다
+    flat = (np.arange(n_types)[None, :, None] * n_rows + order) * n_rows + np.arange(n_rows)[None, None, :]
+    hist = np.bincount(flat.ravel(), minlength=n_types * n_rows * n_rows)
+    return hist.reshape(n_types, n_rows, n_rows)
+
+
+def _init_worker(values: np.ndarray) -> None:
+    global _worker_values
+    _worker_values = values
+
+
+def _sum_histograms(values: np.ndarray, sizes: list[int], params: StabilityParams, seeds: list) -> np.ndarray:
+    """여러 청크의 순위 히스토그램 합. 워커는 맡은 청크를 모두 더해 하나만 돌려준다."""
+    n_rows, n_types = values.shape
+    hist = np.zeros((n_types, n_rows, n_rows), dtype=np.int64)
+    for size, seed in zip(sizes, seeds):
+        hist += _rank_histogram(values, size, params, seed)
+    return hist
+
+
+def _run_chunks(sizes: list[int], params: StabilityParams, seeds: list) -> np.ndarray:
+    return _sum_histograms(_worker_values, sizes, params, seeds)
+
+
+def _summarize(dataset: Dataset, params: StabilityParams, cdf: np.ndarray) -> StabilityResult:
+    tail = (1.0 - params.level) / 2
+
+    def quantile(q: float) -> np.ndarray:
+        return (np.argmax(cdf >= q - 1e-12, axis=2) + 1).T
+
+    k = min(params.top_k, len(dataset))
+    return StabilityResult(
+        dataset=dataset,
+        params=params,
+        lower=quantile(tail),
+        median=quantile(0.5),
+        upper=quantile(1.0 - tail),
+        p_top_k=cdf[:, :, k - 1].T,
+    )
+
+
+@timed("stability.compute")
+def rank_cdf(dataset: Dataset, params: StabilityParams, workers: int | None = None) -> np.ndarray:
+    """유형·국가별 순위 누적분포 (유형 × 국가 × 순위). top_k·level과 무관하다."""
+    if len(dataset) > MAX_ROWS:
+        raise ValueError(f"순위 안정성은 {MAX_ROWS}행 이하 데이터에서만 계산합니다 (현재 {len(dataset)}행)")
+    values = np.ascontiguousarray(normalized(dataset))
+    sizes = [min(CHUNK_SIZE, params.n_samples - start) for start in range(0, params.n_samples, CHUNK_SIZE)]
+    seeds = np.random.SeedSequence(params.seed).spawn(len(sizes))
+    workers = min(workers or os.cpu_count() or 1, len(sizes))
+
+    if workers <= 1:
+        hist = _sum_histograms(values, sizes, params, seeds)
+    else:
+        # 청크를 워커 수만큼 묶어 보내 파이프로 오가는 히스토그램을 워커당 하나로 줄인다
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(values,)) as pool:
+            parts = pool.map(_run_chunks, [sizes[w::workers] for w in range(workers)], [params] * workers,
+                             [seeds[w::workers] for w in range(workers)])
+            hist = sum(parts)
+    cdf = np.cumsum(hist, axis=2) / params.n_samples
+    cdf.setflags(write=False)
+    return cdf
+
+
+def compute(dataset: Dataset, params: StabilityParams, workers: int | None = None) -> StabilityResult:
+    return _summarize(dataset, params, rank_cdf(dataset, params, workers))
+
+
+def stability(dataset: Dataset, params: StabilityParams = StabilityParams(), workers: int | None = None) -> StabilityResult:
+    """순위 안정성 결과. 재표집 분포는 (데이터 버전, 표본 수, 유사 표본 크기, 방법, 시드)별로 캐시하고
+    top_k·level은 읽을 때 적용하므로 k를 바꿔도 다시 재표집하지 않는다. 재표집은 몇 초씩 걸리므로
+    데이터셋 전체 잠금 밖에서 계산한다."""
+    key = f"stability:{params.method}:{params.n_samples}:{params.pseudo_size}:{params.seed}"
+    cdf = dataset.derived(key, lambda ds: rank_cdf(ds, params, workers), exclusive=False)
+    return _summarize(dataset, params, cdf)
@@ -0,0 +1,217 @@
+"""countriesMBTI_16types.csv 바이너리 저장소.
+
+CSV를 한 번만 파싱해 float32 행렬(.npy)과 국가명 인덱스(.json)로 컴파일하고,
+이후에는 행렬을 메모리 매핑으로 열어 페이지 캐시를 프로세스 간에 공유한다.
+CSV의 크기/mtime이 바뀌면 해시를 다시 계산해 내용이 달라졌을 때만 재빌드한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CSV = ROOT / "countriesMBTI_16types.csv"
+CACHE_DIRNAME = ".mbti_cache"
+FORMAT_VERSION = 1
+
+# CSV 헤더 순서 그대로 (불규칙한 순서이므로 이름으로만 참조할 것)
+TYPES = (
+    "INFJ", "ISFJ", "INTP", "ISFP", "ENTP", "INFP", "ENTJ", "ISTP",
+    "INTJ", "ESFP", "ESTJ", "ENFP", "ESTP", "ISTJ", "ENFJ", "ESFJ",
+)
+
+_lock = threading.Lock()
+_loaded: dict[Path, tuple[int, int, "Dataset"]] = {}  # 경로 → (크기, mtime_ns, 데이터셋)
+
+
+@dataclass(eq=False)
+class Dataset:
+    """국가 × 16유형 비율 행렬과 파생 테이블 캐시."""
+
+    countries: tuple[str, ...]
+    types: tuple[str, ...]
+    values: np.ndarray
+    version: str
+    _index: dict[str, int] = field(default_factory=dict, repr=False)
+    _derived: dict[str, Any] = field(default_factory=dict, repr=False)
+    _derived_lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    _build_locks: dict[str, threading.Lock] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self._index:
+            self._index = {name: i for i, name in enumerate(self.countries)}
+
+    def __len__(self) -> int:
+        return len(self.countries)
+
+    def row(self, country: str) -> int:
+        try:
+            return self._index[country]
+        except KeyError:
+            raise KeyError(f"알 수 없는 국가: {country!r}") from None
+
+    def column(self, mbti_type: str) -> int:
+        try:
+            return self.types.index(mbti_type.upper())
+        except ValueError:
+            raise KeyError(f"알 수 없는 유형: {mbti_type!r}") from None
+
+    def derived(self, key: str, build: Callable[["Dataset"], Any], exclusive: bool = True) -> Any:
+        """버전별 파생 테이블을 한 번만 계산해 재사용한다.
+
+        exclusive=False이면 데이터셋 전체 잠금 대신 키별 잠금 안에서 계산하고 결과만 전체 잠금으로
+        게시한다. 몇 초씩 걸리는 빌드가 그동안 다른 파생 테이블 생성을 막지 않게 할 때 쓴다.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        if exclusive:
+            with self._derived_lock:
+                if key not in self._derived:
+                    self._derived[key] = build(self)
+                return self._derived[key]
+        with self._derived_lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            if key not in self._derived:
+                value = build(self)
+                with self._derived_lock:
+                    self._derived[key] = value
+            return self._derived[key]
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_csv(path: Path) -> tuple[list[str], tuple[str, ...], np.ndarray]:
+    import pandas as pd  # 컴파일할 때만 필요하므로 지연 임포트 (C 파서가 csv 모듈보다 수십 배 빠르다)
+
+    frame = pd.read_csv(path, encoding="utf-8-sig", skip_blank_lines=True)
+    if frame.columns.empty or frame.columns[0] != "Country":
+        raise ValueError(f"{path}: 첫 번째 열은 'Country'여야 합니다")
+    types = tuple(str(c).strip().upper() for c in frame.columns[1:])
+    countries = frame["Country"].astype(str).str.strip().tolist()
+    values = frame.iloc[:, 1:].to_numpy(dtype=np.float64)
+    return countries, types, values
+
+
+def _sidecar_paths(csv_path: Path) -> tuple[Path, Path]:
+    cache_dir = csv_path.parent / CACHE_DIRNAME
+    return cache_dir / f"{csv_path.stem}.npy", cache_dir / f"{csv_path.stem}.json"
+
+
+def _read_meta(meta_path: Path) -> dict[str, Any] | None:
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("format") == FORMAT_VERSION else None
+
+
+def _write_atomic(path: Path, write: Callable[[Any], None], mode: str) -> None:
+    """임시 파일에 쓴 뒤 os.replace로 바꿔 넣는다.
+
+    임시 파일 이름은 쓰는 쪽마다 달라서 같은 프로세스의 스레드(Streamlit 세션)가 같은 파일을
+    동시에 써도 서로의 임시 파일을 가로채지 않는다.
+    """
+    f = tempfile.NamedTemporaryFile(
+        mode, dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False,
+        **({} if "b" in mode else {"encoding": "utf-8"}),
+    )
+    try:
+        with f:
+            write(f)
+        os.replace(f.name, path)
+    except BaseException:
+        try:
+            os.unlink(f.name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def compile_csv(csv_path: Path, digest: str | None = None) -> dict[str, Any]:
+    """CSV를 파싱해 사이드카(.npy + .json)를 다시 쓴다."""
+    stat = csv_path.stat()
+    countries, types, values = parse_csv(csv_path)
+    npy_path, meta_path = _sidecar_paths(csv_path)
+    npy_path.parent.mkdir(exist_ok=True)
+    meta = {
+        "format": FORMAT_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest or _sha256(csv_path),
+        "types": list(types),
+        "countries": countries,
+    }
+    _write_atomic(npy_path, lambda f: np.save(f, values.astype(np.float32)), "wb")
+    _write_atomic(meta_path, lambda f: json.dump(meta, f, ensure_ascii=False), "w")
+    return meta
+
+
+def _fresh_meta(csv_path: Path) -> dict[str, Any]:
+    npy_path, meta_path = _sidecar_paths(csv_path)
+    meta = _read_meta(meta_path)
+    if meta is None or not npy_path.exists():
+        return compile_csv(csv_path)
+    stat = csv_path.stat()
+    if meta["size"] == stat.st_size and meta["mtime_ns"] == stat.st_mtime_ns:
+        return meta
+    # 크기/mtime만 바뀐 경우(touch, 재체크아웃)는 해시로 확인해 재파싱을 피한다
+    digest = _sha256(csv_path)
+    if digest != meta["sha256"]:
+        return compile_csv(csv_path, digest)
+    meta.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    _write_atomic(meta_path, lambda f: json.dump(meta, f, ensure_ascii=False), "w")
+    return meta
+
+
+def load(csv_path: str | os.PathLike[str] = DEFAULT_CSV) -> Dataset:
+    """데이터셋을 메모리 매핑으로 연다. 같은 버전이면 같은 객체를 돌려준다.
+
+    실행 중에 CSV 내용이 바뀐 것을 보면 직전 판과 새 판을 스냅샷으로 기록한다(mbti.snapshots.on_new_edition).
+    """
+    csv_path = Path(csv_path).resolve()
+    previous = None
+    with _lock:
+        stat = csv_path.stat()
+        cached = _loaded.get(csv_path)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        meta = _fresh_meta(csv_path)
+        if cached is not None and cached[2].version == meta["sha256"]:
+            dataset = cached[2]
+        else:
+            npy_path, _ = _sidecar_paths(csv_path)
+            dataset = Dataset(
+                countries=tuple(meta["countries"]),
+                types=tuple(meta["types"]),
+                values=np.load(npy_path, mmap_mode="r"),
+                version=meta["sha256"],
+            )
+            previous = cached[2] if cached is not None else None
+        _loaded[csv_path] = (meta["size"], meta["mtime_ns"], dataset)
+    if previous is not None:
+        # 새 판: 직전 판에서 값이 같은 행의 파생 테이블을 이어받고 두 판을 스냅샷으로 기록한다.
+        # 계산이 길 수 있으므로 전역 잠금 밖에서 하고, 그 사이 다른 스레드가 같은 테이블을 요청하면
+        # derived()의 잠금이 맞춘다
+        from mbti.snapshots import on_new_edition  # snapshots가 store를 임포트하므로 지연 임포트
+
+        on_new_edition(csv_path, previous, dataset)
+    return dataset
@@ -1 +1,195 @@
+import math
+import os
 
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import mbti
+from mbti import charts, profiling
+from mbti.clustering import KMEANS_METRICS, clusters
+from mbti.dichotomy import AXES, LABELS, TEMPERAMENTS, margins
+from mbti.filters import Predicate, filter_index
+from mbti.geo import ZOOMS, geo_join, map_chart
+from mbti.quality import report as quality_report
+from mbti.ranking import rank_index
+from mbti.similarity import FULL_MATRIX_LIMIT, METRICS, similar
+from mbti.snapshots import snapshots
+from mbti.stability import MAX_ROWS, METHODS, StabilityParams, stability
+from mbti.store import DEFAULT_CSV
+
+profile_mode = profiling.parse_mode(os.environ.get(profiling.ENV_VAR)) or profiling.parse_mode(st.query_params.get("profile"))
+recorder = profiling.begin("유형별분석", enabled=profile_mode is not None, memory=profile_mode == "memory")
+
+
+csv_path = os.environ.get("MBTI_CSV", DEFAULT_CSV)
+
+
+def get_dataset():
+    # load()는 프로세스 안에서 버전별로 같은 객체를 돌려주고 CSV가 바뀌면 새 버전을 연다
+    if os.environ.get("MBTI_SHARED_MEMORY") == "1":
+        from mbti import shared
+
+        return shared.load(csv_path)
+    return mbti.load(csv_path)
+
+
+with profiling.stage("데이터 로드"):
+    dataset = get_dataset()
+    ranks = rank_index(dataset)
+with profiling.stage("기본 차트 준비"):
+    charts.prewarm(dataset)
+
+st.title("MBTI 유형별 분석")
+st.caption(f"{len(dataset)}개국 · 16유형 · 데이터 버전 {dataset.version[:8]}")
+
+with profiling.stage("품질 보고서"):
+    quality = quality_report(dataset)
+    with st.expander("데이터 품질" + ("" if quality.ok else " ⚠️")):
+        if quality.ok:
+            st.write("모든 행이 검사를 통과했습니다.")
+        for line in quality.issues():
+            st.write(f"- {line}")
+        st.caption(f"최대 행 합계 편차 {quality.max_sum_deviation:.4f} · 분석에는 합이 1이 되도록 재정규화한 값을 사용합니다.")
+
+mbti_type = st.selectbox("유형", dataset.types)
+col_k, col_order, col_norm = st.columns(3)
+k = col_k.slider("표시할 국가 수", 5, min(50, len(dataset)), charts.DEFAULT_K)
+ascending = col_order.radio("정렬", ["높은 순", "낮은 순"], horizontal=True) == "낮은 순"
+normalization = col_norm.radio(
+    "표시 단위", charts.NORMALIZATIONS, format_func={"percent": "비율(%)", "zscore": "표준점수"}.get, horizontal=True
+)
+
+with profiling.stage("유형별 순위"):
+    top = pd.DataFrame(ranks.table(mbti_type, k, ascending), columns=["순위", "국가", "비율"])
+with profiling.stage("차트: 유형별 순위"):
+    st.vega_lite_chart(charts.ranking_chart(dataset, mbti_type, k, ascending, normalization), width="stretch")
+    st.dataframe(top.round({"비율": 4}), hide_index=True, width="stretch")
+with st.expander(f"{mbti_type} 전체 분포"):
+    with profiling.stage("차트: 전체 분포"):
+        st.vega_lite_chart(charts.distribution_chart(dataset, mbti_type, normalization), width="stretch")
+
+editions = snapshots(csv_path).versions()
+if len(editions) > 1:
+    with st.expander("데이터 판 비교"):
+        st.caption(
+            "앱이 실행 중일 때 CSV가 바뀌면 이전 판과 새 판이 자동으로 기록됩니다. "
+            "앱을 끈 채로 CSV를 바꿀 때는 먼저 `python -m mbti.snapshots add`로 현재 판을 기록하세요."
+        )
+        labels = {v["version"]: f"{v['version'][:8]} ({pd.Timestamp(v['created'], unit='s'):%Y-%m-%d})" for v in editions}
+        versions = list(reversed(labels))
+        c1, c2 = st.columns(2)
+        version_a = c1.selectbox("이전 판", versions, index=1, format_func=labels.get)
+        version_b = c2.selectbox("비교 판", versions, index=0, format_func=labels.get)
+        with profiling.stage("판 비교"):
+            snaps = snapshots(csv_path)
+            # 현재 판은 이미 연 데이터셋을 그대로 쓰고, 다른 판은 그 파생 테이블에서 이어받는다
+            snaps.adopt(dataset)
+            diff = snaps.diff(version_a, version_b)
+            side_by_side = [
+                pd.DataFrame(rank_index(snaps.dataset(v)).table(mbti_type, k, ascending), columns=["순위", "국가", "비율"])
+                for v in (version_a, version_b)
+            ]
+        st.caption(f"바뀐 칸 {len(diff)}개 · 추가 {len(diff.added)}개국 · 삭제 {len(diff.removed)}개국")
+        for col, version, table in zip(st.columns(2), (version_a, version_b), side_by_side):
+            col.markdown(f"**{labels[version]} · {mbti_type}**")
+            col.dataframe(table.round({"비율": 4}), hide_index=True, width="stretch")
+        changes = pd.DataFrame(diff.table(100), columns=["국가", "유형", "이전", "이후", "변화"])
+        st.dataframe(changes.round(4), hide_index=True, width="stretch")
+
+with st.expander("순위 안정성 (몬테카를로 재표집)"):
+    st.caption("비율은 설문 추정치입니다. 각 국가의 분포를 재표집해 순위의 95% 구간과 상위 k 진입 확률을 구합니다.")
+    if len(dataset) > MAX_ROWS:
+        st.info(f"순위 안정성은 {MAX_ROWS}개국 이하 데이터에서만 계산합니다 (현재 {len(dataset)}개국).")
+    else:
+        c1, c2, c3 = st.columns(3)
+        n_samples = c1.select_slider("재표집 횟수", [1000, 5000, 20000, 100000], 1000)
+        pseudo_size = c2.select_slider("유사 표본 크기", [100, 300, 1000, 3000, 10000], 1000)
+        method = c3.radio("방법", METHODS, format_func={"dirichlet": "디리클레", "multinomial": "다항"}.get)
+        if st.toggle("계산하기"):
+            params = StabilityParams(n_samples=n_samples, pseudo_size=pseudo_size, method=method, top_k=k)
+            with profiling.stage("순위 안정성"), st.spinner("재표집 중..."):
+                result = stability(dataset, params)
+            rows = ranks.bottom(mbti_type, k) if ascending else ranks.top(mbti_type, k)
+            ci = pd.DataFrame(result.table(mbti_type, rows), columns=["국가", "하한", "중앙값", "상한", f"상위 {k} 확률"])
+            st.dataframe(ci.round(3), hide_index=True, width="stretch")
+
+country = st.selectbox("국가별 순위 조회", dataset.countries)
+c1, c2 = st.columns(2)
+c1.metric(f"{mbti_type} 순위", f"{ranks.rank_of(country, mbti_type)} / {len(dataset)}")
+c2.metric("백분위", f"{ranks.percentile(country, mbti_type):.1f}")
+
+st.subheader(f"{country}의 선호 지표")
+with profiling.stage("선호 지표"):
+    profile = margins(dataset).profile(country)
+with profiling.stage("차트: 선호 지표"):
+    for col, (a, b) in zip(st.columns(len(AXES)), AXES):
+        col.metric(f"{a} / {b}", f"{profile[a]:.0%} / {profile[b]:.0%}")
+    st.bar_chart(pd.DataFrame({"기질": TEMPERAMENTS, "비율": [profile[t] for t in TEMPERAMENTS]}), x="기질", y="비율")
+
+st.subheader("세계 지도")
+c1, c2 = st.columns(2)
+map_label = c1.selectbox("지도에 표시할 값", dataset.types + LABELS, index=dataset.types.index(mbti_type))
+zoom = c2.radio(
+    "확대", ZOOMS, format_func={"world": "세계", "continent": f"{country} 대륙", "local": f"{country} 주변"}.get, horizontal=True
+)
+with profiling.stage("차트: 세계 지도"):
+    st.vega_lite_chart(map_chart(dataset, map_label, zoom, country, normalization), width="stretch")
+unmatched = geo_join(dataset).unmatched
+if unmatched:
+    st.caption(f"지도 경계와 이름을 맞추지 못한 국가: {', '.join(unmatched)}")
+
+st.subheader(f"{country}와(과) 비슷한 국가")
+METRIC_LABELS = {"cosine": "코사인", "euclidean": "유클리드", "jensenshannon": "젠슨-섀넌"}
+c1, c2 = st.columns(2)
+metric = c1.radio("거리 척도", METRICS, format_func=METRIC_LABELS.get, horizontal=True)
+n_similar = c2.slider("이웃 수", 1, 20, 5)
+with profiling.stage("유사 국가"):
+    neighbours = pd.DataFrame(similar(dataset, country, n_similar, metric), columns=["국가", "거리"])
+with profiling.stage("차트: 유사 국가"):
+    st.dataframe(neighbours.round({"거리": 4}), hide_index=True, width="stretch")
+
+st.subheader("성향 군집")
+c1, c2, c3 = st.columns(3)
+n_clusters = c1.slider("군집 수", 2, 10, 4)
+# 계층 군집은 N×N 거리 행렬 위에서 병합하므로 FULL_MATRIX_LIMIT 이하에서만 고를 수 있다
+cluster_methods = ["kmeans", "agglomerative"] if len(dataset) <= FULL_MATRIX_LIMIT else ["kmeans"]
+cluster_method = c2.radio("군집 방법", cluster_methods, format_func={"kmeans": "k-평균", "agglomerative": "계층(평균 연결)"}.get)
+if len(cluster_methods) == 1:
+    c2.caption(f"계층 군집은 {FULL_MATRIX_LIMIT}개국 이하에서만 지원합니다.")
+cluster_metrics = KMEANS_METRICS if cluster_method == "kmeans" else METRICS
+cluster_metric = c3.radio("군집 거리", cluster_metrics, format_func=METRIC_LABELS.get)
+with profiling.stage("성향 군집"):
+    grouping = clusters(dataset, n_clusters, cluster_metric, cluster_method)
+    summary = pd.DataFrame(grouping.centroids, columns=dataset.types)
+    summary.insert(0, "국가 수", grouping.sizes())
+    summary.insert(1, "대표 유형", [" · ".join(dataset.types[t] for t in np.argsort(-c)[:3]) for c in grouping.centroids])
+    summary.index.name = "군집"
+st.caption(f"{country}은(는) 군집 {grouping.label_of(country)}에 속합니다.")
+st.dataframe(summary.round(3), width="stretch")
+picked = st.selectbox("군집 구성 국가 보기", range(grouping.k), index=grouping.label_of(country))
+st.write(", ".join(grouping.members(picked)))
+
+st.subheader("조건 검색")
+filter_types = st.multiselect("조건을 걸 유형", dataset.types, placeholder="유형을 고르면 비율 범위를 지정할 수 있습니다")
+predicates = []
+for t in filter_types:
+    top_pct = math.ceil(ranks.values[:, dataset.column(t)].max() * 1000) / 10
+    lo, hi = st.slider(f"{t} 비율 (%)", 0.0, top_pct, (0.0, top_pct), step=0.1)
+    predicates.append(Predicate(t, "between", lo / 100, hi / 100))
+with profiling.stage("조건 검색"):
+    index = filter_index(dataset)
+    n_matches = index.count(predicates)
+    rows = index.query(predicates, limit=200)
+st.caption(f"조건을 만족하는 국가 {n_matches}개" + (" (앞 200개만 표시)" if n_matches > 200 else ""))
+if len(rows):
+    shown = list(filter_types) or [mbti_type]
+    matches = pd.DataFrame(ranks.values[rows][:, [dataset.column(t) for t in shown]], columns=shown)
+    matches.insert(0, "국가", [dataset.countries[r] for r in rows])
+    st.dataframe(matches.round(4), hide_index=True, width="stretch")
+
+if recorder is not None:
+    with st.expander(f"⏱ 프로파일 (합계 {recorder.total * 1e3:.1f} ms)"):
+        st.dataframe(pd.DataFrame(recorder.rows()), hide_index=True, width="stretch")
+        st.caption(f"기록 파일: {profiling.METRICS_PATH}")
+profiling.finish(recorder)
@@ -0,0 +1,56 @@
+import asyncio
+import hashlib
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from mbti.store import TYPES, Dataset  # noqa: E402
+
+
+def dataset(countries, values, types=TYPES) -> Dataset:
+    values = np.asarray(values, dtype=np.float32)
+    version = hashlib.sha256(repr(tuple(countries)).encode() + repr(tuple(types)).encode() + values.tobytes()).hexdigest()
+    return Dataset(countries=tuple(countries), types=tuple(types), values=values, version=version)
+
+
+def shares(rng: np.random.Generator, n: int) -> np.ndarray:
+    """합이 1인 n × 16 비율. 0.005 단위로 양자화해 같은 값(동순위)이 자주 나오게 한다."""
+    values = np.round(rng.dirichlet(np.ones(len(TYPES)), n) / 0.005) * 0.005
+    return values / values.sum(axis=1, keepdims=True)
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    return np.random.default_rng(20240611)
+
+
+@contextmanager
+def serving(handle):
+    """asyncio 연결 처리기를 백그라운드 스레드의 이벤트 루프에서 127.0.0.1 임의 포트로 띄운다. → 포트."""
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(asyncio.start_server(handle, "127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.sockets[0].getsockname()[1]
+    finally:
+        asyncio.run_coroutine_threadsafe(_shutdown(server), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+
+
+async def _shutdown(server) -> None:
+    server.close()
+    tasks = asyncio.all_tasks() - {asyncio.current_task()}  # 열린 연결의 처리기
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
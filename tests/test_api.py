@@ -0,0 +1,195 @@
+"""JSON 질의 API를 로컬 HTTP로 띄워 304, gzip, 배치, 오류 응답을 확인한다."""
+
+import asyncio
+import gzip
+import http.client
+import json
+import shutil
+import threading
+
+import pytest
+
+from conftest import ROOT, serving
+from mbti import api
+
+
+@pytest.fixture
+def client(tmp_path):
+    csv = tmp_path / "countries.csv"
+    shutil.copy(ROOT / "countriesMBTI_16types.csv", csv)
+    app = api.Server(csv)
+    with serving(app.handle) as port:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        yield conn
+        conn.close()
+
+
+def request(conn, method, path, body=None, **headers):
+    conn.request(method, path, body=body, headers={k.replace("_", "-"): v for k, v in headers.items()})
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def test_etag_and_not_modified(client):
+    response, body = request(client, "GET", "/v1/meta")
+    assert response.status == 200
+    assert json.loads(body)["countries"] > 100
+    etag = response.getheader("ETag")
+    assert etag and response.getheader("Cache-Control") == "no-cache"
+
+    response, body = request(client, "GET", "/v1/meta", If_None_Match=etag)
+    assert response.status == 304 and body == b""
+    assert response.getheader("ETag") == etag
+
+    response, _ = request(client, "GET", "/v1/meta", If_None_Match='"other"')
+    assert response.status == 200
+
+
+def test_gzip_has_its_own_etag(client):
+    path = "/v1/types/INFJ/top?k=50"
+    plain, plain_body = request(client, "GET", path)
+    zipped, zipped_body = request(client, "GET", path, Accept_Encoding="gzip")
+    assert plain.getheader("Content-Encoding") is None
+    assert zipped.getheader("Content-Encoding") == "gzip"
+    assert zipped.getheader("Vary") == "Accept-Encoding"
+    assert gzip.decompress(zipped_body) == plain_body
+    assert len(json.loads(plain_body)["items"]) == 50
+
+    plain_etag, gzip_etag = plain.getheader("ETag"), zipped.getheader("ETag")
+    assert gzip_etag == plain_etag[:-1] + '-gz"'
+    # 다른 표현의 ETag로는 304가 나오지 않는다
+    response, body = request(client, "GET", path, Accept_Encoding="gzip", If_None_Match=plain_etag)
+    assert response.status == 200 and gzip.decompress(body) == plain_body
+    response, _ = request(client, "GET", path, Accept_Encoding="gzip", If_None_Match=gzip_etag)
+    assert response.status == 304
+    response, _ = request(client, "GET", path, If_None_Match=gzip_etag)
+    assert response.status == 200
+
+
+def test_batch(client):
+    queries = [
+        {"op": "top", "type": "infj", "k": 2},
+        {"op": ["top"]},  # 해시할 수 없는 op
+        {"op": "nope"},
+        {"op": "country", "country": "Nowhere"},
+        "not an object",
+    ]
+    response, body = request(client, "POST", "/v1/batch", json.dumps({"queries": queries}),
+                             Content_Type="application/json")
+    assert response.status == 200
+    results = json.loads(body)["results"]
+    assert [r["status"] for r in results] == [200, 400, 400, 404, 400]
+    assert len(results[0]["data"]["items"]) == 2
+
+    response, _ = request(client, "POST", "/v1/batch", b"{")
+    assert response.status == 400
+    response, _ = request(client, "GET", "/v1/batch")
+    assert response.status == 405
+
+
+def test_errors(client):
+    for path, status in [("/v2/meta", 404), ("/v1/countries/Nowhere", 404),
+                         ("/v1/types/INFJ/top?k=0", 400), ("/v1/countries/South%20Korea/similar?metric=x", 400)]:
+        response, body = request(client, "GET", path)
+        assert response.status == status, path
+        assert "error" in json.loads(body)
+        assert response.getheader("ETag") is None
+
+
+def test_internal_error_keeps_connection(client, monkeypatch):
+    def broken(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(api, "route", broken)
+    response, body = request(client, "GET", "/v1/meta")
+    assert response.status == 500 and "error" in json.loads(body)
+    monkeypatch.undo()
+    response, _ = request(client, "GET", "/v1/meta")  # 같은 연결, 캐시되지 않은 정상 응답
+    assert response.status == 200
+
+
+def test_head_has_no_body(client):
+    get, body = request(client, "GET", "/v1/countries/South%20Korea")
+    head, head_body = request(client, "HEAD", "/v1/countries/South%20Korea")
+    assert get.status == head.status == 200
+    assert head_body == b"" and head.getheader("Content-Length") == str(len(body))
+
+
+class _Writer:
+    def __init__(self):
+        self.data = b""
+        self.closed = False
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def test_disconnect_mid_body_closes_quietly(tmp_path):
+    app = api.Server(tmp_path / "unused.csv")
+
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"POST /v1/batch HTTP/1.1\r\nContent-Length: 100\r\n\r\n{\"queries\"")
+        reader.feed_eof()
+        writer = _Writer()
+        await app.handle(reader, writer)  # IncompleteReadError가 처리기 밖으로 새지 않는다
+        return writer
+
+    writer = asyncio.run(run())
+    assert writer.closed and writer.data == b""
+
+
+def test_reload_runs_off_the_event_loop(tmp_path, monkeypatch):
+    csv = tmp_path / "countries.csv"
+    shutil.copy(ROOT / "countriesMBTI_16types.csv", csv)
+    app = api.Server(csv)
+    load, release = api.store.load, threading.Event()
+
+    def slow_load(path):
+        assert release.wait(5)
+        return load(path)
+
+    async def run():
+        first = await app.dataset()
+        monkeypatch.setattr(api.store, "load", slow_load)
+        app._checked = float("-inf")  # 다시 읽을 때가 됨
+        # 다시 읽는 동안에도 루프는 돌고 요청에는 직전 판으로 답한다
+        response = await asyncio.wait_for(app.respond("GET", "/v1/meta", b""), 1)
+        assert response.status == 200
+        assert app._reloading is not None
+        release.set()
+        await app._reloading
+        assert app._reloading is None and await app.dataset() is first
+
+    asyncio.run(run())
+
+
+def test_slow_query_runs_off_the_event_loop(tmp_path, monkeypatch):
+    # 첫 jensenshannon 질의처럼 파생 테이블을 만드는 동안에도 다른 요청에 답한다
+    csv = tmp_path / "countries.csv"
+    shutil.copy(ROOT / "countriesMBTI_16types.csv", csv)
+    app = api.Server(csv)
+    route, release = api.route, threading.Event()
+
+    def slow_route(dataset, method, path, params, body):
+        if path.endswith("/similar"):
+            assert release.wait(5)
+        return route(dataset, method, path, params, body)
+
+    monkeypatch.setattr(api, "route", slow_route)
+
+    async def run():
+        await app.dataset()
+        slow = asyncio.ensure_future(app.respond("GET", "/v1/countries/South%20Korea/similar?metric=jensenshannon", b""))
+        response = await asyncio.wait_for(app.respond("GET", "/v1/meta", b""), 1)
+        assert response.status == 200 and not slow.done()
+        release.set()
+        assert (await slow).status == 200
+
+    asyncio.run(run())
@@ -0,0 +1,105 @@
+"""차트 명세 캐시: 바이트 예산 LRU, 디스크 캐시와 용량 정리."""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from conftest import dataset, shares
+from mbti import charts
+from mbti.charts import ChartCache, ChartKey, downsample
+
+
+def key(i: int, version: str = "v1") -> ChartKey:
+    return ChartKey("ranking", "INFJ", i, False, "percent", version)
+
+
+def spec(size: int) -> dict:
+    return {"data": "x" * size}
+
+
+def payload_size(size: int) -> int:
+    return len(json.dumps(spec(size), separators=(",", ":")).encode())
+
+
+def test_memory_then_disk_hits(tmp_path):
+    cache = ChartCache(tmp_path)
+    built = []
+    build = lambda: built.append(1) or spec(10)  # noqa: E731
+    assert cache.get(key(1), build) == spec(10)
+    assert cache.get(key(1), build) == spec(10)
+    assert cache.hits == {"memory": 1, "disk": 0, "miss": 1}
+
+    fresh = ChartCache(tmp_path)  # 다른 프로세스: 디스크에서 읽는다
+    assert fresh.get(key(1), build) == spec(10)
+    assert fresh.hits["disk"] == 1
+    assert len(built) == 1
+
+
+def test_lru_evicts_least_recently_used_within_byte_budget(tmp_path):
+    size = payload_size(100)
+    cache = ChartCache(tmp_path, memory_budget=3 * size)
+    for i in range(3):
+        cache.get(key(i), lambda: spec(100))
+    cache.get(key(0), lambda: pytest.fail("메모리에 있어야 함"))  # 0을 최근 사용으로
+    cache.get(key(3), lambda: spec(100))
+    assert cache.memory_bytes == 3 * size
+    assert list(cache._lru) == [key(2), key(0), key(3)]  # 가장 오래 안 쓴 1이 밀려났다
+
+
+def test_oversized_payload_is_not_kept_in_memory(tmp_path):
+    cache = ChartCache(tmp_path, memory_budget=payload_size(10))
+    cache.get(key(1), lambda: spec(10))
+    cache.get(key(2), lambda: spec(1000))
+    assert list(cache._lru) == [key(1)]
+    assert cache.get(key(2), lambda: pytest.fail("디스크에 있어야 함")) == spec(1000)
+
+
+def test_disk_trim_removes_oldest_used_files(tmp_path):
+    size = payload_size(100)
+    cache = ChartCache(tmp_path, memory_budget=0, disk_budget=3 * size)
+    for i in range(3):
+        cache.get(key(i), lambda: spec(100))
+        path = tmp_path / f"{key(i).digest()}.json"
+        os.utime(path, ns=(i * 10**9, i * 10**9))
+    cache.get(key(0), lambda: pytest.fail("디스크에 있어야 함"))  # 읽으면 mtime이 갱신된다
+    cache.get(key(3), lambda: spec(100))
+    remaining = {p.name for p in tmp_path.glob("*.json")}
+    assert remaining == {f"{key(i).digest()}.json" for i in (0, 2, 3)}
+
+
+def test_downsample_keeps_ends():
+    assert list(downsample(np.arange(5), 10)) == [0, 1, 2, 3, 4]
+    picked = downsample(np.arange(10_000), 50)
+    assert len(picked) == 50 and picked[0] == 0 and picked[-1] == 9_999
+
+
+def test_ranking_chart_uses_version_key(tmp_path, monkeypatch, rng):
+    monkeypatch.setattr(charts, "_cache", ChartCache(tmp_path))
+    ds = dataset([f"C{i}" for i in range(30)], shares(rng, 30))
+    chart = charts.ranking_chart(ds, "infj", k=5)
+    values = [row["값"] for row in chart["data"]["values"]]
+    assert len(values) == 5 and values == sorted(values, reverse=True)
+    assert [row["순위"] for row in chart["data"]["values"]] == [1, 2, 3, 4, 5]
+    other = dataset(ds.countries, shares(rng, 30))
+    charts.ranking_chart(other, "INFJ", k=5)
+    assert charts.cache().hits["miss"] == 2
+
+
+def test_concurrent_misses_on_one_key(tmp_path):
+    # Streamlit 세션은 한 프로세스의 스레드이므로 같은 차트를 동시에 처음 그릴 수 있다
+    for trial in range(10):
+        cache = ChartCache(tmp_path / str(trial))
+        barrier = threading.Barrier(8)
+
+        def build():
+            barrier.wait(5)
+            return spec(20_000)
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: cache.get(key(1), build), range(8)))
+        assert all(r == spec(20_000) for r in results)
+        assert [p.name for p in (tmp_path / str(trial)).iterdir()] == [f"{key(1).digest()}.json"]
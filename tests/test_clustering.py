@@ -0,0 +1,49 @@
+"""k-평균 이어 시작(warm start)과 이전 판 수명."""
+
+import gc
+import weakref
+
+import numpy as np
+
+from conftest import dataset, shares
+from mbti import clustering
+from mbti.clustering import WARM_START_FRACTION, clusters, kmeans
+
+
+def edition(values):
+    return dataset([f"C{i}" for i in range(len(values))], values)
+
+
+def test_warm_start_after_small_change(rng):
+    values = shares(rng, 200)
+    first = kmeans(edition(values), 4)
+    assert not first.warm_started
+    changed = values.copy()
+    changed[: int(len(values) * WARM_START_FRACTION) // 2] = shares(rng, int(len(values) * WARM_START_FRACTION) // 2)
+    second = kmeans(edition(changed), 4)
+    assert second.warm_started
+    assert second.sizes().sum() == len(values)
+
+
+def test_cold_start_after_large_change(rng):
+    kmeans(edition(shares(rng, 100)), 3)
+    assert not kmeans(edition(shares(rng, 100)), 3).warm_started
+
+
+def test_previous_dataset_is_not_kept_alive(rng):
+    old = edition(shares(rng, 80))
+    clusters(old, 4)
+    ref = weakref.ref(old)
+    del old
+    gc.collect()
+    assert ref() is None
+    state = clustering._previous[(4, "euclidean")]
+    assert state.normalized.shape == (80, 16)
+    assert clusters(edition(shares(rng, 80)), 4).k == 4
+
+
+def test_agglomerative_labels_cover_all_rows(rng):
+    result = clusters(edition(shares(rng, 60)), 5, "cosine", "agglomerative")
+    assert result.k == 5
+    assert sorted(np.unique(result.labels)) == list(range(5))
+    assert sum(len(result.members(c)) for c in range(5)) == 60
@@ -0,0 +1,47 @@
+"""선호 지표·기질 투영 행렬과 국가별 비율."""
+
+import numpy as np
+import pytest
+
+from conftest import dataset, shares
+from mbti.dichotomy import AXES, LABELS, LETTERS, TEMPERAMENTS, margins, projection
+from mbti.quality import normalized
+from mbti.store import TYPES
+
+
+def test_letter_membership():
+    p = projection(TYPES)
+    assert p.shape == (len(TYPES), len(LABELS))
+    for i, code in enumerate(TYPES):
+        assert [LETTERS[j] for j in np.flatnonzero(p[i, : len(LETTERS)])] == list(code)
+    for letter in LETTERS:
+        assert p[:, LABELS.index(letter)].sum() == 8  # 글자마다 16유형의 절반
+
+
+def test_temperament_membership():
+    p = projection(TYPES)
+    members = {t: sorted(code for i, code in enumerate(TYPES) if p[i, LABELS.index(t)]) for t in TEMPERAMENTS}
+    assert members == {
+        "NT": ["ENTJ", "ENTP", "INTJ", "INTP"],
+        "NF": ["ENFJ", "ENFP", "INFJ", "INFP"],
+        "SJ": ["ESFJ", "ESTJ", "ISFJ", "ISTJ"],
+        "SP": ["ESFP", "ESTP", "ISFP", "ISTP"],
+    }
+    np.testing.assert_array_equal(p[:, len(LETTERS):].sum(axis=1), 1)  # 유형마다 기질 하나
+
+
+def test_column_order_is_by_name():
+    shuffled = TYPES[::-1]
+    np.testing.assert_array_equal(projection(shuffled), projection(TYPES)[::-1])
+
+
+def test_axis_pairs_sum_to_one(rng):
+    ds = dataset([f"C{i}" for i in range(30)], shares(rng, 30))
+    m = margins(ds)
+    for a, b in AXES:
+        np.testing.assert_allclose(m.column(a) + m.column(b), 1.0, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(m.values[:, len(LETTERS):].sum(axis=1), 1.0, rtol=0, atol=1e-12)
+    values = normalized(ds)
+    e_types = [i for i, t in enumerate(ds.types) if t[0] == "E"]
+    np.testing.assert_allclose(m.column("e"), values[:, e_types].sum(axis=1), rtol=0, atol=1e-12)
+    assert m.profile("C3")["NT"] == pytest.approx(values[3, [ds.column(t) for t in ("INTJ", "INTP", "ENTJ", "ENTP")]].sum())
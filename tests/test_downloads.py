@@ -0,0 +1,203 @@
+"""자료실 다운로드 서버를 로컬 HTTP로 띄워 ETag/304, Range, gzip 사본, 해시 URL 캐시를 확인한다."""
+
+import gzip
+import http.client
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import serving
+from homepage import downloads
+from homepage.downloads import Catalog, Server, parse_range
+
+TEXT = "".join(f"{i:04d} 자료실 샘플 줄입니다.\n" for i in range(500)).encode()
+BINARY = os.urandom(100_000)
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    monkeypatch.setattr(downloads, "GZIP_DIR", tmp_path / "gz")
+    monkeypatch.setattr(downloads, "RESCAN_INTERVAL", 0.0)
+    directory = tmp_path / "files"
+    directory.mkdir()
+    (directory / "guide.md").write_bytes(TEXT)
+    (directory / "data.bin").write_bytes(BINARY)
+    (directory / "empty.txt").write_bytes(b"")
+    (directory / "secret.txt").write_bytes(b"not listed")
+    return Catalog(directory, ["guide.md", "data.bin", "empty.txt", "missing.pdf"])
+
+
+@pytest.fixture
+def client(files):
+    with serving(Server(files).handle) as port:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        yield conn
+        conn.close()
+
+
+def get(conn, path, method="GET", **headers):
+    conn.request(method, path, headers={k.replace("_", "-"): v for k, v in headers.items()})
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def test_parse_range():
+    assert parse_range("bytes=0-9", 100) == (0, 9)
+    assert parse_range("bytes=90-", 100) == (90, 99)
+    assert parse_range("bytes=-10", 100) == (90, 99)
+    assert parse_range("bytes=95-200", 100) == (95, 99)
+    assert parse_range("bytes=-200", 100) == (0, 99)
+    assert parse_range("bytes=100-", 100) is False
+    assert parse_range("bytes=5-4", 100) is False
+    assert parse_range("bytes=-0", 100) is False
+    assert parse_range("bytes=0-1,5-6", 100) is None
+    assert parse_range("items=0-1", 100) is None
+
+
+def test_catalog(files):
+    assert set(files.manifest()) == {"guide.md", "data.bin", "empty.txt"}
+    guide = files.get("guide.md")
+    assert guide.gzip is not None and guide.gzip.size < len(TEXT)
+    assert files.get("data.bin").gzip is None
+    assert guide.hashed_name.startswith("guide.") and guide.hashed_name.endswith(".md")
+    assert files.resolve(guide.hashed_name) == (guide, True)
+    assert files.resolve("guide.md") == (guide, False)
+    assert files.get("guide.md") is guide  # 바뀌지 않았으면 다시 해시하지 않는다
+
+
+def test_full_download_and_not_modified(client):
+    response, body = get(client, "/files/data.bin")
+    assert response.status == 200 and body == BINARY
+    assert response.getheader("Cache-Control") == "no-cache"
+    assert response.getheader("Accept-Ranges") == "bytes"
+    etag = response.getheader("ETag")
+
+    response, body = get(client, "/files/data.bin", If_None_Match=etag)
+    assert response.status == 304 and body == b""
+    response, body = get(client, "/files/data.bin", If_None_Match='"stale", ' + etag)
+    assert response.status == 304
+    response, body = get(client, "/files/data.bin", method="HEAD")
+    assert response.status == 200 and body == b""
+    assert response.getheader("Content-Length") == str(len(BINARY))
+
+
+def test_range(client):
+    response, body = get(client, "/files/data.bin", Range="bytes=1000-1999")
+    assert response.status == 206 and body == BINARY[1000:2000]
+    assert response.getheader("Content-Range") == f"bytes 1000-1999/{len(BINARY)}"
+
+    response, body = get(client, "/files/data.bin", Range="bytes=-100")
+    assert response.status == 206 and body == BINARY[-100:]
+
+    response, body = get(client, "/files/data.bin", Range=f"bytes={len(BINARY)}-")
+    assert response.status == 416 and body == b""
+    assert response.getheader("Content-Range") == f"bytes */{len(BINARY)}"
+
+    # 같은 연결로 이어서 요청해도 sendfile 이후 응답 경계가 맞는다
+    response, body = get(client, "/files/data.bin", Range="bytes=0-0")
+    assert response.status == 206 and body == BINARY[:1]
+
+
+def test_if_range(client, files):
+    etag = files.get("data.bin").identity.etag
+    response, body = get(client, "/files/data.bin", Range="bytes=0-9", If_Range=etag)
+    assert response.status == 206 and body == BINARY[:10]
+    response, body = get(client, "/files/data.bin", Range="bytes=0-9", If_Range='"old"')
+    assert response.status == 200 and body == BINARY
+
+
+def test_gzip_variant(client):
+    response, plain = get(client, "/files/guide.md")
+    assert plain == TEXT and response.getheader("Content-Encoding") is None
+    plain_etag = response.getheader("ETag")
+    assert response.getheader("Vary") == "Accept-Encoding"
+
+    response, body = get(client, "/files/guide.md", Accept_Encoding="gzip, deflate")
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert gzip.decompress(body) == TEXT
+    gzip_etag = response.getheader("ETag")
+    assert gzip_etag != plain_etag and gzip_etag.endswith('-gz"')
+
+    response, _ = get(client, "/files/guide.md", Accept_Encoding="gzip", If_None_Match=plain_etag)
+    assert response.status == 200
+    response, _ = get(client, "/files/guide.md", Accept_Encoding="gzip", If_None_Match=gzip_etag)
+    assert response.status == 304
+
+    # 범위 요청은 원본 바이트 기준
+    response, body = get(client, "/files/guide.md", Accept_Encoding="gzip", Range="bytes=0-3")
+    assert response.status == 206 and body == TEXT[:4]
+    assert response.getheader("Content-Encoding") is None
+
+
+def test_hashed_url_is_immutable(client, files):
+    guide = files.get("guide.md")
+    response, body = get(client, f"/files/{guide.hashed_name}")
+    assert response.status == 200 and body == TEXT
+    assert response.getheader("Cache-Control") == downloads.IMMUTABLE
+    assert "guide.md" in response.getheader("Content-Disposition")
+
+
+def test_changed_file_gets_new_url(client, files):
+    old = files.get("guide.md")
+    (files.directory / "guide.md").write_bytes(TEXT + b"more\n")
+    new = files.get("guide.md")
+    assert new.hashed_name != old.hashed_name
+    response, _ = get(client, f"/files/{old.hashed_name}")
+    assert response.status == 404
+    response, body = get(client, f"/files/{new.hashed_name}")
+    assert body == TEXT + b"more\n"
+
+
+def test_not_served(client):
+    for path in ["/files/secret.txt", "/files/missing.pdf", "/files/../files/guide.md", "/guide.md"]:
+        response, _ = get(client, path)
+        assert response.status == 404, path
+    response, _ = get(client, "/files/guide.md", method="DELETE")
+    assert response.status == 405
+
+
+def test_empty_file_and_manifest(client, files):
+    response, body = get(client, "/files/empty.txt")
+    assert response.status == 200 and body == b""
+    response, body = get(client, "/manifest.json")
+    assert json.loads(body) == files.manifest()
+
+
+def test_public_url_only_when_configured(files, monkeypatch):
+    guide = files.get("guide.md")
+    monkeypatch.setattr(downloads, "BASE_URL", "")
+    assert guide.url is None  # 홈페이지는 "준비 중"으로 표시하고 루프백 주소를 싣지 않는다
+    assert files.manifest()["guide.md"] == f"/files/{guide.hashed_name}"
+    monkeypatch.setattr(downloads, "BASE_URL", "https://example.org/files")
+    assert guide.url == f"https://example.org/files/{guide.hashed_name}"
+    assert files.manifest()["guide.md"] == guide.url
+
+
+def test_concurrent_first_scans(files, monkeypatch):
+    # Streamlit 세션은 한 프로세스의 스레드다. 같은 gzip 사본을 동시에 만들어도 임시 파일이 겹치지 않는다
+    sha256, barrier = downloads._sha256, threading.Barrier(8)
+
+    def together(path):
+        barrier.wait(5)
+        return sha256(path)
+
+    monkeypatch.setattr(downloads, "_sha256", together)
+    separate = [Catalog(files.directory, ["guide.md"]) for _ in range(8)]
+    with ThreadPoolExecutor(8) as pool:
+        entries = list(pool.map(lambda c: c.get("guide.md"), separate))
+    assert len({e.gzip.etag for e in entries}) == 1
+    assert [p.name for p in downloads.GZIP_DIR.iterdir()] == [entries[0].gzip.path.name]
+
+    # 한 카탈로그를 함께 쓰면 다시 훑기는 한 번이다
+    monkeypatch.setattr(downloads, "RESCAN_INTERVAL", 60.0)
+    monkeypatch.setattr(downloads, "_sha256", sha256)
+    shared, calls = Catalog(files.directory, ["guide.md"]), []
+    entry = downloads._entry
+    monkeypatch.setattr(downloads, "_entry", lambda path, previous: calls.append(path) or entry(path, previous))
+    with ThreadPoolExecutor(8) as pool:
+        entries = list(pool.map(lambda _: shared.get("guide.md"), range(8)))
+    assert len(calls) == 1 and all(e is entries[0] for e in entries)
+
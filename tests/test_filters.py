@@ -0,0 +1,73 @@
+"""비트맵 필터(FilterIndex)가 정규화 행렬을 그대로 훑은 결과와 같은지."""
+
+import numpy as np
+import pytest
+
+from conftest import dataset, shares
+from mbti.filters import OPS, FilterIndex, Predicate, filter_index, query
+from mbti.quality import normalized
+from mbti.store import TYPES
+
+
+def brute_force(values: np.ndarray, types, predicates) -> np.ndarray:
+    mask = np.ones(len(values), dtype=bool)
+    for p in predicates:
+        col = values[:, list(types).index(p.mbti_type)]
+        if p.op == "between":
+            mask &= (col >= p.value) & (col <= p.upper)
+        else:
+            mask &= {">": np.greater, ">=": np.greater_equal, "<": np.less, "<=": np.less_equal}[p.op](col, p.value)
+    return np.flatnonzero(mask)
+
+
+def random_predicate(rng, values, types) -> Predicate:
+    t = int(rng.integers(len(types)))
+    col = values[:, t]
+    op = OPS[int(rng.integers(len(OPS)))]
+    # 절반은 실제 값(경계 동순위), 절반은 임의 값
+    a, b = (col[rng.integers(len(col), size=2)] if rng.random() < 0.5 else rng.uniform(0, 0.2, 2))
+    return Predicate(types[t], op, float(min(a, b)), float(max(a, b)) if op == "between" else None)
+
+
+@pytest.mark.parametrize("n, buckets", [(1, 16), (7, 16), (203, 16), (203, 1), (1000, 5)])
+def test_matches_brute_force(rng, n, buckets):
+    ds = dataset([f"C{i}" for i in range(n)], shares(rng, n))
+    values = normalized(ds)
+    index = FilterIndex.build(ds, buckets)
+    for _ in range(200):
+        predicates = [random_predicate(rng, values, ds.types) for _ in range(int(rng.integers(1, 4)))]
+        expected = brute_force(values, ds.types, predicates)
+        np.testing.assert_array_equal(index.query(predicates), expected)
+        assert index.count(predicates) == len(expected)
+        limit = int(rng.integers(1, 20))
+        np.testing.assert_array_equal(index.query(predicates, limit), expected[:limit])
+
+
+def test_no_predicates_matches_all(rng):
+    ds = dataset([f"C{i}" for i in range(13)], shares(rng, 13))
+    np.testing.assert_array_equal(query(ds, []), np.arange(13))
+    assert filter_index(ds).count([]) == 13
+
+
+def test_nothing_matches(rng):
+    ds = dataset([f"C{i}" for i in range(50)], shares(rng, 50))
+    assert len(query(ds, [Predicate("INFJ", ">", 1.0)])) == 0
+    assert len(query(ds, [Predicate("INFJ", "between", 0.5, 0.1)])) == 0
+
+
+def test_invalid_predicates(rng):
+    with pytest.raises(ValueError):
+        Predicate("INFJ", "!=", 0.1)
+    with pytest.raises(ValueError):
+        Predicate("INFJ", "between", 0.1)
+    ds = dataset(["A"], shares(rng, 1))
+    with pytest.raises(KeyError):
+        query(ds, [Predicate("XXXX", ">", 0.1)])
+
+
+def test_column_order_independent(rng):
+    values = shares(rng, 64)
+    ds = dataset([f"C{i}" for i in range(64)], values)
+    reordered = dataset(ds.countries, values[:, ::-1], TYPES[::-1])
+    predicates = [Predicate("ENTP", "<", 0.06), Predicate("INFJ", ">=", 0.04)]
+    np.testing.assert_array_equal(query(ds, predicates), query(reordered, predicates))
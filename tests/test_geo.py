@@ -0,0 +1,78 @@
+"""지도: 국가명 정규화·별칭 매칭, 확대 수준별 LOD, 화면 범위 필터."""
+
+import numpy as np
+import pytest
+
+from conftest import dataset, shares
+from mbti import geo
+from mbti.geo import ALIASES, LOCAL_MARGIN, ZOOM_LOD, GeoJoin, _in_view, _map_spec, normalize_name
+
+
+def feature_names(join: GeoJoin) -> list[str | None]:
+    countries = geo.bundle()["countries"]
+    return [countries[i]["name"] if i >= 0 else None for i in join.feature_of_row]
+
+
+def test_normalize_name():
+    assert normalize_name("Saint Vincent & the Grenadines") == "saint vincent and grenadines"
+    assert normalize_name("Côte d'Ivoire") == normalize_name("Côte d’Ivoire") == "cote divoire"
+    assert normalize_name("  The  Gambia ") == "gambia"
+    assert normalize_name("Bosnia-Herzegovina") == "bosnia herzegovina"
+
+
+def test_aliases_point_at_bundle_names_or_markers():
+    names = {normalize_name(c["name"]) for c in geo.bundle()["countries"]}
+    assert set(ALIASES.values()) <= names | set(geo.MARKERS)
+
+
+def test_join_aliases_iso_and_markers(rng):
+    countries = [
+        "Bosnia and Herzegovina", "Saint Vincent and the Grenadines", "USA", "KOR", "Atlantis", "France",
+        "Ivory Coast", "Cape Verde",
+    ]
+    ds = dataset(countries, shares(rng, len(countries)))
+    join = GeoJoin.build(ds)
+    assert feature_names(join) == [
+        "Bosnia and Herz.", None, "United States of America", "South Korea", None, "France", "Côte d'Ivoire", None,
+    ]
+    # 경계가 없는 작은 나라는 (별칭을 거친 이름으로) 점, 어디에도 없으면 unmatched
+    assert join.markers == {1: geo.MARKERS["saint vincent and grenadines"], 7: geo.MARKERS["cabo verde"]}
+    assert join.unmatched == ("Atlantis",)
+
+
+def test_in_view():
+    focus = ([10.0, 40.0, 20.0, 50.0], "Europe")
+    assert _in_view("world", focus, [150, -40, 160, -30], "Oceania")
+    assert _in_view("local", None, [150, -40, 160, -30], "Oceania")
+    assert _in_view("continent", focus, [150, -40, 160, -30], "Europe")
+    assert not _in_view("continent", focus, [12, 42, 14, 44], "Asia")
+    edge = 20.0 + LOCAL_MARGIN
+    assert _in_view("local", focus, [edge, 45, edge + 5, 46], "Asia")
+    assert not _in_view("local", focus, [edge + 0.1, 45, edge + 5, 46], "Europe")
+    assert not _in_view("local", focus, [12, 50 + LOCAL_MARGIN + 1, 14, 70], "Europe")
+
+
+@pytest.mark.parametrize("zoom", sorted(ZOOM_LOD))
+def test_map_spec_uses_zoom_lod(rng, zoom, monkeypatch):
+    ds = dataset(["France", "Germany", "Australia", "Malta"], shares(rng, 4))
+    used = []
+    geometries = geo.geometries
+    monkeypatch.setattr(geo, "geometries", lambda lod: used.append(lod) or geometries(lod))
+    spec = _map_spec(ds, "INFJ", zoom, "France", "percent")
+    assert used == [ZOOM_LOD[zoom]]
+    named = {f["properties"]["name"] for f in spec["data"]["values"]}
+    assert {"France", "Germany"} <= named
+    assert ("Australia" in named) == (zoom == "world")
+    assert [p["name"] for p in spec["layer"][2]["data"]["values"]] == ["Malta"]
+
+
+def test_unmatched_rows_do_not_colour_features(rng):
+    # 매칭되지 않은 행(-1)은 어느 경계에도 값을 주지 않는다
+    values = shares(rng, 3)
+    ds = dataset(["France", "Atlantis", "Malta"], values)
+    spec = _map_spec(ds, "INFJ", "world", None, "percent")
+    coloured = {f["properties"]["name"]: f["properties"]["value"] for f in spec["data"]["values"]
+                if f["properties"]["value"] is not None}
+    assert list(coloured) == ["France"]
+    assert coloured["France"] == pytest.approx(values[0, ds.column("INFJ")] * 100, abs=1e-3)
+    assert np.count_nonzero(GeoJoin.build(ds).feature_of_row < 0) == 2
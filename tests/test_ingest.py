@@ -0,0 +1,109 @@
+"""원자료 스트리밍 집계: 파일 단위 누적, 재수집 생략, 실패 시 되돌리기."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mbti.ingest import Accumulator
+from mbti.store import TYPES
+
+
+def write_raw(path, rows) -> None:
+    path.write_text("country,region,type\n" + "".join(f"{c},{r},{t}\n" for c, r, t in rows), encoding="utf-8")
+
+
+def counts(acc, level="country") -> dict:
+    names, table = acc.table(level)
+    return {name: dict(zip(TYPES, row.tolist())) for name, row in zip(names, table)}
+
+
+@pytest.fixture
+def day1(tmp_path):
+    path = tmp_path / "day1.csv"
+    write_raw(path, [("Korea", "Seoul", "INFJ"), ("Korea", "Busan", "infj "), ("Japan", "", "ENTP"),
+                     ("Korea", "Seoul", "XXXX"), (" ", "Seoul", "INTJ")])
+    return path
+
+
+@pytest.fixture
+def day2(tmp_path):
+    path = tmp_path / "day2.csv"
+    write_raw(path, [("Korea", "Seoul", "ESTJ"), ("France", "Paris", "INFJ")])
+    return path
+
+
+def test_add_file_counts_and_rejects(day1):
+    acc = Accumulator()
+    info = acc.add_file(day1, chunk_rows=2)
+    assert info == {"path": str(day1), "rows": 5, "rejected": 2}
+    table = counts(acc)
+    assert table["Korea"]["INFJ"] == 2 and sum(table["Korea"].values()) == 2
+    assert table["Japan"]["ENTP"] == 1
+    assert counts(acc, "region")["Korea / Busan"]["INFJ"] == 1
+
+
+def test_incremental_append_matches_single_pass(tmp_path, day1, day2):
+    state = tmp_path / "state.npz"
+    acc = Accumulator.open(state)
+    acc.add_file(day1)
+    acc.save(state)
+
+    acc = Accumulator.open(state)
+    assert acc.add_file(day2)["rows"] == 2
+    both = Accumulator()
+    both.add_file(day1)
+    both.add_file(day2)
+    assert counts(acc) == counts(both)
+    assert counts(acc)["Korea"]["ESTJ"] == 1 and counts(acc)["France"]["INFJ"] == 1
+
+
+def test_reingest_is_noop(tmp_path, day1):
+    acc = Accumulator()
+    acc.add_file(day1)
+    before = counts(acc)
+    copy = tmp_path / "renamed.csv"
+    copy.write_bytes(day1.read_bytes())
+    assert acc.add_file(day1) is None
+    assert acc.add_file(copy) is None  # 이름이 달라도 내용(sha256)이 같으면 건너뛴다
+    assert counts(acc) == before
+    assert len(acc.files) == 1
+
+
+def test_failed_file_rolls_back(tmp_path, day1, monkeypatch):
+    acc = Accumulator()
+    acc.add_file(day1)
+    before, keys = counts(acc), list(acc.keys)
+    broken = tmp_path / "broken.csv"
+    write_raw(broken, [("Italy", "Rome", "INFJ"), ("Korea", "Seoul", "INTP"), ("Spain", "Madrid", "ENFP")])
+    add_chunk = Accumulator.add_chunk
+    calls = []
+
+    def failing(self, *args):
+        calls.append(1)
+        if len(calls) == 3:  # 두 청크를 더한 뒤 실패
+            raise OSError("read error")
+        return add_chunk(self, *args)
+
+    monkeypatch.setattr(Accumulator, "add_chunk", failing)
+    with pytest.raises(OSError):
+        acc.add_file(broken, chunk_rows=1)
+    monkeypatch.setattr(Accumulator, "add_chunk", add_chunk)
+    assert counts(acc) == before
+    assert acc.keys == keys
+    assert len(acc.files) == 1
+    # 되돌린 뒤에도 새 키가 올바른 행에 누적된다
+    ok = tmp_path / "ok.csv"
+    write_raw(ok, [("Italy", "Rome", "INFJ")])
+    acc.add_file(ok)
+    assert counts(acc)["Italy"]["INFJ"] == 1
+
+
+def test_write_csv(tmp_path, day1):
+    acc = Accumulator()
+    acc.add_file(day1)
+    out = tmp_path / "shares.csv"
+    sizes_path = acc.write_csv(out)
+    shares = pd.read_csv(out)
+    assert list(shares.columns) == ["Country", *TYPES]
+    np.testing.assert_allclose(shares[list(TYPES)].sum(axis=1), 1.0, atol=1e-5)
+    assert dict(pd.read_csv(sizes_path).values.tolist()) == {"Japan": 1, "Korea": 2}
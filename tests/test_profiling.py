@@ -0,0 +1,79 @@
+"""프로파일링 켜는 값 해석, 구간 기록과 JSONL 기록, tracemalloc 수명."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from mbti import profiling
+
+
+@pytest.mark.parametrize(
+    "value, mode",
+    [("1", "time"), (" 1 ", "time"), ("memory", "memory"), ("MEMORY", "memory"),
+     ("0", None), ("", None), (None, None), ("false", None), ("yes", None), ("2", None)],
+)
+def test_parse_mode(value, mode):
+    assert profiling.parse_mode(value) == mode
+
+
+def test_disabled_records_nothing(tmp_path):
+    assert profiling.begin("test", enabled=False) is None
+    assert profiling.stage("구간") is profiling._NULL
+    profiling.finish(None, tmp_path / "metrics.jsonl")
+    assert not (tmp_path / "metrics.jsonl").exists()
+
+
+@profiling.timed("inner.func")
+def _work(n):
+    with profiling.stage("inner.stage"):
+        return sum(range(n))
+
+
+def test_nested_stages_and_jsonl(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    recorder = profiling.begin("test", enabled=True)
+    with profiling.stage("outer"):
+        assert _work(1000) == sum(range(1000))
+    with profiling.stage("second"):
+        pass
+    assert [(s.name, s.depth) for s in recorder.stages] == [
+        ("outer", 0), ("inner.func", 1), ("inner.stage", 2), ("second", 0)
+    ]
+    outer, func, inner, second = recorder.stages
+    assert outer.seconds >= func.seconds >= inner.seconds >= 0
+    assert recorder.total == pytest.approx(outer.seconds + second.seconds)
+    assert [row["단계"] for row in recorder.rows()][2] == "　　inner.stage"
+    profiling.finish(recorder, path)
+    assert profiling.stage("after") is profiling._NULL
+
+    line, = path.read_text(encoding="utf-8").splitlines()
+    record = json.loads(line)
+    assert record["page"] == "test"
+    assert record["total_ms"] == pytest.approx(recorder.total * 1e3, abs=1e-3)
+    assert [(s["name"], s["depth"]) for s in record["stages"]] == [(s.name, s.depth) for s in recorder.stages]
+    assert all(s["peak_bytes"] is None for s in record["stages"])
+
+
+def test_memory_mode_stops_tracing_when_done(tmp_path):
+    assert not tracemalloc.is_tracing()
+    first = profiling.begin("a", enabled=True, memory=True)
+    with profiling.stage("alloc"):
+        data = [bytes(1000) for _ in range(100)]
+    assert first.stages[0].peak_bytes >= 100_000
+    second = profiling.begin("b", enabled=True, memory=True)  # 다른 세션
+    profiling.finish(first, tmp_path / "m.jsonl")
+    assert tracemalloc.is_tracing()  # 아직 기록 중인 재실행이 있다
+    profiling.finish(second, tmp_path / "m.jsonl")
+    assert not tracemalloc.is_tracing()
+    del data
+
+
+def test_memory_mode_leaves_external_tracing_on(tmp_path):
+    tracemalloc.start()
+    try:
+        recorder = profiling.begin("a", enabled=True, memory=True)
+        profiling.finish(recorder, tmp_path / "m.jsonl")
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
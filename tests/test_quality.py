@@ -0,0 +1,65 @@
+"""품질 검사 보고서와 재정규화."""
+
+import numpy as np
+
+from conftest import dataset, shares
+from mbti.quality import SUM_TOLERANCE, check, clean, normalized
+from mbti.store import TYPES
+
+UNIFORM = 1 / len(TYPES)
+
+
+def test_clean_data_passes(rng):
+    ds = dataset([f"C{i}" for i in range(20)], shares(rng, 20))
+    result = check(ds)
+    assert result.report.ok and result.report.issues() == []
+    np.testing.assert_allclose(result.values.sum(axis=1), 1.0, rtol=0, atol=1e-12)
+    assert not result.values.flags.writeable
+    assert clean(ds) is clean(ds)
+
+
+def test_nan_and_negative_cells_are_zeroed():
+    values = np.full((3, len(TYPES)), UNIFORM)
+    values[0, 3] = np.nan
+    values[1, 5] = -0.01
+    result = check(dataset(["NaN", "Neg", "Ok"], values))
+    assert result.report.nan_rows == ("NaN",)
+    assert result.report.negative_rows == ("Neg",)
+    assert result.values[0, 3] == 0.0 and result.values[1, 5] == 0.0
+    np.testing.assert_allclose(result.values[0], np.where(np.arange(16) == 3, 0, 1 / 15))
+    np.testing.assert_allclose(result.values.sum(axis=1), 1.0, rtol=0, atol=1e-12)
+    assert not result.report.ok
+
+
+def test_off_sum_rows_respect_tolerance():
+    values = np.full((4, len(TYPES)), UNIFORM)
+    values[1, 0] += SUM_TOLERANCE / 2  # 허용 범위 안
+    values[2, 0] += SUM_TOLERANCE * 2
+    values[3, 0] += SUM_TOLERANCE * 6
+    report = check(dataset(["A", "B", "C", "D"], values)).report
+    assert [c for c, _ in report.off_sum_rows] == ["D", "C"]  # 편차가 큰 순
+    assert abs(report.off_sum_rows[0][1] - (1 + SUM_TOLERANCE * 6)) < 1e-6
+    assert abs(report.max_sum_deviation - SUM_TOLERANCE * 6) < 1e-6
+    assert check(dataset(["A", "B", "C", "D"], values), tolerance=0.1).report.off_sum_rows == ()
+    np.testing.assert_allclose(normalized(dataset(["A", "B", "C", "D"], values)).sum(axis=1), 1.0, rtol=0, atol=1e-12)
+
+
+def test_duplicate_and_missing_columns():
+    types = TYPES[:-1] + ("XXXX",)
+    values = np.full((3, len(TYPES)), UNIFORM)
+    report = check(dataset(["Korea", "Japan", "Korea"], values, types)).report
+    assert report.duplicate_countries == ("Korea",)
+    assert report.missing_types == (TYPES[-1],)
+    assert report.extra_types == ("XXXX",)
+    assert any("중복" in line for line in report.issues())
+    assert any("누락" in line for line in report.issues())
+
+
+def test_all_zero_or_missing_rows_become_uniform():
+    values = np.full((3, len(TYPES)), UNIFORM)
+    values[0] = 0.0
+    values[1] = np.nan
+    result = check(dataset(["Zero", "Missing", "Ok"], values))
+    np.testing.assert_array_equal(result.values[:2], UNIFORM)
+    assert result.report.nan_rows == ("Missing",)
+    assert [c for c, _ in result.report.off_sum_rows] == ["Zero", "Missing"]
@@ -0,0 +1,62 @@
+"""유형별 순위 인덱스와 top_k."""
+
+import numpy as np
+import pytest
+
+from conftest import dataset, shares
+from mbti.ranking import RankIndex, rank_index, top_k
+from mbti.store import TYPES
+
+
+@pytest.mark.parametrize("largest", [True, False])
+@pytest.mark.parametrize("k", [0, 1, 7, 50, 60])
+def test_top_k_matches_full_sort(rng, k, largest):
+    scores = np.round(rng.random(50), 1)  # 동점이 많다
+    picked = top_k(scores, k, largest)
+    ordered = np.sort(scores)[::-1] if largest else np.sort(scores)
+    assert len(picked) == min(k, 50)
+    np.testing.assert_array_equal(scores[picked], ordered[: len(picked)])
+
+
+def test_ties_keep_row_order():
+    values = np.full((4, len(TYPES)), 1 / len(TYPES))
+    values[2, 0], values[2, 1] = 0.2, 1 / len(TYPES) * 2 - 0.2
+    ds = dataset(["A", "B", "C", "D"], values)
+    ranks = RankIndex.build(ds)
+    assert list(ranks.top(TYPES[0], 4)) == [2, 0, 1, 3]  # 같은 비율이면 행 번호 순
+    assert list(ranks.bottom(TYPES[0], 2)) == [3, 1]
+    assert ranks.rank_of("A", TYPES[0]) == 2 and ranks.rank_of("D", TYPES[0]) == 4
+
+
+def test_matches_argsort_and_tables(rng):
+    ds = dataset([f"C{i}" for i in range(40)], shares(rng, 40))
+    ranks = rank_index(ds)
+    assert rank_index(ds) is ranks
+    for t, mbti_type in enumerate(TYPES):
+        column = ranks.values[:, t]
+        np.testing.assert_array_equal(ranks.order[t], np.argsort(-column, kind="stable"))
+        table = ranks.table(mbti_type, 5)
+        assert [r for r, _, _ in table] == [1, 2, 3, 4, 5]
+        assert [s for _, _, s in table] == sorted(column, reverse=True)[:5]
+        low = ranks.table(mbti_type, 3, ascending=True)
+        assert [r for r, _, _ in low] == [40, 39, 38]
+    assert len(ranks.bottom("INFJ", 0)) == 0
+
+
+def test_percentile():
+    values = np.full((3, len(TYPES)), 1 / len(TYPES))
+    values[:, 0] += [0.03, 0.0, -0.03]
+    values[:, 1] -= [0.03, 0.0, -0.03]
+    ranks = RankIndex.build(dataset(["A", "B", "C"], values))
+    assert [ranks.percentile(c, TYPES[0]) for c in "ABC"] == [100.0, 50.0, 0.0]
+    single = RankIndex.build(dataset(["Only"], values[:1]))
+    assert single.percentile("Only", "INFJ") == 100.0
+    assert single.rank_of("Only", "INFJ") == 1
+
+
+def test_unknown_names():
+    ranks = RankIndex.build(dataset(["A"], np.full((1, len(TYPES)), 1 / len(TYPES))))
+    with pytest.raises(KeyError):
+        ranks.rank_of("Nowhere", "INFJ")
+    with pytest.raises(KeyError):
+        ranks.top("XXXX", 1)
@@ -0,0 +1,96 @@
+"""판 전환 시 파생 테이블 이어받기(rebase)가 처음부터 계산한 결과(build)와 같은지."""
+
+import numpy as np
+import pytest
+
+from conftest import dataset, shares
+from mbti import similarity
+from mbti.dichotomy import Margins
+from mbti.ranking import RankIndex, rank_index
+from mbti.similarity import METRICS, NeighbourIndex, neighbour_index
+from mbti.snapshots import rebase_derived, unchanged_rows
+
+
+def editions(rng, n=300):
+    """(이전 판, 새 판). 새 판은 일부 행 값 변경, 삭제, 추가, 그리고 동순위 행을 포함한다."""
+    values = shares(rng, n)
+    values[10:20] = values[5]  # 열마다 같은 값이 여러 행
+    countries = [f"C{i:04d}" for i in range(n)]
+    old = dataset(countries, values)
+
+    keep = np.setdiff1d(np.arange(n), [3, 50, 51, 299])
+    new_values = values[keep].copy()
+    new_values[[0, 7, 40, 41]] = shares(rng, 4)
+    new_values[100] = values[5]  # 바뀐 행이 기존 동순위 무리에 끼어든다
+    added = shares(rng, 6)
+    added[0] = values[5]
+    new_countries = [countries[i] for i in keep] + [f"N{i}" for i in range(len(added))]
+    new = dataset(new_countries, np.vstack([new_values, added]))
+    return old, new
+
+
+def test_unchanged_rows(rng):
+    old, new = editions(rng)
+    old_rows, new_rows = unchanged_rows(old, new)
+    assert len(old_rows) == len(new_rows) == len(new) - 6 - 5
+    assert [old.countries[i] for i in old_rows] == [new.countries[i] for i in new_rows]
+    np.testing.assert_array_equal(np.asarray(old.values)[old_rows], np.asarray(new.values)[new_rows])
+
+
+def test_rank_index(rng):
+    old, new = editions(rng)
+    rebased = RankIndex.rebase(RankIndex.build(old), new, *unchanged_rows(old, new))
+    built = RankIndex.build(new)
+    np.testing.assert_array_equal(rebased.order, built.order)
+    np.testing.assert_array_equal(rebased.rank, built.rank)
+
+
+def test_rank_index_many_changes_falls_back(rng):
+    old, _ = editions(rng)
+    new = dataset(old.countries, shares(rng, len(old)))
+    new.values[: len(old) // 2] = old.values[: len(old) // 2]
+    rebased = RankIndex.rebase(RankIndex.build(old), new, *unchanged_rows(old, new))
+    np.testing.assert_array_equal(rebased.order, RankIndex.build(new).order)
+
+
+def test_margins(rng):
+    old, new = editions(rng)
+    rebased = Margins.rebase(Margins.build(old), new, *unchanged_rows(old, new))
+    np.testing.assert_allclose(rebased.values, Margins.build(new).values, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("metric", METRICS)
+def test_neighbour_index(rng, metric):
+    old, new = editions(rng)
+    rebased = NeighbourIndex.rebase(NeighbourIndex.build(old, metric), new, *unchanged_rows(old, new))
+    built = NeighbourIndex.build(new, metric)
+    np.testing.assert_allclose(rebased._full, built._full, rtol=0, atol=1e-7)
+    assert [c for c, _ in rebased.nearest("N1", 5)] == [c for c, _ in built.nearest("N1", 5)]
+
+
+@pytest.mark.parametrize("metric", METRICS)
+def test_blocked_distances_match_full_matrix(rng, metric, monkeypatch):
+    old, _ = editions(rng, n=120)
+    full = NeighbourIndex.build(old, metric)
+    monkeypatch.setattr(similarity, "BLOCK_ELEMENTS", 16 * 7)  # 여러 블록으로 나뉘게
+    blocked = NeighbourIndex.build(old, metric)
+    np.testing.assert_allclose(blocked._full, full._full, rtol=0, atol=1e-7)
+    streamed = NeighbourIndex._prepare(old, metric)
+    np.testing.assert_allclose(streamed.distances(np.array([0, 5, 119])), full._full[[0, 5, 119]], rtol=0, atol=1e-7)
+
+
+def test_rebase_derived(rng):
+    old, new = editions(rng)
+    rank_index(old)
+    neighbour_index(old, "euclidean")
+    assert sorted(rebase_derived(old, new)) == ["ranking", "similarity:euclidean"]
+    np.testing.assert_array_equal(rank_index(new).order, RankIndex.build(new).order)
+    np.testing.assert_allclose(neighbour_index(new, "euclidean")._full,
+                               NeighbourIndex.build(new, "euclidean")._full, rtol=0, atol=1e-7)
+
+
+def test_rebase_derived_skips_different_types(rng):
+    old, new = editions(rng)
+    rank_index(old)
+    reordered = dataset(new.countries, np.asarray(new.values)[:, ::-1], new.types[::-1])
+    assert rebase_derived(old, reordered) == []
@@ -0,0 +1,119 @@
+"""사이트 검색: 한글 바이그램, 접두어·오타 확장, 추가 후 저장·불러오기 왕복."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from homepage import search
+from homepage.search import Doc, SearchIndex, documents, edit_distance, tokens
+
+DOCS = [
+    Doc("p1", "프로그램", "인공지능 수업 설계", "초등 교사를 위한 AI 수업 루브릭", "programs"),
+    Doc("p2", "프로그램", "데이터 과학 캠프", "Python pandas 실습과 시각화", "programs"),
+    Doc("e1", "행사", "정보교육 세미나", "서울 연구회 발표", "events"),
+    Doc("r1", "자료", "평가 루브릭 양식", "rubric template", "resources"),
+]
+
+
+@pytest.fixture
+def idx():
+    return SearchIndex.build(DOCS)
+
+
+def keys(hits):
+    return [h.doc.key for h in hits]
+
+
+def test_tokens():
+    assert tokens("인공지능을") == ["인공", "공지", "지능", "능을"]
+    assert tokens("AI 수업, Python3") == ["ai", "수업", "python3"]
+    assert tokens("가") == ["가"]
+
+
+def test_edit_distance():
+    assert edit_distance("pandas", "pandas", 1) == 0
+    assert edit_distance("pandsa", "pandas", 2) == 2
+    assert edit_distance("rubric", "python", 1) == 2  # limit 초과는 limit + 1
+
+
+def test_korean_bigrams_match_inflected_forms(idx):
+    assert keys(idx.search("인공지능을"))[0] == "p1"
+    assert keys(idx.search("루브릭 평가"))[0] == "r1"
+    assert set(keys(idx.search("루브릭"))) == {"p1", "r1"}
+
+
+def test_prefix_expansion_of_last_word(idx):
+    assert keys(idx.search("pan")) == ["p2"]
+    assert keys(idx.search("세미"))[0] == "e1"
+    assert idx.search("pan ") == []  # 어절이 끝나면 접두어로 확장하지 않는다
+
+
+def test_typo_tolerance(idx):
+    assert keys(idx.search("pythn")) == ["p2"]
+    assert keys(idx.search("rubrik"))[0] == "r1"
+    assert idx.search("zzzz") == []
+
+
+def test_title_outweighs_body(idx):
+    hits = idx.search("루브릭")
+    assert hits[0].doc.key == "r1" and hits[0].score > hits[1].score
+
+
+def test_add_replaces_and_round_trips(idx, tmp_path):
+    idx.add(Doc("e2", "행사", "코딩 해커톤", "고등학생 팀 프로젝트", "events"))
+    idx.add(Doc("p2", "프로그램", "데이터 과학 캠프", "R 실습", "programs"))  # 같은 key는 교체
+    assert keys(idx.search("해커톤")) == ["e2"]
+    assert idx.search("pandas") == []
+    path = tmp_path / "search.idx"
+    idx.save(path)
+    loaded = SearchIndex.load(path)
+    assert len(loaded.docs) == len(DOCS) + 1 and not loaded.extra
+    for query in ["해커톤", "인공지능", "루브릭 평가", "pythn", "세미"]:
+        assert [(h.doc, round(h.score, 9)) for h in loaded.search(query)] == \
+               [(h.doc, round(h.score, 9)) for h in idx.search(query)], query
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "not.idx"
+    path.write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        SearchIndex.load(path)
+
+
+def test_site_content_is_searchable():
+    idx = SearchIndex.build(documents())
+    assert all(d.anchor for d in idx.docs)
+    title = idx.docs[0].title
+    assert idx.search(title)[0].doc == idx.docs[0]
+
+
+def test_concurrent_saves_use_separate_temp_files(tmp_path, monkeypatch):
+    compact, barrier = SearchIndex.compact, threading.Barrier(8)
+
+    def together(self):
+        compact(self)
+        barrier.wait(5)
+
+    monkeypatch.setattr(SearchIndex, "compact", together)
+    path = tmp_path / "search.idx"
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: SearchIndex.build(DOCS).save(path), range(8)))
+    assert [p.name for p in tmp_path.iterdir()] == ["search.idx"]
+    assert len(SearchIndex.load(path).docs) == len(DOCS)
+
+
+def test_index_is_built_once_across_threads(tmp_path, monkeypatch):
+    monkeypatch.setattr(search, "_index", None)
+    build, built = SearchIndex.build, []
+
+    def slow_build(docs):
+        built.append(1)
+        time.sleep(0.05)
+        return build(docs)
+
+    monkeypatch.setattr(SearchIndex, "build", staticmethod(slow_build))
+    with ThreadPoolExecutor(8) as pool:
+        made = list(pool.map(lambda _: search.index(tmp_path / "search.idx"), range(8)))
+    assert len(built) == 1 and all(i is made[0] for i in made)
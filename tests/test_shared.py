@@ -0,0 +1,62 @@
+"""공유 메모리 데이터셋의 판 전환과 매핑 수명."""
+
+import gc
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from mbti import shared
+from mbti.ranking import rank_index
+from mbti.store import TYPES
+
+
+def write_csv(path, values, countries) -> None:
+    lines = ["Country," + ",".join(TYPES)]
+    lines += [f"{c}," + ",".join(f"{v:.6f}" for v in row) for c, row in zip(countries, values)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))  # 같은 초 안에 다시 써도 새 판으로 보이게
+
+
+@pytest.fixture
+def csv_path(tmp_path, rng):
+    path = tmp_path / "mbti.csv"
+    write_csv(path, rng.dirichlet(np.ones(len(TYPES)), 30), [f"C{i}" for i in range(30)])
+    yield path
+    if shared._current is not None:
+        name = shared._current.name
+        shared._current.release()
+        shared._current = None
+        shared._unlink(name)
+
+
+def test_load_reuses_segment_for_same_version(csv_path):
+    ds = shared.load(csv_path)
+    assert shared.load(csv_path) is ds
+    assert not ds.values.flags.writeable
+    assert rank_index(ds) is ds._derived["ranking"]
+
+
+def test_version_swap_keeps_held_views(csv_path, rng):
+    ds = shared.load(csv_path)
+    ranks = rank_index(ds)
+    expected = ranks.order.copy()
+    old = shared._current
+    old_shm = old._shm
+
+    write_csv(csv_path, rng.dirichlet(np.ones(len(TYPES)), 31), [f"C{i}" for i in range(31)])
+    new = shared.load(csv_path)
+    assert new.version != ds.version
+    # 아무도 붙어 있지 않은 이전 판 세그먼트는 이름이 지워지지만 매핑은 살아 있다
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=old.name)
+    assert old_shm._mmap is not None
+    np.testing.assert_array_equal(ranks.order, expected)
+    np.testing.assert_array_equal(np.asarray(ds.values)[0], np.asarray(ranks.dataset.values)[0])
+
+    del ds, ranks
+    gc.collect()
+    assert old_shm._mmap is None
+    assert len(new) == 31
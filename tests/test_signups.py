@@ -0,0 +1,96 @@
+"""가입 신청 큐: 검증, 이메일 병합, 멱등 키, 기록 실패 재시도."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from homepage import signups
+from homepage.signups import QueueFull, Signup, SignupQueue
+
+
+def rows(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT email, name, affiliation, created_at, updated_at FROM signups ORDER BY email").fetchall()
+
+
+def test_from_form():
+    s = Signup.from_form("  홍길동 ", " Hong@Example.COM ", affiliation=" 서울대 ")
+    assert (s.name, s.email, s.affiliation) == ("홍길동", "hong@example.com", "서울대")
+    with pytest.raises(ValueError):
+        Signup.from_form(" ", "a@b.co")
+    with pytest.raises(ValueError):
+        Signup.from_form("이름", "not-an-email")
+
+
+def test_same_email_is_merged(tmp_path):
+    q = SignupQueue(tmp_path / "s.sqlite3")
+    q.submit(Signup("A", "a@example.com", "first", submitted_at=1.0))
+    q.submit(Signup("B", "b@example.com", submitted_at=2.0))
+    assert q.flush(5)
+    q.submit(Signup("A2", "a@example.com", "second", submitted_at=3.0))
+    assert q.flush(5)
+    assert q.count() == 2
+    assert rows(q.path) == [("a@example.com", "A2", "second", 1.0, 3.0), ("b@example.com", "B", "", 2.0, 2.0)]
+
+
+def test_idempotency_key(tmp_path):
+    path = tmp_path / "s.sqlite3"
+    q = SignupQueue(path)
+    assert q.submit(Signup("A", "a@example.com", "v1", idempotency_key="k1"))
+    assert not q.submit(Signup("A", "a@example.com", "v2", idempotency_key="k1"))  # 더블 클릭
+    assert q.flush(5)
+    # 다른 프로세스(메모리의 최근 키 없음)가 같은 키를 다시 받아도 DB에서 걸러진다
+    other = SignupQueue(path)
+    assert other.submit(Signup("A", "a@example.com", "v3", idempotency_key="k1"))
+    assert other.flush(5)
+    assert rows(path)[0][2] == "v1"
+
+
+def test_writer_retries_failed_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(signups, "RETRY_DELAY", (0.01, 0.05))
+    q = SignupQueue(tmp_path / "s.sqlite3")
+    write, failures = q._write, []
+
+    def flaky(batch):
+        if len(failures) < 2:
+            failures.append(len(batch))
+            raise sqlite3.OperationalError("database is locked")
+        write(batch)
+
+    monkeypatch.setattr(q, "_write", flaky)
+    q.submit(Signup("A", "a@example.com"))
+    assert q.flush(5)
+    assert failures == [1, 1] and q.count() == 1
+    q.submit(Signup("B", "b@example.com"))  # 기록 스레드가 살아 있다
+    assert q.flush(5) and q.count() == 2
+
+
+def test_queue_full(tmp_path, monkeypatch):
+    monkeypatch.setattr(signups, "MAX_PENDING", 2)
+    q = SignupQueue(tmp_path / "s.sqlite3")
+    release, write = threading.Event(), q._write
+
+    def blocked(batch):
+        release.wait(5)
+        write(batch)
+
+    monkeypatch.setattr(q, "_write", blocked)
+    q.submit(Signup("A", "a@example.com"))
+    while q._queue.qsize():  # 기록 스레드가 첫 건을 가져가 막힐 때까지
+        time.sleep(0.01)
+    q.submit(Signup("B", "b@example.com"))
+    q.submit(Signup("C", "c@example.com"))
+    with pytest.raises(QueueFull):
+        q.submit(Signup("D", "d@example.com", idempotency_key="k"))
+    assert not q.flush(0.05)
+    release.set()
+    assert q.flush(5) and q.count() == 3
+    assert q.submit(Signup("D", "d@example.com", idempotency_key="k"))  # 거절된 키는 기억하지 않는다
+    assert q.flush(5) and q.count() == 4
+
+
+def test_signup_queue_is_shared(tmp_path):
+    path = tmp_path / "s.sqlite3"
+    assert signups.signup_queue(path) is signups.signup_queue(tmp_path / "." / "s.sqlite3")
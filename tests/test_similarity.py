@@ -0,0 +1,92 @@
+"""유사 국가 검색: 블록 계산(대용량 경로)과 전체 행렬의 일치, 최근접 이웃."""
+
+import numpy as np
+import pytest
+
+from conftest import dataset, shares
+from mbti import similarity
+from mbti.quality import normalized
+from mbti.similarity import METRICS, NeighbourIndex, similar
+
+
+def reference(values: np.ndarray, metric: str) -> np.ndarray:
+    """행 쌍마다 정의대로 계산한 거리 행렬."""
+    n = len(values)
+    out = np.empty((n, n))
+    for i in range(n):
+        for j in range(n):
+            p, q = values[i], values[j]
+            if metric == "cosine":
+                out[i, j] = 1 - p @ q / (np.linalg.norm(p) * np.linalg.norm(q))
+            elif metric == "euclidean":
+                out[i, j] = np.linalg.norm(p - q)
+            else:
+                m = (p + q) / 2
+                out[i, j] = np.sqrt(max((_kl(p, m) + _kl(q, m)) / 2, 0))
+    return out
+
+
+def _kl(p: np.ndarray, m: np.ndarray) -> float:
+    nz = p > 0
+    return float(np.sum(p[nz] * np.log2(p[nz] / m[nz])))
+
+
+@pytest.fixture
+def ds(rng):
+    values = shares(rng, 60)
+    values[7, :4] = 0  # 0인 칸이 있어도 젠슨-섀넌이 유한해야 한다
+    return dataset([f"C{i}" for i in range(60)], values)
+
+
+@pytest.mark.parametrize("metric", METRICS)
+def test_full_matrix_matches_definition(ds, metric):
+    index = NeighbourIndex.build(ds, metric)
+    assert index._full is not None
+    np.testing.assert_allclose(index._full, reference(normalized(ds), metric), rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize("metric", METRICS)
+def test_blocked_path_matches_full_matrix(ds, metric, monkeypatch):
+    full = NeighbourIndex.build(ds, metric)
+    monkeypatch.setattr(similarity, "FULL_MATRIX_LIMIT", 10)
+    monkeypatch.setattr(similarity, "BLOCK_ELEMENTS", 16 * 3 * 7)  # 질의 3행이면 블록당 7열
+    blocked = NeighbourIndex.build(ds, metric)
+    assert blocked._full is None
+    rows = np.array([0, 7, 59])
+    np.testing.assert_allclose(blocked.distances(rows), full._full[rows], rtol=0, atol=1e-7)
+    a, da = blocked.nearest_rows(rows, 5)
+    b, db = full.nearest_rows(rows, 5)
+    np.testing.assert_allclose(da, db, rtol=0, atol=1e-7)
+    np.testing.assert_array_equal(a, b)
+
+
+@pytest.mark.parametrize("metric", METRICS)
+def test_nearest_excludes_self(ds, metric):
+    index = NeighbourIndex.build(ds, metric)
+    idx, dist = index.nearest_rows(np.arange(len(ds)), 3)
+    assert idx.shape == (len(ds), 3)
+    assert not (idx == np.arange(len(ds))[:, None]).any()
+    assert np.all(np.diff(dist, axis=1) >= 0)
+
+
+def test_nearest_with_k_at_least_n(ds):
+    index = NeighbourIndex.build(ds, "euclidean")
+    idx, dist = index.nearest_rows(np.array([4]), 500)
+    assert idx.shape == (1, len(ds) - 1)
+    assert sorted(idx[0]) == [i for i in range(len(ds)) if i != 4]
+    assert np.isfinite(dist).all()
+    assert [c for c, _ in similar(ds, "C4", len(ds), "euclidean")] == [ds.countries[i] for i in idx[0]]
+
+
+def test_identical_rows_are_nearest(rng):
+    values = shares(rng, 10)
+    values[6] = values[2]
+    ds = dataset([f"C{i}" for i in range(10)], values)
+    for metric in METRICS:
+        country, distance = similar(ds, "C2", 1, metric)[0]
+        assert country == "C6" and distance == pytest.approx(0, abs=1e-6)
+
+
+def test_unknown_metric(ds):
+    with pytest.raises(ValueError):
+        NeighbourIndex.build(ds, "manhattan")
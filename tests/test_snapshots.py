@@ -0,0 +1,179 @@
+"""스냅샷 기록(기준판·델타) → 복원 왕복과 판 사이 비교."""
+
+import numpy as np
+import pytest
+
+from conftest import dataset, shares
+from mbti import snapshots, store
+from mbti.ranking import RankIndex, rank_index
+from mbti.snapshots import SnapshotStore, diff_matrices
+from mbti.store import TYPES
+
+
+def assert_same(store: SnapshotStore, ds) -> None:
+    countries, types, values = store.matrix(ds.version)
+    assert countries == ds.countries
+    assert types == ds.types
+    np.testing.assert_array_equal(values, np.asarray(ds.values))
+
+
+def history(rng, n=40):
+    """국가 추가·삭제, 칸 변경, 결측값이 섞인 판 네 개."""
+    countries = [f"C{i}" for i in range(n)]
+    values = shares(rng, n).astype(np.float32)
+    first = dataset(countries, values)
+
+    v2 = values.copy()
+    v2[3, 5] += 0.01
+    v2[9] = shares(rng, 1)
+    second = dataset(countries, v2)
+
+    v3 = np.vstack([v2[2:], shares(rng, 2)])
+    v3[0, 0] = np.nan
+    third = dataset(countries[2:] + ["New1", "New2"], v3)
+
+    v4 = v3.copy()
+    v4[0, 0] = 0.05
+    fourth = dataset(third.countries, v4)
+    return [first, second, third, fourth]
+
+
+def test_round_trip(tmp_path, rng):
+    editions = history(rng)
+    store = SnapshotStore(tmp_path)
+    for ds in editions:
+        assert store.commit(ds)
+    assert not store.commit(editions[-1])
+    entries = store.versions()
+    assert [v["kind"] for v in entries] == ["base", "delta", "delta", "delta"]
+    assert entries[1]["cells"] == 16 + 1
+    assert entries[3]["cells"] == 1
+
+    for ds in editions:
+        assert_same(store, ds)
+    fresh = SnapshotStore(tmp_path)  # 메모리 캐시 없이 디스크에서 복원
+    for ds in reversed(editions):
+        assert_same(fresh, ds)
+
+
+def test_base_every(tmp_path, rng, monkeypatch):
+    monkeypatch.setattr(snapshots, "BASE_EVERY", 2)
+    editions = history(rng)
+    store = SnapshotStore(tmp_path)
+    for ds in editions:
+        store.commit(ds)
+    assert [v["kind"] for v in store.versions()] == ["base", "delta", "base", "delta"]
+    for ds in editions:
+        assert_same(SnapshotStore(tmp_path), ds)
+
+
+def test_reordered_columns(tmp_path, rng):
+    first, second = history(rng)[:2]
+    values = np.asarray(second.values)[:, ::-1].copy()
+    values[0, 0] += 0.01  # 뒤집힌 열 순서에서 첫 칸 = ESFJ
+    reordered = dataset(second.countries, values, TYPES[::-1])
+    store = SnapshotStore(tmp_path)
+    for ds in (first, second, reordered):
+        store.commit(ds)
+    assert store.versions()[-1]["kind"] == "base"
+    assert_same(SnapshotStore(tmp_path), reordered)
+
+    diff = store.diff(second.version, reordered.version)
+    assert len(diff) == 1
+    assert diff.by_country("C0") == {"ESFJ": pytest.approx((second.values[0, -1], values[0, 0]))}
+
+
+def test_diff(tmp_path, rng):
+    editions = history(rng)
+    store = SnapshotStore(tmp_path)
+    for ds in editions:
+        store.commit(ds)
+    first, second, third, fourth = (ds.version for ds in editions)
+    assert len(store.diff(first, first)) == 0
+    d = store.diff(first, second)
+    assert d.added == d.removed == ()
+    assert len(d) == 17
+    assert set(d.changed_countries) == {"C3", "C9"}
+    assert np.all(np.diff(np.abs(d.new - d.old)) <= 0)
+
+    d = store.diff(second, third)
+    assert d.added == ("New1", "New2")
+    assert d.removed == ("C0", "C1")
+    assert list(d.countries) == ["C2"] and list(d.types) == ["INFJ"]  # NaN은 바뀐 칸
+    assert np.isnan(d.new[0])
+
+    d = store.diff(third, fourth)
+    assert len(d) == 1 and d.new[0] == np.float32(0.05)
+    assert store.resolve(fourth[:10]) == fourth
+    with pytest.raises(KeyError):
+        store.resolve("zz")
+
+
+def test_diff_matrices_aligns_by_name():
+    values = np.array([[0.1, 0.2], [0.3, 0.4]])
+    d = diff_matrices("a", "b", ("X", "Y"), ("INFJ", "ENTP"), values, ("Y", "X"), ("ENTP", "INFJ"), values[::-1, ::-1])
+    assert len(d) == 0
+
+
+def test_dataset_rebases_derived_tables(tmp_path, rng):
+    editions = history(rng)
+    store = SnapshotStore(tmp_path)
+    for ds in editions:
+        store.commit(ds)
+    opened = store.dataset(editions[0].version)
+    rank_index(opened)
+    following = store.dataset(editions[1].version)
+    assert "ranking" in following._derived
+    np.testing.assert_array_equal(rank_index(following).order, RankIndex.build(following).order)
+    assert store.dataset(editions[1].version) is following
+
+
+def test_adopted_dataset_is_reused_and_rebased_from(tmp_path, rng, monkeypatch):
+    editions = history(rng)
+    store = SnapshotStore(tmp_path)
+    for ds in editions:
+        store.commit(ds)
+    live = editions[-1]
+    rank_index(live)
+    store.adopt(live)
+    assert store.dataset(live.version) is live  # 현재 판을 두 번 만들지 않는다
+    monkeypatch.setattr(RankIndex, "build", classmethod(lambda cls, ds: pytest.fail("처음부터 다시 계산함")))
+    previous = store.dataset(editions[-2].version)
+    assert "ranking" in previous._derived
+
+
+def test_store_load_records_previous_and_new_edition(tmp_path, rng):
+    csv = tmp_path / "mbti.csv"
+    header = "Country," + ",".join(TYPES) + "\n"
+
+    def write(values):
+        csv.write_text(header + "".join(f"C{i}," + ",".join(map(str, v)) + "\n" for i, v in enumerate(values)))
+
+    values = shares(rng, 5)
+    write(values)
+    first = store.load(csv)
+    rank_index(first)
+    snaps = snapshots.snapshots(csv)
+    assert snaps.versions() == []  # 처음 연 판만으로는 기록하지 않는다
+
+    values[2] = shares(rng, 1)
+    write(values)
+    second = store.load(csv)
+    assert [v["version"] for v in snaps.versions()] == [first.version, second.version]
+    assert snaps.dataset(first.version) is first and snaps.dataset(second.version) is second
+    assert snaps.diff(first.version, second.version).changed_countries == ["C2"]
+    assert "ranking" in second._derived  # 이어받기도 그대로
+
+
+def test_recording_failure_does_not_break_load(tmp_path, rng, monkeypatch, caplog):
+    def read_only(self, ds):
+        raise OSError("read-only")
+
+    monkeypatch.setattr(SnapshotStore, "commit", read_only)
+    old, new = dataset(["A"], shares(rng, 1)), dataset(["A"], shares(rng, 1))
+    snapshots.on_new_edition(tmp_path / "mbti.csv", old, new)
+    assert "스냅샷을 기록하지 못했습니다" in caplog.text
+
+    monkeypatch.setattr(snapshots, "AUTO_RECORD", False)
+    monkeypatch.setattr(SnapshotStore, "commit", lambda self, ds: pytest.fail("기록하면 안 됨"))
+    snapshots.on_new_edition(tmp_path / "mbti.csv", old, new)
@@ -0,0 +1,90 @@
+"""몬테카를로 순위 안정성: 워커 수와 무관한 재현성, 매개변수 검증, 잠금 범위."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from conftest import dataset, shares
+from mbti import stability as stability_module
+from mbti.ranking import rank_index
+from mbti.stability import CHUNK_SIZE, StabilityParams, compute, rank_cdf, stability
+
+
+@pytest.fixture
+def ds(rng):
+    return dataset([f"C{i}" for i in range(25)], shares(rng, 25))
+
+
+@pytest.mark.parametrize("method", ["dirichlet", "multinomial"])
+def test_same_result_for_any_worker_count(ds, method):
+    params = StabilityParams(n_samples=3 * CHUNK_SIZE + 17, pseudo_size=300, method=method, seed=7)
+    serial = rank_cdf(ds, params, workers=1)
+    for workers in (2, 3):
+        np.testing.assert_array_equal(rank_cdf(ds, params, workers=workers), serial)
+
+
+def test_summary(ds):
+    result = compute(ds, StabilityParams(n_samples=400, top_k=5), workers=1)
+    assert result.lower.shape == result.median.shape == result.upper.shape == (len(ds), len(ds.types))
+    assert (result.lower >= 1).all() and (result.upper <= len(ds)).all()
+    assert (result.lower <= result.median).all() and (result.median <= result.upper).all()
+    np.testing.assert_allclose(result.p_top_k.sum(axis=0), 5, rtol=0, atol=1e-9)
+
+
+def test_top_k_and_level_reuse_cached_cdf(ds, monkeypatch):
+    stability(ds, StabilityParams(n_samples=300, top_k=3), workers=1)
+    monkeypatch.setattr(stability_module, "rank_cdf", lambda *a, **kw: pytest.fail("다시 재표집함"))
+    result = stability(ds, StabilityParams(n_samples=300, top_k=8, level=0.8), workers=1)
+    np.testing.assert_allclose(result.p_top_k.sum(axis=0), 8, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"n_samples": 0},
+        {"pseudo_size": 0},
+        {"pseudo_size": -5},
+        {"top_k": 0},
+        {"level": 0.0},
+        {"level": 1.0},
+        {"level": 1.5},
+        {"method": "bootstrap"},
+    ],
+)
+def test_invalid_params(kwargs):
+    with pytest.raises(ValueError):
+        StabilityParams(**kwargs)
+
+
+def test_build_does_not_block_other_derived_tables(ds, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_cdf(dataset, params, workers=None):
+        started.set()
+        assert release.wait(5)
+        return np.zeros((len(dataset.types), len(dataset), len(dataset)))
+
+    monkeypatch.setattr(stability_module, "rank_cdf", slow_cdf)
+    thread = threading.Thread(target=stability, args=(ds, StabilityParams(n_samples=10)))
+    thread.start()
+    try:
+        assert started.wait(5)
+        done = threading.Event()
+        builder = threading.Thread(target=lambda: (rank_index(ds), done.set()))
+        builder.start()
+        assert done.wait(5), "재표집 중에 다른 파생 테이블을 만들지 못함"
+        builder.join()
+    finally:
+        release.set()
+        thread.join(5)
+
+
+@pytest.mark.parametrize("method", ["dirichlet", "multinomial"])
+def test_ties_do_not_favour_earlier_rows(method):
+    n, k = 60, 6
+    ds = dataset([f"C{i}" for i in range(n)], np.full((n, 16), 1 / 16))
+    result = compute(ds, StabilityParams(n_samples=2000, pseudo_size=30, method=method, top_k=k), workers=1)
+    head, tail = result.p_top_k[:15].mean(), result.p_top_k[-15:].mean()
+    assert head == pytest.approx(k / n, abs=0.01)
+    assert tail == pytest.approx(k / n, abs=0.01)
@@ -0,0 +1,90 @@
+"""CSV → 사이드카(.npy + .json) 컴파일과 재빌드 조건."""
+
+import os
+
+import numpy as np
+import pytest
+
+from mbti import store
+from mbti.store import TYPES
+
+HEADER = "Country," + ",".join(TYPES) + "\n"
+
+
+def write_csv(path, rows) -> None:
+    path.write_text(HEADER + "".join(f"{c}," + ",".join(map(str, v)) + "\n" for c, v in rows), encoding="utf-8")
+
+
+def bump_mtime(path, seconds=10) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "mbti.csv"
+    write_csv(path, [("Korea", [1 / 16] * 16), ("Japan", [0.125] * 8 + [0.0] * 8)])
+    return path
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    parse = store.parse_csv
+
+    def counting(path):
+        calls.append(path)
+        return parse(path)
+
+    monkeypatch.setattr(store, "parse_csv", counting)
+    return calls
+
+
+def test_compiles_sidecar(csv_path, parses):
+    dataset = store.load(csv_path)
+    npy_path, meta_path = store._sidecar_paths(csv_path)
+    assert npy_path.exists() and meta_path.exists()
+    assert len(parses) == 1
+    assert dataset.countries == ("Korea", "Japan")
+    assert dataset.types == TYPES
+    assert isinstance(dataset.values, np.memmap)
+    np.testing.assert_allclose(dataset.values[1, :8], 0.125)
+
+
+def test_warm_load_returns_same_object(csv_path, parses):
+    first = store.load(csv_path)
+    assert store.load(csv_path) is first
+    assert len(parses) == 1
+
+
+def test_touch_with_same_content_does_not_reparse(csv_path, parses):
+    first = store.load(csv_path)
+    bump_mtime(csv_path)
+    again = store.load(csv_path)
+    assert len(parses) == 1
+    assert again is first
+    # 새 mtime이 메타에 기록되어 다음 프로세스도 해시를 다시 계산하지 않는다
+    store._loaded.pop(csv_path.resolve())
+    assert store._fresh_meta(csv_path)["mtime_ns"] == csv_path.stat().st_mtime_ns
+    assert len(parses) == 1
+
+
+def test_content_change_recompiles(csv_path, parses):
+    first = store.load(csv_path)
+    write_csv(csv_path, [("Korea", [1 / 16] * 16), ("France", [0.0] * 8 + [0.125] * 8)])
+    bump_mtime(csv_path)
+    second = store.load(csv_path)
+    assert len(parses) == 2
+    assert second is not first
+    assert second.version != first.version
+    assert second.countries == ("Korea", "France")
+    np.testing.assert_allclose(second.values[1, 8:], 0.125)
+
+
+def test_stale_sidecar_format_recompiles(csv_path, parses):
+    store.load(csv_path)
+    _, meta_path = store._sidecar_paths(csv_path)
+    meta_path.write_text('{"format": 0}', encoding="utf-8")
+    store._loaded.clear()
+    assert store.load(csv_path).countries == ("Korea", "Japan")
+    assert len(parses) == 2